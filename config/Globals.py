@@ -14,6 +14,7 @@ class GLOBALVARS:
     DIR_RESOURCES = PROJ_ROOT + "/resources"
     DIR_DATA = DIR_RESOURCES + "/data"
     DIR_CONFIG = PROJ_ROOT + "/config"
+    DIR_AVATAR_CACHE = DIR_DATA + "/avatars"
 
     FILE_CONFIG_GENERAL = DIR_CONFIG + "/config.json"
     FILE_CONFIG_BINGLETS = DIR_CONFIG + "/binglets.json"
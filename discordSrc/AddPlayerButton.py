@@ -8,6 +8,7 @@ __email__ = "--"
 
 import discord
 
+from .IAsyncDiscordGame import IAsyncDiscordGame
 from .IContentItem import IContentItem
 
 from config.ClassLogger import ClassLogger, LogLevel
@@ -36,6 +37,10 @@ class AddPlayerButton(View, IContentItem):
         self.gameID = gameID
         self.confirmMsgIDs: Dict[UserID, int] = dict()
 
+        # Confirmed joins are added in batches, the joins confirmed while a batch is being added go in the next one
+        self.pendingJoins: Dict[UserID, discord.Interaction] = dict()
+        self.addingJoins = False
+
         button = Button(
             label=AddPlayerButton.__btn_label,
             style=discord.ButtonStyle.primary,
@@ -97,9 +102,20 @@ class AddPlayerButton(View, IContentItem):
             message = await channel.fetch_message(messageID)
             await message.delete()
 
+        self.pendingJoins[interaction.user.id] = interaction
+        if not self.addingJoins:
+            self._addPendingJoins()
+
+    def _addPendingJoins(self):
+        interactions = list(self.pendingJoins.values())
+        self.pendingJoins.clear()
+
         game = GameStore().getGame(self.gameID)
-        if game:
-            _ = game.addPlayer(ActionData(interaction=interaction))
+        self.addingJoins = bool(game and interactions)
+        if self.addingJoins:
+            AddPlayerButton.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Adding a batch of {len(interactions)} confirmed players.")
+            data = ActionData(interactions=interactions, **{ActionData.FINALIZE_FUNCT: self._addPendingJoins})
+            _ = cast(IAsyncDiscordGame, game).addPlayers(data)
 
     def _getGreeting(self, user: discord.User) -> str:
         return f"Greetings {user.display_name}!\n" +\
@@ -202,7 +202,7 @@ class AdminCommandHandler(ICommandHandler):
         # Slot requests
         text += "\n\nSlot requests (with num requested): "
         reqNames = []
-        for req in iface.game.requestedCalls:
+        for req in iface.game.getRequests():
             reqNames.append(f"{req.requestBing.bingStr}({len(req.players)})")
         if reqNames:
             text += ", ".join(reqNames)
@@ -0,0 +1,142 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import aiohttp
+import discord
+import os
+import time
+
+from PIL import Image
+from collections import OrderedDict
+from config.ClassLogger import ClassLogger, LogLevel
+from config.Config import Config
+from config.Globals import GLOBALVARS
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Tuple
+
+AvatarKey = Tuple[int, str, int]
+
+class AvatarCache:
+    """
+    Cache of the decoded and resized player avatars, kept in memory (LRU) and on disk.
+    Avatars are keyed by the user ID, avatar hash and size, so a changed avatar is fetched again,
+    and all the avatar downloads share one HTTP session.
+    """
+    __instance = None
+    __LOGGER = ClassLogger(__name__)
+
+    __CDN_SIZE_MIN = 16
+    __CDN_SIZE_MAX = 4096
+
+    def __new__(cls, *args, **kwargs):
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.__initialized = False
+        return cls.__instance
+
+    def __init__(self):
+        # Init guard
+        if self.__initialized:
+            return
+        self.__initialized = True
+
+        self.maxEntries: int = Config().getConfig("AvatarCacheSize", 64)
+        self.ttl: float = Config().getConfig("AvatarCacheTTL", 86400)
+        self.cacheDir = Path(GLOBALVARS.DIR_AVATAR_CACHE)
+
+        self.entries: OrderedDict[AvatarKey, Tuple[float, Image.Image]] = OrderedDict()
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def getAvatar(self, user: discord.abc.User, avatarSize: int) -> Optional[Image.Image]:
+        asset = user.display_avatar
+        key: AvatarKey = (user.id, asset.key, avatarSize)
+        now = time.time()
+
+        # Memory cache
+        entry = self.entries.get(key)
+        if entry and entry[0] > now:
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        # Disk cache
+        avatar = self._readDiskAvatar(key, now)
+
+        # Download the avatar, in the smallest CDN size that isn't smaller than the avatar size
+        if not avatar:
+            data = await self._downloadAvatar(asset.with_size(self._getCDNSize(avatarSize)).url)
+            if data:
+                avatar = Image.open(BytesIO(data)).convert("RGBA").resize((avatarSize, avatarSize))
+                self._writeDiskAvatar(key, avatar)
+
+        if avatar:
+            self.entries[key] = (now + self.ttl, avatar)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxEntries:
+                self.entries.popitem(last=False)
+
+        return avatar
+
+    async def close(self):
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _downloadAvatar(self, url: str) -> Optional[bytes]:
+        if not self.session or self.session.closed:
+            self.session = aiohttp.ClientSession()
+
+        data = None
+        try:
+            async with self.session.get(url) as response:
+                if response.status == 200:
+                    data = await response.read()
+                else:
+                    AvatarCache.__LOGGER.log(LogLevel.LEVEL_WARN, f"Avatar download failed with status {response.status}: {url}")
+        except aiohttp.ClientError as e:
+            AvatarCache.__LOGGER.log(LogLevel.LEVEL_WARN, f"Avatar download failed: {e}")
+
+        return data
+
+    def _readDiskAvatar(self, key: AvatarKey, now: float) -> Optional[Image.Image]:
+        avatar = None
+        path = self._getDiskPath(key)
+        try:
+            if path.stat().st_mtime + self.ttl > now:
+                with Image.open(path) as image:
+                    avatar = image.convert("RGBA")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            AvatarCache.__LOGGER.log(LogLevel.LEVEL_WARN, f"Could not read the cached avatar \"{path}\": {e}")
+
+        return avatar
+
+    def _writeDiskAvatar(self, key: AvatarKey, avatar: Image.Image):
+        path = self._getDiskPath(key)
+        try:
+            self.cacheDir.mkdir(parents=True, exist_ok=True)
+
+            # Drop the users previous avatars of this size
+            for oldPath in self.cacheDir.glob(f"{key[0]}_*_{key[2]}.png"):
+                if oldPath != path:
+                    os.remove(oldPath)
+
+            avatar.save(path, "PNG")
+        except OSError as e:
+            AvatarCache.__LOGGER.log(LogLevel.LEVEL_WARN, f"Could not cache the avatar \"{path}\": {e}")
+
+    def _getDiskPath(self, key: AvatarKey) -> Path:
+        return self.cacheDir / f"{key[0]}_{key[1]}_{key[2]}.png"
+
+    def _getCDNSize(self, avatarSize: int) -> int:
+        # The CDN only serves power of two sizes
+        size = AvatarCache.__CDN_SIZE_MIN
+        while size < avatarSize and size < AvatarCache.__CDN_SIZE_MAX:
+            size *= 2
+        return size
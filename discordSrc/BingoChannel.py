@@ -16,8 +16,6 @@ from .LeaderboardCreator import LeaderboardCreator
 
 from config.Config import Config
 from config.Globals import GLOBALVARS
-from io import BytesIO
-from typing import Optional
 
 class BingoChannel(IChannelInterface):
     __MSG_ADD_PLAYER = "addplayer"
@@ -26,9 +24,6 @@ class BingoChannel(IChannelInterface):
 
     def __init__(self, bot: discord.Client, guild: GameGuild):
         super().__init__(guild.channelBingo)
-        self.cachedLeaderboard: Optional[bytes] = None
-        self.cachedFilename = ""
-
         self.leaderboard = LeaderboardCreator(bot, guild.persistentStats)
         self.gameStatus = GameStatusEmbed(guild.guildID)
         self.addPlayer = AddPlayerButton(guild.guildID)
@@ -37,7 +32,7 @@ class BingoChannel(IChannelInterface):
     async def setViewIdle(self):
         botInfo = self.getFormattedBotInfo(Config().getBotVersion())
         await self._purgeChannel()
-        await self._channel.send(botInfo, file=await self._getLeaderBoardFile(True))
+        await self._channel.send(botInfo, file=await self._getLeaderBoardFile())
 
     @verifyView(ChannelView.NEW)
     async def setViewNew(self):
@@ -80,15 +75,5 @@ class BingoChannel(IChannelInterface):
             kwargs['view'] = self.addPlayer
         await super().sendNoticeItem(**kwargs)
 
-    async def _getLeaderBoardFile(self, forceRefresh: bool = False) -> discord.File:
-        if self.cachedLeaderboard and not forceRefresh:
-            fileLeaderBoard = discord.File(BytesIO(self.cachedLeaderboard), filename=self.cachedFilename)
-        else:
-            fileLeaderBoard = await self.leaderboard.createAsset()
-            fileLeaderBoard.fp.seek(0)
-            self.cachedLeaderboard = fileLeaderBoard.fp.read()
-            self.cachedFilename = fileLeaderBoard.filename
-            fileLeaderBoard.fp.seek(0)
-
-        return fileLeaderBoard
-
+    async def _getLeaderBoardFile(self) -> discord.File:
+        return await self.leaderboard.getLeaderboard()
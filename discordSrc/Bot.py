@@ -10,12 +10,14 @@ import discord
 
 from .AdminCommandHandler import AdminCommandHandler
 from .AdminChannel import AdminChannel
+from .AvatarCache import AvatarCache
 from .BingoChannel import BingoChannel
 from .DebugCommandHandler import DebugCommandHandler
 from .GameControllerDiscord import GameControllerDiscord
 from .GameGuild import GameGuild
 from .ICommandHandler import ICommandHandler
 from .PlayerCommandHandler import PlayerCommandHandler
+from .RenderService import RenderService
 
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
@@ -23,10 +25,12 @@ from config.Globals import GLOBALVARS
 
 from discord.client import Client
 
+from game.GameDB import GameDB
 from game.GameStore import GameStore
 from game.IGameInterface import IGameInterface
 from game.PersistentStats import PersistentStats
-from game.Recovery import Recovery
+from game.RecoveryFactory import createRecovery
+from game.RecoveryWriter import RecoveryWriter
 
 from typing import Optional, cast
 
@@ -73,6 +77,12 @@ class Bot(Client):
         for guildID in self.gameGuilds:
             GameStore().removeGame(guildID)
         self.gameGuilds.clear()
+
+        # Commit the queued recovery updates before the DB is closed
+        RecoveryWriter.shutdown()
+        GameDB().close()
+        await AvatarCache().close()
+        RenderService().shutdown()
         await self.close()
 
     async def setup_hook(self):
@@ -109,7 +119,7 @@ class Bot(Client):
         gameController = GameStore().getController()
         if self.hasRecovery and self.recovery and gameController:
             Bot.__LOGGER.log(LogLevel.LEVEL_WARN, f"Game recovery found for server ID {self.recovery.gameID}, starting game recovery...")
-            result = await gameController.startGameFromRecovery(self.recovery.gameID)
+            result = await gameController.startGameFromRecovery(self.recovery.getGameID())
 
             # If for whatever reason we couldn't successfully set up the recovery, restart without the setup without the recovery
             if not result:
@@ -130,7 +140,7 @@ class Bot(Client):
 
         Bot.__LOGGER.log(LogLevel.LEVEL_INFO, f"Initializing guild: {guild.name}")
         persistentStats = PersistentStats(guild.id)
-        self.recovery = Recovery(guild.id)
+        self.recovery = createRecovery(guild.id)
         self.hasRecovery = self.recovery.hasRecovery()
 
         # If there is a game already in progress, ignore recovery. (This shouldn't ever happen)
@@ -214,7 +224,7 @@ class Bot(Client):
         if activeGame:
             Bot.__LOGGER.log(LogLevel.LEVEL_WARN, f"Force shutting down active game for guild \"{guild.name}\"...")
             activeGame.destroy()
-            Recovery(guild.id).removeRecovery()
+            createRecovery(guild.id).removeRecovery()
 
         if gg:
             Bot.__LOGGER.log(LogLevel.LEVEL_WARN, f"Guild \"{guild.name}\" has been removed.")
@@ -10,7 +10,9 @@ import aiohttp
 import discord
 import json
 
+from .IAsyncDiscordGame import IAsyncDiscordGame
 from .ICommandHandler import ICommandHandler
+from .RenderService import RenderService
 
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
@@ -28,7 +30,7 @@ from game.Player import Player
 from PIL import Image
 from io import BytesIO
 from unittest.mock import AsyncMock, MagicMock
-from typing import Optional
+from typing import List, Optional, Tuple, cast
 
 class DebugCommandHandler(ICommandHandler):
     __LOGGER = ClassLogger(__name__)
@@ -105,12 +107,17 @@ class DebugCommandHandler(ICommandHandler):
         if not game:
             return
 
-        # Add mock players to game
+        # Add mock players to game as a single batch
         await interaction.response.send_message("Adding bulk players to the game.", ephemeral=True)
-        for player in mockPlayers:
+        interactions: List[discord.Interaction] = []
+        mockChannels: List[discord.DMChannel] = []
+        for player in mockPlayers + ["Pikachu"]:
             mockInter = self._makeMockInteraction(interaction)
-            self._addPlayerIntrnl(game, mockInter, player, False)
-        self._addPlayerIntrnl(game, self._makeMockInteraction(interaction), "Pikachu", True)
+            mockInter.user, mockChannel = self._makeMockUser(player)
+            interactions.append(mockInter)
+            mockChannels.append(mockChannel)
+
+        _ = cast(IAsyncDiscordGame, game).addPlayers(ActionData(interactions=interactions, mockDMChannels=mockChannels))
 
     @discord.app_commands.describe(player_name="Mock player name to add to the game")
     @discord.app_commands.checks.has_role(Config().getConfig("GameMasterRole"))
@@ -130,7 +137,7 @@ class DebugCommandHandler(ICommandHandler):
 
         # Add mock player to the game
         await interaction.response.send_message(f"Mock user \"{player_name}\" as been added to the game.", ephemeral=True)
-        self._addPlayerIntrnl(game, interaction, player_name, True)
+        self._addPlayerIntrnl(game, interaction, player_name)
 
     @discord.app_commands.describe(player_name="Mock player to make request for")
     @discord.app_commands.describe(bing_id="Bing ID of the slot to request")
@@ -180,7 +187,7 @@ class DebugCommandHandler(ICommandHandler):
 
         # Create graphical board
         filename = f"board_{player.userID}.png"
-        file = discord.File(CardImgCreator().createGraphicalCard(player.card), filename)
+        file = discord.File(await RenderService().render(CardImgCreator().renderGraphicalCard, player.card.getCellsStr(), player.card.markedMask), filename)
 
         await interaction.followup.send(f"Board slots for player {player.card.getCardOwner()}:\n " + ",  ".join(slots), file=file, ephemeral=True)
 
@@ -232,7 +239,12 @@ class DebugCommandHandler(ICommandHandler):
 
         return mockInter
 
-    def _addPlayerIntrnl(self, game: IGameInterface, interaction: discord.Interaction, player: str, refresh: bool):
+    def _addPlayerIntrnl(self, game: IGameInterface, interaction: discord.Interaction, player: str):
+        # Add mock player to the running game
+        interaction.user, mockChannel = self._makeMockUser(player)
+        _ = game.addPlayer(ActionData(interaction=interaction, mockDMChannel=mockChannel))
+
+    def _makeMockUser(self, player: str) -> Tuple[discord.User, discord.DMChannel]:
         # Create the mock user
         mockUser = MagicMock(spec=discord.User)
         mockUser.id = DebugCommandHandler.__DEBUG_ID_COUNTER
@@ -248,8 +260,6 @@ class DebugCommandHandler(ICommandHandler):
         mockChannel.recipient = mockUser
         mockChannel.type = discord.ChannelType.private
 
-        # Add mock player to the running game
-        interaction.user = mockUser
-        _ = game.addPlayer(ActionData(interaction=interaction, mockDMChannel=mockChannel, refresh=refresh))
         DebugCommandHandler.__DEBUG_ID_COUNTER -= 1
+        return mockUser, mockChannel
 
@@ -17,7 +17,7 @@ from config.Globals import GLOBALVARS
 
 from game.GameStore import GameStore
 from game.IGameController import IGameController
-from game.Recovery import Recovery
+from game.RecoveryFactory import createRecovery
 from game.Result import Result
 from game.Sync import sync_aware
 
@@ -127,7 +127,7 @@ class GameControllerDiscord(IGameController):
         elif isinstance(game, IAsyncDiscordGame):
             await game.destroy()
             store.removeGame(guildID)
-            Recovery(guildID).removeRecovery()
+            createRecovery(guildID).removeRecovery()
             ret.result = True
             ret.responseMsg = f"Bingo game stopped."
 
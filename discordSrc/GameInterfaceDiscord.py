@@ -33,11 +33,11 @@ from game.CallRequest import CallRequest
 from game.Game import Game, GameState
 from game.NotificationMessageMaker import MakePlayersBingoNotif, MakePlayersCallNotif
 from game.Player import Player
-from game.Recovery import Recovery
+from game.RecoveryFactory import createRecovery
 from game.Result import Result
 from game.Sync import sync_aware
 
-from typing import Optional, Set, cast
+from typing import List, Optional, Set, cast
 
 from youtube.GameInterfaceYoutube import GameInterfaceYoutube
 from unittest.mock import AsyncMock, MagicMock
@@ -55,7 +55,7 @@ class GameInterfaceDiscord(IAsyncDiscordGame):
         self.YTiface: Optional[GameInterfaceYoutube] = None
         self.channelAdmin = None
         self.channelBingo = None
-        self.recovery = Recovery(self.gameGuild.guildID)
+        self.recovery = createRecovery(self.gameGuild.guildID)
 
         self.game.setRecovery(self.recovery)
 
@@ -138,7 +138,7 @@ class GameInterfaceDiscord(IAsyncDiscordGame):
 
         # Add any pending call requests
         if ret.result:
-            for req in game.requestedCalls:
+            for req in game.getRequests():
                 await self.channelAdmin.addCallRequest(req)
 
         self.initialized = ret.result
@@ -377,22 +377,11 @@ class GameInterfaceDiscord(IAsyncDiscordGame):
             GameInterfaceDiscord.__LOGGER.log(LogLevel.LEVEL_ERROR, "Internal error! Was expecting a play in additionals.")
             ret.result = False
         elif ret.result:
-            player = cast(Player, ret.additional)
-
-            if user.dm_channel:
-                dmChannel = UserDMChannel(self.gameGuild.guildID, user.dm_channel, player)
-            else:
-                mockChannel: discord.DMChannel = data.get("mockDMChannel")
-                dmChannel = MockUserDMChannel(mockChannel, player)
-
-            player.ctx = dmChannel
-            await dmChannel.setViewStarted()
+            mockChannel = None if user.dm_channel else data.get("mockDMChannel")
+            await self._startPlayerDM(cast(Player, ret.additional), user, mockChannel)
 
         # Update the bingo channel game status embed
-        # Note: The 'refresh' attr is not normally used except for the bulk add debug command,
-        #       which sets it to false so the bingo channel isn't spammed
-        refresh = data.get("refresh") if data.has("refresh") else True
-        if ret.result and refresh and self.channelBingo:
+        if ret.result and self.channelBingo:
             await self.channelBingo.refreshGameStatus()
 
         if ret.result and self.YTiface:
@@ -409,6 +398,69 @@ class GameInterfaceDiscord(IAsyncDiscordGame):
         self.finalizeAction(data)
         return ret
 
+    @sync_aware
+    async def addPlayers(self, data: ActionData) -> Result:
+        self.taskProcessor.pause()
+        async with self.lock:
+            ret = await self._addPlayers(data)
+        self.taskProcessor.resume()
+        return ret
+
+    async def _addPlayers(self, data: ActionData) -> Result:
+        """
+        Admits a batch of users with one game update, one recovery update and one game status refresh.
+        Expects a list of "interactions", and optionally a matching list of "mockDMChannels" for users without a DM channel
+        """
+        interactions: List[discord.Interaction] = data.get("interactions")
+        mockChannels: List[Optional[discord.DMChannel]] = data.get("mockDMChannels") if data.has("mockDMChannels") else [None] * len(interactions)
+        GameInterfaceDiscord.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Attempting to add {len(interactions)} players...")
+        ret = Result(False)
+
+        # Verify initialized
+        if not self.initialized:
+            ret.responseMsg = "Discord interface not initialized, cannot add players."
+            GameInterfaceDiscord.__LOGGER.log(LogLevel.LEVEL_ERROR, ret.responseMsg)
+            self.finalizeAction(data)
+            return ret
+
+        # Users need a DM channel to receive their card, unless running in debug mode
+        users = [interaction.user for interaction in interactions]
+        results: List[Result] = []
+        admitUsers = []
+        for user in users:
+            if not user.dm_channel and not self.debugMode:
+                results.append(Result(False, f"Interaction issued with an empty DM channel, cannot add player {user.display_name} ({user.id})."))
+            else:
+                results.append(Result(False))
+                admitUsers.append((len(results) - 1, user))
+
+        if admitUsers:
+            ret = self.game.addPlayers([(user.display_name, user.id) for _, user in admitUsers])
+            for (idx, _), result in zip(admitUsers, ret.additional):
+                results[idx] = result
+
+        numAdded = sum(1 for result in results if result.result)
+        ret = Result(numAdded > 0, f"{numAdded} of {len(users)} players have been added to the game.", results)
+
+        # Set the DM view of every admitted player
+        for user, mockChannel, result in zip(users, mockChannels, results):
+            if result.result:
+                await self._startPlayerDM(cast(Player, result.additional), user, mockChannel)
+                if self.YTiface:
+                    self.YTiface.addPlayer(ActionData(displayName=user.display_name))
+            else:
+                GameInterfaceDiscord.__LOGGER.log(LogLevel.LEVEL_ERROR, result.responseMsg)
+                if user.dm_channel:
+                    await user.dm_channel.send(result.responseMsg)
+
+        # Update the bingo channel game status embed, once for the whole batch
+        if ret.result and self.channelBingo:
+            await self.channelBingo.refreshGameStatus()
+
+        GameInterfaceDiscord.__LOGGER.log(LogLevel.LEVEL_DEBUG, ret.responseMsg)
+        self.finalizeAction(data)
+        return ret
+
     @sync_aware
     async def kickPlayer(self, data: ActionData) -> Result:
         self.taskProcessor.pause()
@@ -559,7 +611,7 @@ class GameInterfaceDiscord(IAsyncDiscordGame):
 
         ret = self.game.requestCallCasual(callRequest)
 
-        # Update the players board
+        # Update the players board, a bingo made by the mark is announced along with the next call
         if ret.result:
             player: Player = ret.additional
             notifStr = f"[Slot marked] {callRequest.requestBing.bingStr}"
@@ -681,6 +733,15 @@ class GameInterfaceDiscord(IAsyncDiscordGame):
         if msg:
             await cast(discord.WebhookMessage, msg).delete()
 
+    async def _startPlayerDM(self, player: Player, user: discord.User | discord.Member, mockChannel: Optional[discord.DMChannel]):
+        if user.dm_channel:
+            dmChannel = UserDMChannel(self.gameGuild.guildID, user.dm_channel, player)
+        else:
+            dmChannel = MockUserDMChannel(cast(discord.DMChannel, mockChannel), player)
+
+        player.ctx = dmChannel
+        await dmChannel.setViewStarted()
+
     def finalizeAction(self, data: ActionData):
         finalize = None
 
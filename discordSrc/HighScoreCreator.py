@@ -9,12 +9,15 @@ __email__ = "--"
 import discord
 
 from .IDiscordGraphical import IDiscordGraphical
+from .RenderCache import RenderCache
+from .RenderService import RenderService
 
 from PIL import Image, ImageDraw
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
 from config.Globals import GLOBALVARS
-from game.PersistentStats import PersistentStats, CanonicalCType
+from game.PersistentStats import PersistentStats, PlayerSnapshot, CanonicalCType
+from typing import List
 
 class HighScoreCreator(IDiscordGraphical):
     __LOGGER = ClassLogger(__name__)
@@ -60,8 +63,14 @@ class HighScoreCreator(IDiscordGraphical):
         self.cType = ""
 
     async def createLeaderboard(self, cType: str) -> discord.File:
+        if cType != PersistentStats.ITEM_TOTAL\
+            and cType != PersistentStats.ITEM_MONTH\
+            and cType != PersistentStats.ITEM_WEEK:
+                cType = PersistentStats.ITEM_TOTAL
+
         self.cType = cType
-        return await self.createAsset()
+        return await RenderCache().getAsset((self.globalStats.guildID, "highscores", cType),
+                                            self.globalStats.getLeadersVersion(cType), self.createAsset)
 
     async def createAsset(self) -> discord.File:
         HighScoreCreator.__LOGGER.log(LogLevel.LEVEL_DEBUG, "Creating high scores graphic")
@@ -71,12 +80,17 @@ class HighScoreCreator(IDiscordGraphical):
             and self.cType != PersistentStats.ITEM_WEEK:
                 self.cType = PersistentStats.ITEM_TOTAL
 
+        # Gather the leaders on the event loop, the drawing is done by the render workers
+        leaders = [playerOrd.snapshot() for playerOrd in self.globalStats.getTopPlayers(PersistentStats.NUM_SHOWN_LEADERS, self.cType)]
+        return await RenderService().render(self._renderHighScores, leaders, self.cType)
+
+    def _renderHighScores(self, leaders: List[PlayerSnapshot], cType: str) -> discord.File:
         highScoreGraphic = Image.open(GLOBALVARS.IMAGE_HIGH_SCORES).convert("RGBA")
         draw = ImageDraw.Draw(highScoreGraphic)
 
         # Draw the high scores title
         sn = Config().getConfig("StreamerName")
-        title = f"{CanonicalCType(self.cType)}\n\
+        title = f"{CanonicalCType(cType)}\n\
 {sn} Livestream Bingo\nHigh Scores"
         self._drawTitleName(draw, title, self.fontName,
                             fontSize=(HighScoreCreator.__FONT_SIZE_TITLE, HighScoreCreator.__FONT_SIZE_TITLE),
@@ -94,7 +108,7 @@ class HighScoreCreator(IDiscordGraphical):
         draw.multiline_text((HighScoreCreator.__XPOS_NUMS, HighScoreCreator.__YPOS_NUMS),
                             nums, fill=(0, 0, 0, 255), font=font, align="center", spacing=HighScoreCreator.__SPACING_NUMS)
 
-        self._drawRanks(draw)
+        self._drawRanks(draw, leaders, cType)
         self._drawBonusInfo(draw)
 
         return self._convertFile(highScoreGraphic, "highscores.png")
@@ -121,7 +135,7 @@ class HighScoreCreator(IDiscordGraphical):
             draw.multiline_text((xPos, yPos), text, fill=(0, 0, 0, 255), font=font, align="center")
             offset += textWidth + HighScoreCreator.__SPACING_BONUSES
 
-    def _drawRanks(self, draw: ImageDraw.ImageDraw):
+    def _drawRanks(self, draw: ImageDraw.ImageDraw, leaders: List[PlayerSnapshot], cType: str):
         font  = self._getFont(self.fontName, HighScoreCreator.__FONT_SIZE_PLAYER)
         yPos = {
             0: HighScoreCreator.__YPOS_LIST,
@@ -170,19 +184,17 @@ class HighScoreCreator(IDiscordGraphical):
         }
 
         # Populate the player text data
-        for index, playerOrd in enumerate(self.globalStats.getAllPlayers(self.cType)):
-            points = playerOrd.points[self.cType]
+        for index, playerOrd in enumerate(leaders):
+            points = playerOrd.points[cType]
             if points < 1:
                 continue
 
             cls = 0 if index < 3 else 1
             data["names"]["val"][cls] += f"{playerOrd.name}\n"
-            data["bingos"]["val"][cls] += f"{playerOrd.stats[self.cType][PersistentStats.DATA_ITEM_BINGOS]}\n"
-            data["slots"]["val"][cls] += f"{playerOrd.stats[self.cType][PersistentStats.DATA_ITEM_CALLS]}\n"
-            data["games"]["val"][cls] += f"{playerOrd.stats[self.cType][PersistentStats.DATA_ITEM_GAMES]}\n"
+            data["bingos"]["val"][cls] += f"{playerOrd.stats[cType][PersistentStats.DATA_ITEM_BINGOS]}\n"
+            data["slots"]["val"][cls] += f"{playerOrd.stats[cType][PersistentStats.DATA_ITEM_CALLS]}\n"
+            data["games"]["val"][cls] += f"{playerOrd.stats[cType][PersistentStats.DATA_ITEM_GAMES]}\n"
             data["points"]["val"][cls] += f"{points}\n"
-            if index == 9:
-                break
 
         # Draw player text data
         data.values
@@ -47,6 +47,10 @@ class IAsyncDiscordGame(IGameInterface):
     async def addPlayer(self, data: ActionData) -> Result:
         pass
 
+    @abstractmethod
+    async def addPlayers(self, data: ActionData) -> Result:
+        pass
+
     @abstractmethod
     async def kickPlayer(self, data: ActionData) -> Result:
         pass
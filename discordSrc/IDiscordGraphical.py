@@ -6,22 +6,27 @@ __version__ = "1.0.0"
 __maintainer__ = "Schecter Wolf"
 __email__ = "--"
 
-import aiohttp
+import asyncio
 import discord
 
+from .AvatarCache import AvatarCache
+
 from PIL import Image, ImageDraw, ImageFont
 from abc import ABC, abstractmethod
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Globals import GLOBALVARS
 from game.PersistentStats import PlayerOrdinal
 from io import BytesIO
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 
 Coord = Tuple[int, int]
 Size = Tuple[int, int]
 class IDiscordGraphical(ABC):
     __LOGGER = ClassLogger(__name__)
 
+    __AVATAR_FETCH_LIMIT = 4
+    __AVATAR_FETCH_TIMEOUT = 5
+
     def __init__(self, bot: discord.Client):
         super().__init__()
         self.bot = bot
@@ -33,24 +38,40 @@ class IDiscordGraphical(ABC):
     async def _getDiscordAvatar(self, playerOrd: PlayerOrdinal, avatarSize: int) -> Image.Image:
         avatar = None
 
+        # Use the bots cached user before asking the API for it
         user = None
         if playerOrd.playerID >= 0:
-            user = await self.bot.fetch_user(playerOrd.playerID)
+            user = self.bot.get_user(playerOrd.playerID) or await self.bot.fetch_user(playerOrd.playerID)
 
         if not user:
             IDiscordGraphical.__LOGGER.log(LogLevel.LEVEL_WARN, f"Could not fetch user \"{playerOrd.name}\"({playerOrd.playerID})")
         else:
             playerOrd.name = user.display_name
-            async with aiohttp.ClientSession() as session:
-                async with session.get(user.display_avatar.url) as response:
-                    data = await response.read()
-                    avatar = Image.open(BytesIO(data)).convert("RGBA")
+            avatar = await AvatarCache().getAvatar(user, avatarSize)
 
         # Load default avatar if the player icon could not be retrieved for whatever reason
-        if not avatar:
-            avatar = Image.open(GLOBALVARS.IMAGE_MISSING_PLAYER_ICON).convert("RGBA")
-
-        return avatar.resize((avatarSize, avatarSize))
+        return avatar or self._getMissingAvatar(avatarSize)
+
+    async def _getDiscordAvatars(self, players: List[PlayerOrdinal], avatarSize: int) -> List[Image.Image]:
+        """
+        Fetches the player avatars concurrently, any avatar that fails or takes too long is replaced with the missing player icon
+        """
+        semaphore = asyncio.Semaphore(IDiscordGraphical.__AVATAR_FETCH_LIMIT)
+
+        async def fetchAvatar(playerOrd: PlayerOrdinal) -> Image.Image:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(self._getDiscordAvatar(playerOrd, avatarSize), IDiscordGraphical.__AVATAR_FETCH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    IDiscordGraphical.__LOGGER.log(LogLevel.LEVEL_WARN, f"Timed out fetching the avatar of \"{playerOrd.name}\"({playerOrd.playerID})")
+                except Exception as e:
+                    IDiscordGraphical.__LOGGER.log(LogLevel.LEVEL_WARN, f"Could not fetch the avatar of \"{playerOrd.name}\"({playerOrd.playerID}): {e}")
+                return self._getMissingAvatar(avatarSize)
+
+        return list(await asyncio.gather(*(fetchAvatar(playerOrd) for playerOrd in players)))
+
+    def _getMissingAvatar(self, avatarSize: int) -> Image.Image:
+        return Image.open(GLOBALVARS.IMAGE_MISSING_PLAYER_ICON).convert("RGBA").resize((avatarSize, avatarSize))
 
     def _drawTitleName(self, draw: ImageDraw.ImageDraw, titleName: str, fontName: str, fontSize: Size, pos: Coord, sizeMax: Size):
         fontTitle = None
@@ -10,12 +10,15 @@ import discord
 import textwrap
 
 from .IDiscordGraphical import IDiscordGraphical
+from .RenderCache import RenderCache
+from .RenderService import RenderService
 
 from PIL import Image, ImageDraw
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
 from config.Globals import GLOBALVARS
-from game.PersistentStats import PersistentStats, PlayerOrdinal, GetBonus
+from game.PersistentStats import PersistentStats, PlayerOrdinal, PlayerSnapshot, GetBonus
+from typing import List, Optional
 
 class LeaderboardCreator(IDiscordGraphical):
     __LOGGER = ClassLogger(__name__)
@@ -61,15 +64,29 @@ class LeaderboardCreator(IDiscordGraphical):
             2: LeaderboardCreator.__COLUMN_3_XPOS + 6
         }
 
+    async def getLeaderboard(self) -> discord.File:
+        """
+        Returns the leaderboard graphic, only rendering it again if the leaders changed since the last render
+        """
+        return await RenderCache().getAsset((self.globalStats.guildID, "leaderboard", PersistentStats.ITEM_TOTAL),
+                                            self.globalStats.getLeadersVersion(PersistentStats.ITEM_TOTAL), self.createAsset)
+
     async def createAsset(self) -> discord.File:
         LeaderboardCreator.__LOGGER.log(LogLevel.LEVEL_DEBUG, "Creating leaderboard graphic")
+
+        # Gather the leaders and their avatars on the event loop, the drawing is done by the render workers
+        leaders = [self.globalStats.getTopPlayer(ordinal + 1) for ordinal in list(range(0, 3))]
+        avatars = await self._getDiscordAvatars([player or PlayerOrdinal(-1, "NA") for player in leaders], LeaderboardCreator.__AVATAR_SIZE)
+
+        snapshots = [player.snapshot() if player else None for player in leaders]
+        return await RenderService().render(self._renderLeaderboard, snapshots, avatars)
+
+    def _renderLeaderboard(self, leaders: List[Optional[PlayerSnapshot]], avatars: List[Image.Image]) -> discord.File:
         leaderboardGraphic = Image.open(GLOBALVARS.IMAGE_GLOBAL_BOARD).convert("RGBA")
 
         # Create the user avatar layer
         canvas = Image.new("RGBA", leaderboardGraphic.size, (255, 255, 255, 255))
-        for ordinal in list(range(0, 3)):
-            player = self.globalStats.getTopPlayer(ordinal + 1) or PlayerOrdinal(-1, "NA")
-            avatar = await self._getDiscordAvatar(player, LeaderboardCreator.__AVATAR_SIZE)
+        for ordinal, avatar in enumerate(avatars):
             canvas.paste(avatar, (self.avatarOffsets[ordinal], LeaderboardCreator.__AVATAR_YPOS), avatar)
 
         # Overlay the leaderboard graphic on top of the avatar layer
@@ -77,8 +94,7 @@ class LeaderboardCreator(IDiscordGraphical):
 
         # Add the leaderboard texts
         draw = ImageDraw.Draw(leaderboardGraphic)
-        for ordinal in list(range(0, 3)):
-            player = self.globalStats.getTopPlayer(ordinal + 1)
+        for ordinal, player in enumerate(leaders):
             if not player:
                 self._drawTitleName(draw, "N/A", self.fontName,
                                     fontSize=(LeaderboardCreator.__FONT_SIZE_TITLE, LeaderboardCreator.__FONT_SIZE_TITLE_MIN),
@@ -97,7 +113,7 @@ class LeaderboardCreator(IDiscordGraphical):
 
         return self._convertFile(leaderboardGraphic, "leaderboard.png")
 
-    def _drawGamePoints(self, draw: ImageDraw.ImageDraw, player: PlayerOrdinal, offset: int):
+    def _drawGamePoints(self, draw: ImageDraw.ImageDraw, player: PlayerSnapshot, offset: int):
         listCategory = ["Bingos", "Slots", "Games"]
         yOffset = LeaderboardCreator.__BOARD_POINTS_HEIGHT
         fontPoints = self._getFont(self.fontName, LeaderboardCreator.__FONT_SIZE_POINTS)
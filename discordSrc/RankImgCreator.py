@@ -10,12 +10,13 @@ import discord
 import textwrap
 
 from .IDiscordGraphical import IDiscordGraphical
+from .RenderService import RenderService
 
 from PIL import Image, ImageDraw
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
 from config.Globals import GLOBALVARS
-from game.PersistentStats import PlayerOrdinal, PersistentStats
+from game.PersistentStats import PlayerOrdinal, PlayerSnapshot, PersistentStats
 from io import BytesIO
 from typing import Optional
 
@@ -68,7 +69,12 @@ class RankImgCreator(IDiscordGraphical):
             return discord.File(BytesIO())
         RankImgCreator.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Creating rank graphic for player \"{self.playerOrd.name}\"")
 
-        rank = self.playerOrd.ranks[PersistentStats.ITEM_TOTAL]
+        # Fetch the avatar on the event loop, the drawing is done by the render workers
+        avatar = (await self._getDiscordAvatars([self.playerOrd], RankImgCreator.__AVATAR_SIZE))[0]
+        return await RenderService().render(self._renderRank, self.playerOrd.snapshot(), avatar)
+
+    def _renderRank(self, playerOrd: PlayerSnapshot, avatar: Image.Image) -> discord.File:
+        rank = playerOrd.ranks[PersistentStats.ITEM_TOTAL]
 
         # Get the rank graphic
         graphicFile = ""
@@ -83,7 +89,6 @@ class RankImgCreator(IDiscordGraphical):
         rankGraphic = Image.open(graphicFile).convert("RGBA")
 
         # Create the user avatar layer
-        avatar = await self._getDiscordAvatar(self.playerOrd, RankImgCreator.__AVATAR_SIZE)
         canvas = Image.new("RGBA", rankGraphic.size, (255, 255, 255, 255))
         canvas.paste(avatar, (RankImgCreator.__XPOS_AVATAR, RankImgCreator.__YPOS_AVATAR), avatar)
 
@@ -92,19 +97,19 @@ class RankImgCreator(IDiscordGraphical):
 
         # Add name title
         draw = ImageDraw.Draw(rankGraphic)
-        wrappedName = textwrap.fill(self.playerOrd.name, max_lines=2, width=RankImgCreator.__TITLE_CHAR_ROW_MAX)
+        wrappedName = textwrap.fill(playerOrd.name, max_lines=2, width=RankImgCreator.__TITLE_CHAR_ROW_MAX)
         self._drawTitleName(draw, wrappedName, self.fontName,
                 fontSize=(RankImgCreator.__FONT_SIZE_TITLE, RankImgCreator.__FONT_SIZE_TITLE_MIN),
                 pos=(RankImgCreator.__XPOS_TITLE, RankImgCreator.__YPOS_TITLE),
                 sizeMax=(RankImgCreator.__BOARD_TITLE_WIDTH, RankImgCreator.__BOARD_TITLE_HEIGHT))
 
         # Add the ranking text
-        self._drawAllTimeRank(self.playerOrd, draw)
-        self._drawRank(self.playerOrd, draw)
+        self._drawAllTimeRank(playerOrd, draw)
+        self._drawRank(playerOrd, draw)
 
         return self._convertFile(rankGraphic, "rank.png")
 
-    def _drawAllTimeRank(self, playerOrd: PlayerOrdinal, draw: ImageDraw.ImageDraw):
+    def _drawAllTimeRank(self, playerOrd: PlayerSnapshot, draw: ImageDraw.ImageDraw):
         rankNum = playerOrd.ranks[PersistentStats.ITEM_TOTAL]
         rankStr = f"Rank\n{rankNum}"
         allTimeColor = {
@@ -123,7 +128,7 @@ class RankImgCreator(IDiscordGraphical):
 
         draw.multiline_text((xPos, yPos), rankStr, fill=allTimeColor.get(rankNum, (0, 0, 0, 255)), font=fontRank, align="center")
 
-    def _drawRank(self, playerOrd: PlayerOrdinal,  draw: ImageDraw.ImageDraw):
+    def _drawRank(self, playerOrd: PlayerSnapshot,  draw: ImageDraw.ImageDraw):
         fontRank = self._getFont(self.fontName, RankImgCreator.__FONT_SIZE_DESC)
         rankTitle = {
             PersistentStats.ITEM_TOTAL: "All-Time",
@@ -0,0 +1,52 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import discord
+
+from config.ClassLogger import ClassLogger, LogLevel
+from io import BytesIO
+from typing import Awaitable, Callable, Dict, Tuple
+
+AssetKey = Tuple[int, str, str]
+
+class RenderCache:
+    """
+    Shared cache of the rendered leaderboard graphics.
+    Each graphic is kept with the stats version it was rendered from, and is only rendered
+    again once the stats version changes.
+    """
+    __instance = None
+    __LOGGER = ClassLogger(__name__)
+
+    def __new__(cls, *args, **kwargs):
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.__initialized = False
+        return cls.__instance
+
+    def __init__(self):
+        # Init guard
+        if self.__initialized:
+            return
+        self.__initialized = True
+
+        # Only the latest render of each graphic is kept
+        self.assets: Dict[AssetKey, Tuple[int, bytes, str]] = {}
+
+    async def getAsset(self, key: AssetKey, version: int, render: Callable[[], Awaitable[discord.File]]) -> discord.File:
+        cached = self.assets.get(key)
+        if cached and cached[0] == version:
+            RenderCache.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Reusing the rendered {key[1]} graphic (version {version})")
+        else:
+            file = await render()
+            file.fp.seek(0)
+            cached = (version, file.fp.read(), file.filename)
+            self.assets[key] = cached
+
+        # Every send needs its own file, discord closes the file once it's sent
+        return discord.File(BytesIO(cached[1]), filename=cached[2])
@@ -0,0 +1,53 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+from config.ClassLogger import ClassLogger, LogLevel
+from config.Config import Config
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+class RenderService:
+    """
+    Worker pool for the PIL image renders, so the compositing, text layout and PNG encoding
+    don't block the discord event loop.
+    Threads are used rather than processes, since PIL releases the GIL for most of its image operations.
+    """
+    __instance = None
+    __LOGGER = ClassLogger(__name__)
+
+    def __new__(cls, *args, **kwargs):
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.__initialized = False
+        return cls.__instance
+
+    def __init__(self):
+        # Init guard
+        if self.__initialized:
+            return
+        self.__initialized = True
+
+        self.numWorkers: int = Config().getConfig("RenderWorkers", 2)
+        self.executor = ThreadPoolExecutor(max_workers=self.numWorkers, thread_name_prefix="Render")
+
+    async def render(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Runs the render function on a worker thread, any data the render uses that the
+        event loop can change should be gathered before rendering
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(func, *args))
+
+    def shutdown(self):
+        RenderService.__LOGGER.log(LogLevel.LEVEL_INFO, "Shutting down the render workers.")
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        RenderService.__instance = None
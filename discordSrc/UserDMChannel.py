@@ -10,6 +10,7 @@ import discord
 
 from .IChannelInterface import IChannelInterface, ChannelView, verifyView
 from .MakeRequestView import MakeRequestView
+from .RenderService import RenderService
 
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
@@ -73,7 +74,8 @@ class UserDMChannel(IChannelInterface):
         titleName = Config().getFormatConfig("StreamerName", UserDMChannel.__GAME_CARD_TITLE) \
                     + f" [{self.gameType}]"
         embed = discord.Embed(title=titleName, color=discord.Color.green())
-        file = discord.File(CardImgCreator().createGraphicalCard(self.player.card), filename)
+        card = self.player.card
+        file = discord.File(await RenderService().render(CardImgCreator().renderGraphicalCard, card.getCellsStr(), card.markedMask), filename)
 
         embed.set_image(url=f"attachment://{filename}")
 
@@ -6,11 +6,11 @@ __version__ = "1.0.0"
 __maintainer__ = "Schecter Wolf"
 __email__ = "--"
 
-import sqlite3
 import time
 
+from .GameDB import GameDB
+
 from config.ClassLogger import ClassLogger, LogLevel
-from config.Globals import GLOBALVARS
 from typing import List, Optional
 
 class BannedPlayer():
@@ -69,36 +69,26 @@ class BannedData:
         return [int(bp.userID) for bp in self.data]
 
     def _addToDB(self, bp: BannedPlayer):
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        cur = conn.cursor()
-
-        cur.execute("INSERT INTO BANNED (userid, name, timestamp)"
-                    + " VALUES (?,?,?)",
-                    [
-                        bp.userID,
-                        bp.name,
-                        bp.timestamp
-                    ])
-        bp.dbID = cur.lastrowid
-
-        conn.commit()
-        conn.close()
+        with GameDB().transaction() as cur:
+            cur.execute("INSERT INTO BANNED (userid, name, timestamp)"
+                        + " VALUES (?,?,?)",
+                        [
+                            bp.userID,
+                            bp.name,
+                            bp.timestamp
+                        ])
+            bp.dbID = cur.lastrowid
 
     def _rmFromDB(self, bp: BannedPlayer):
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        cur = conn.cursor()
-        cur.execute("DELETE FROM BANNED WHERE id = ?", (bp.dbID,))
-        conn.commit()
-        conn.close()
+        with GameDB().transaction() as cur:
+            cur.execute("DELETE FROM BANNED WHERE id = ?", (bp.dbID,))
 
     def _loadData(self):
         BannedData.__LOGGER.log(LogLevel.LEVEL_INFO, "Reading in banned player data.")
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        cur = conn.cursor()
-
-        cur.execute("SELECT id, userid, name, timestamp"
-                    + f" FROM BANNED")
-        rows = cur.fetchall()
+        with GameDB().transaction() as cur:
+            cur.execute("SELECT id, userid, name, timestamp"
+                        + f" FROM BANNED")
+            rows = cur.fetchall()
 
         for row in rows:
             bp = BannedPlayer()
@@ -108,5 +98,3 @@ class BannedData:
             bp.timestamp = row[3]
             self.data.append(bp)
 
-        conn.close()
-
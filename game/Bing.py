@@ -26,3 +26,14 @@ class Bing(SimpleCacheTracker):
     def __hash__(self):
         return hash(self.bingIdx)
 
+    def placedCopy(self, x: int, y: int, marked: bool) -> "Bing":
+        """
+        Returns a clean copy of the bing placed at a card cell, the copy starts out clean
+        since it is used to rebuild cards that are already saved (i.e. from the recovery data)
+        """
+        bing = Bing(self.bingStr, self.bingIdx, self.category)
+        bing.x = x
+        bing.y = y
+        bing.marked = marked
+        bing.setClean()
+        return bing
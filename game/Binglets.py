@@ -20,8 +20,7 @@ class Binglets:
     __instances: Dict[str, "Binglets"] = {}
     __LOGGER = ClassLogger(__name__)
 
-    def __new__(cls, *args, **kwargs):
-        bType = kwargs['type'] if 'type' in kwargs else GLOBALVARS.GAME_TYPE_DEFAULT
+    def __new__(cls, bType: str = GLOBALVARS.GAME_TYPE_DEFAULT):
         _inst = None
 
         if bType in cls.__instances:
@@ -34,11 +33,13 @@ class Binglets:
 
     def __init__(self, bType: str = GLOBALVARS.GAME_TYPE_DEFAULT):
         # Init guard
-        if bType in Binglets.__instances:
+        if hasattr(self, "_binglets"):
             return
 
         self._binglets: Dict[str, List[Bing]] = {}
         self._bings_ary: List[Bing] = []
+        self._bingIndex: Dict[int, Bing] = {}
+        self._bingIdxs: List[int] = []
         self._limits: Dict[str, int] = {}
 
         if bType == GLOBALVARS.GAME_TYPE_DEFAULT:
@@ -49,6 +50,8 @@ class Binglets:
     def reset(self):
         self._binglets = {}
         self._bings_ary = []
+        self._bingIndex = {}
+        self._bingIdxs = []
 
     def getBingletsCopy(self) -> List[Bing]:
         if not self._bings_ary:
@@ -56,7 +59,7 @@ class Binglets:
                 for bng in array:
                     self._bings_ary.append(bng)
 
-        return copy.deepcopy(self._bings_ary)
+        return [copy.copy(bing) for bing in self._bings_ary]
 
     def getBingDict(self) -> Dict[str, List[Bing]]:
         # Get the configured binglets, if we haven't already
@@ -73,18 +76,45 @@ class Binglets:
     def getLimits(self) -> Dict[str, int]:
         if not self._binglets:
             self._loadBings()
-        return copy.deepcopy(self._limits)
+        return dict(self._limits)
+
+    def getBingIndices(self) -> List[int]:
+        """
+        Returns the bing indices of every loaded binglet, the returned list must not be modified
+        """
+        if not self._binglets:
+            self._loadBings()
+        return self._bingIdxs
+
+    def getBingCategory(self, index: int) -> str:
+        if not self._binglets:
+            self._loadBings()
+        bing = self._bingIndex.get(index)
+        return bing.category if bing else ""
 
     def getBingFromIndex(self, index: int) -> Bing:
-        ret = Bing("", -1)
         if index == 0:
-            ret = Bing("FREE SPACE", 0)
-        else:
-            for bing in self.getBingletsCopy():
-                if index == bing.bingIdx:
-                    ret = copy.copy(bing)
-                    break
-        return ret
+            return Bing("FREE SPACE", 0)
+
+        if not self._binglets:
+            self._loadBings()
+
+        # Bings only hold immutable values, so a shallow copy of the loaded prototype is a full copy
+        bing = self._bingIndex.get(index)
+        return copy.copy(bing) if bing else Bing("", -1)
+
+    def getPlacedBing(self, index: int, x: int, y: int, marked: bool) -> Bing:
+        """
+        Returns a clean copy of the bing at the index, placed at a card cell
+        """
+        if index == 0:
+            return Bing("FREE SPACE", 0).placedCopy(x, y, marked)
+
+        if not self._binglets:
+            self._loadBings()
+
+        bing = self._bingIndex.get(index)
+        return bing.placedCopy(x, y, marked) if bing else Bing("", -1)
 
     def findBings(self, substr: str) -> List[Bing]:
         substrLower = substr.lower()
@@ -112,7 +142,10 @@ class Binglets:
         for key, array in config['bings'].items():
             _bings: List[Bing] = []
             for bstr in array:
-                _bings.append(Bing(bstr, i, key))
+                bing = Bing(bstr, i, key)
+                _bings.append(bing)
+                self._bingIndex[i] = bing
+                self._bingIdxs.append(i)
                 i+=1
             self._binglets[key] = _bings
 
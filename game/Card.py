@@ -19,12 +19,10 @@ from config.Config import Config
 from typing import Dict, List, Optional
 
 class Card(SimpleCacheTracker):
-    ROW = 'row'
-    COL = 'col'
-    DIAG = 'diag'
-
     _LOGGER = ClassLogger(__name__)
+    _UNTRACKED_ATTRS = frozenset({"markedMask"})
     _cardSize = 0
+    _winMasks: Dict[int, List[int]] = {}
 
     def __init__(self, playername: str):
         super().__init__()
@@ -37,10 +35,11 @@ class Card(SimpleCacheTracker):
             Card._LOGGER.log(LogLevel.LEVEL_DEBUG, "Reading in card size config.")
             Card._cardSize = int(Config().getConfig('CardSize', "0"))
 
-    def generateNewCard(self, gameType: str) -> str:
+    def generateNewCard(self, gameType: str, rng: Optional[random.Random] = None) -> str:
         """
         Creates a new randomized bingo card for a player and returns
         a unique hash ID for the particular card arrangement.
+        A seeded random generator can be given to make the card reproducible.
         """
         Card._LOGGER.log(LogLevel.LEVEL_DEBUG, f"Generating card for player {self.playername}...")
         if not Card._cardSize > 0:
@@ -48,33 +47,35 @@ class Card(SimpleCacheTracker):
             raise ValueError("Invalid CardSize configuration")
 
         self._initBoard()
-        idString = ""
-        bings = Binglets(gameType).getBingletsCopy()
-        limits = Binglets(gameType).getLimits()
+        binglets = Binglets(gameType)
+        bingIdxs = iter(self._sampleBingIndices(binglets, Card._cardSize * Card._cardSize, rng))
 
         for i in range(Card._cardSize):
             row = []
             for j in range(Card._cardSize):
-                bing = self._extractRandomBinglet(limits, bings)
+                bing = binglets.getBingFromIndex(next(bingIdxs, -1))
+                if bing.bingIdx < 0:
+                    bing = Bing("invalid", -1)
                 bing.x = i
                 bing.y = j
-                idString += bing.bingStr
                 row.append(bing)
 
             self.cells.append(row)
 
         # Place the free space, if we're using it
+        freeBing = None
         if Config().getConfig("UseFreeSpace"):
             i = math.floor(Card._cardSize / 2)
             freeBing = Bing("FREE SPACE", 0)
             freeBing.x = i
             freeBing.y = i
             self.cells[i][i] = freeBing
+
+        self._indexCells()
+        if freeBing:
             self.markCell(freeBing)
 
-        md5 = hashlib.md5()
-        md5.update(idString.encode('utf-8'))
-        self.cardID = md5.hexdigest()
+        self.cardID = self._computeCardID()
 
         Card._LOGGER.log(LogLevel.LEVEL_INFO, f"New card generated for player \"{self.playername}\" with ID: {self.cardID}")
         return self.cardID
@@ -86,18 +87,16 @@ class Card(SimpleCacheTracker):
         Returns True if the card was able to mark a bing
         """
         bing = self._getBingCell(calledBing.bingIdx)
+        if not bing:
+            return False
         prevBingo = self.hasBingo()
 
-        if bing.bingStr and (force or not bing.marked):
+        if force or not bing.marked:
             Card._LOGGER.log(LogLevel.LEVEL_INFO, f"Player \"{self.playername}\" marked the square ({bing.bingStr})!")
 
-            rowCount = self.markedCells[Card.ROW].get(bing.x, 0) + 1
-            colCount = self.markedCells[Card.COL].get(bing.y, 0) + 1
-            diagA = self.markedCells[Card.DIAG].get('A', 0) + (1 if bing.x == bing.y else 0)
-            diagB = self.markedCells[Card.DIAG].get('B', 0) + (1 if bing.x + bing.y == Card._cardSize - 1 else 0)
-
             bing.marked = True
-            self._adjustCondition(bing, rowCount, colCount, diagA, diagB)
+            self.markedMask |= self._getCellBit(bing)
+            self._adjustCondition()
 
         if self.hasBingo() and not prevBingo:
             Card._LOGGER.log(LogLevel.LEVEL_INFO, f"Player \"{self.playername}\" has a BINGO!")
@@ -111,18 +110,16 @@ class Card(SimpleCacheTracker):
         Returns True if the card was able to unmark a bing
         """
         bing = self._getBingCell(calledBing.bingIdx)
+        if not bing:
+            return True
         prevBingo = self.hasBingo()
 
-        if bing.bingStr and bing.marked:
+        if bing.marked:
             Card._LOGGER.log(LogLevel.LEVEL_INFO, f"Player \"{self.playername}\" unmarked the square ({bing.bingStr}).")
 
-            rowCount = self.markedCells[Card.ROW].get(bing.x, 1) - 1
-            colCount = self.markedCells[Card.COL].get(bing.y, 1) - 1
-            diagA = (self.markedCells[Card.DIAG].get('A', 1) - 1) if bing.x == bing.y else self.markedCells[Card.DIAG].get('A', 0)
-            diagB = (self.markedCells[Card.DIAG].get('B', 1) - 1) if bing.x + bing.y else self.markedCells[Card.DIAG].get('B', 0)
-
             bing.marked = False
-            self._adjustCondition(bing, rowCount, colCount, diagA, diagB)
+            self.markedMask &= ~self._getCellBit(bing)
+            self._adjustCondition()
 
         if prevBingo and not self.hasBingo():
             Card._LOGGER.log(LogLevel.LEVEL_INFO, f"Player \"{self.playername}\" lost their BINGO.")
@@ -139,7 +136,7 @@ class Card(SimpleCacheTracker):
         return self.cardID
 
     def getNumMarked(self) -> int:
-        return sum(bing.marked for row in self.cells for bing in row)
+        return self.markedMask.bit_count()
 
     def getCellsStr(self) -> List[List[str]]:
         cellsStr: List[List[str]] = []
@@ -155,7 +152,21 @@ class Card(SimpleCacheTracker):
         return self.cells
 
     def getBingFromID(self, bingID: int) -> Optional[Bing]:
-        return next((bing for row in self.cells for bing in row if bing.bingIdx == bingID), None)
+        return self.bingMap.get(bingID)
+
+    def setCells(self, cells: List[List[Bing]]):
+        """
+        Replaces the card cells with an already arranged set of bings (i.e. from the recovery data)
+        """
+        self.cells = cells
+        self.cardID = self._computeCardID()
+        self._indexCells()
+
+        self.markedMask = 0
+        for bing in self.bingMap.values():
+            if bing.marked:
+                self.markedMask |= self._getCellBit(bing)
+        self._adjustCondition()
 
     def isCellMarked(self, i, j) -> bool:
         ret = False
@@ -163,58 +174,79 @@ class Card(SimpleCacheTracker):
             ret = self.cells[i][j].marked
         return ret
 
-    def _adjustCondition(self, bing, rowCount, colCount, diagA, diagB):
-            self.markedCells[Card.ROW][bing.x] = rowCount
-            self.markedCells[Card.COL][bing.y] = colCount
-            self.markedCells[Card.DIAG]['A'] = diagA
-            self.markedCells[Card.DIAG]['B'] = diagB
+    def _adjustCondition(self):
+        self.bingo = any((self.markedMask & mask) == mask for mask in Card._getWinMasks(self._cardSize))
 
-            if not self.bingo:
-                self.bingo = (rowCount == Card._cardSize or
-                              colCount == Card._cardSize or
-                              diagA == Card._cardSize or
-                              diagB == Card._cardSize)
+    def _computeCardID(self) -> str:
+        md5 = hashlib.md5()
+        md5.update("".join(bing.bingStr for row in self.cells for bing in row).encode('utf-8'))
+        return md5.hexdigest()
 
-    def _getBingCell(self, index) -> Bing:
-        found = Bing("", 0)
-        for row in self.cells:
-            for cell in row:
-                if index == cell.bingIdx:
-                    found = cell
-                    break
-            if found.bingStr:
-                break
+    def _getCellBit(self, bing: Bing) -> int:
+        return 1 << (bing.x * self._cardSize + bing.y)
 
-        return found
+    @staticmethod
+    def _getWinMasks(cardSize: int) -> List[int]:
+        """
+        Returns the cell bitmasks for every row, column and both diagonals of a card with the given size
+        """
+        masks = Card._winMasks.get(cardSize)
+        if masks is None:
+            rows = [sum(1 << (i * cardSize + j) for j in range(cardSize)) for i in range(cardSize)]
+            cols = [sum(1 << (j * cardSize + i) for j in range(cardSize)) for i in range(cardSize)]
+            diagA = sum(1 << (i * cardSize + i) for i in range(cardSize))
+            diagB = sum(1 << (i * cardSize + (cardSize - 1 - i)) for i in range(cardSize))
+            masks = rows + cols + [diagA, diagB] if cardSize > 0 else []
+            Card._winMasks[cardSize] = masks
+
+        return masks
+
+    def _getBingCell(self, index) -> Optional[Bing]:
+        return self.bingMap.get(index)
+
+    def _indexCells(self):
+        self.bingMap = {bing.bingIdx: bing for row in self.cells for bing in row}
 
     def _initBoard(self):
         self.bingo = False
         self.cardID = ""
         self.cells: List[List[Bing]] = []
-        self.markedCells = {
-            Card.ROW: {},
-            Card.COL: {},
-            Card.DIAG: {},
-        }
+        self.bingMap: Dict[int, Bing] = {}
+        self.markedMask = 0
 
-    def _extractRandomBinglet(self, limits: Dict[str, int], bings) -> Bing:
-        if not bings:
-            return Bing("invalid", -1)
+    def _sampleBingIndices(self, binglets: Binglets, numCells: int, rng: Optional[random.Random] = None) -> List[int]:
+        """
+        Randomly picks up to numCells distinct bing indices, honoring the category limits.
+        Uses a partial Fisher-Yates shuffle over the pool where only the swapped
+        positions are stored, so the cost is bound by the number of draws and not the pool size.
+        """
+        pool = binglets.getBingIndices()
+        limits = binglets.getLimits()
+        swaps: Dict[int, int] = {}
+        picked: List[int] = []
 
-        if not hasattr(random, "_initSeed"):
+        if rng is None and not hasattr(random, "_initSeed"):
             random.seed(time.time())
             setattr(random, "_initSeed", True)
-        randomIdx = random.randrange(0, len(bings))
-        ret: Bing = bings.pop(randomIdx)
-
-        # Check if we have a category limit, retry (recursive) if the limit is reached,
-        # else decrement the limit and proceed
-        catLimit = limits.get(ret.category, None)
-        if catLimit != None:
-            if catLimit == 0:
-                ret = self._extractRandomBinglet(limits, bings)
-            else:
-                limits[ret.category] = catLimit - 1
+        randrange = rng.randrange if rng else random.randrange
 
-        return ret
+        for i in range(len(pool)):
+            if len(picked) == numCells:
+                break
+
+            j = randrange(i, len(pool))
+            bingIdx = pool[swaps.get(j, j)]
+            swaps[j] = swaps.get(i, i)
+
+            # Skip the bing if its category limit has been reached, else decrement the limit and take it
+            category = binglets.getBingCategory(bingIdx)
+            catLimit = limits.get(category, None)
+            if catLimit != None:
+                if catLimit == 0:
+                    continue
+                limits[category] = catLimit - 1
+
+            picked.append(bingIdx)
+
+        return picked
 
@@ -26,7 +26,13 @@ class CardImgCreator:
     __SIZE_TEXT = 12
 
     def createGraphicalCard(self, card: Card) -> BytesIO:
-        gridOverlay = self._createGridOverlay(card)
+        return self.renderGraphicalCard(card.getCellsStr(), card.markedMask)
+
+    def renderGraphicalCard(self, cellsStr: List[List[str]], markedMask: int) -> BytesIO:
+        """
+        Renders a snapshot of the card, so the render workers don't read the live card while the game marks it
+        """
+        gridOverlay = self._createGridOverlay(cellsStr, markedMask)
         gridWidth, gridHeight = gridOverlay.size
         background = Image.open(GLOBALVARS.IMAGE_CARD_BG).convert("RGBA")
 
@@ -43,8 +49,8 @@ class CardImgCreator:
 
         return ret
 
-    def _createGridOverlay(self, card: Card) -> Image.Image:
-        cellStrs: List[List[str]] = self._getCellStrs(card)
+    def _createGridOverlay(self, cellsStr: List[List[str]], markedMask: int) -> Image.Image:
+        cellStrs: List[List[str]] = self._getCellStrs(cellsStr)
         rows = len(cellStrs)
         cols = len(cellStrs[0])
         width = cols * CardImgCreator.__SIZE_CELLS
@@ -67,7 +73,7 @@ class CardImgCreator:
                 bottomRight = ((j + 1) * CardImgCreator.__SIZE_CELLS, (i + 1) * CardImgCreator.__SIZE_CELLS)
 
                 # Color in the cells, white = unmarked and red = marked
-                if card.isCellMarked(i, j):
+                if markedMask >> (i * cols + j) & 1:
                     fillColor = (255, 0, 0, CardImgCreator.__OPACITY) # Red
                 else:
                     fillColor = (255, 255, 255, CardImgCreator.__OPACITY) # White
@@ -88,9 +94,8 @@ class CardImgCreator:
 
         return overlay
 
-    def _getCellStrs(self, card: Card) -> list:
+    def _getCellStrs(self, cells: List[List[str]]) -> list:
         """Gets the cards cell strings in 'pretty' format wrapping"""
-        cells = card.getCellsStr()
         colWidth = [max(len(word) for row in cells for word in str(row[col]).split()) for col in range(len(cells[0]))]
         wrappedLines = []
 
@@ -0,0 +1,371 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import json
+import math
+import sqlite3
+import time
+
+from .Bing import Bing
+from .Binglets import Binglets
+from .CallRequest import CallRequest
+from .Game import Game, GameState
+from .GameDB import GameDB
+from .IRecoveryInterface import IRecoveryInterface
+from .PersistentStats import PersistentStats
+from .Player import Player
+from .Recovery import Recovery
+from .RecoveryWriter import RecoveryWriter
+
+from config.ClassLogger import ClassLogger, LogLevel
+from config.Config import Config
+
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, cast
+
+@dataclass
+class RecoveryCapture:
+    """Compact capture of the recoverable game data, used to diff the game between updates"""
+    state: Dict[str, Any] = field(default_factory=dict)
+    calls: Set[int] = field(default_factory=set)
+    players: Dict[int, Tuple[str, bool, int, float]] = field(default_factory=dict)
+    marks: Dict[int, int] = field(default_factory=dict)
+    requests: Dict[int, FrozenSet[int]] = field(default_factory=dict)
+
+class EventLogRecovery(IRecoveryInterface):
+    """
+    Recovery backend that appends compact game events to an event log, instead of upserting the
+    full game tables. A full snapshot of the game is written periodically, which truncates the log.
+    The game is recovered by loading the last snapshot and replaying the events that followed it.
+    """
+    __EVENTS = "RECEVENTS"
+    __SNAPSHOT = "RECSNAPSHOT"
+
+    __EVENT_CALL = "call"
+    __EVENT_JOIN = "join"
+    __EVENT_PLAYER = "player"
+    __EVENT_MARK = "mark"
+    __EVENT_LEAVE = "leave"
+    __EVENT_REQUEST = "request"
+    __EVENT_UNREQUEST = "unrequest"
+    __EVENT_STATE = "state"
+
+    __LOGGER = ClassLogger(__name__)
+
+    def __init__(self, gameID: int):
+        self.gameID = gameID
+        self.cached: Optional[RecoveryCapture] = None
+        self.numEvents = 0
+        self.snapshotInterval = int(Config().getConfig('RecoverySnapshotInterval', 1000))
+
+        # Set when queued updates failed to write, the next update then writes a full snapshot
+        self.needsRewrite = False
+
+        # Recovery updates are written behind by a background writer when a write interval is configured
+        writeInterval = float(Config().getConfig('RecoveryWriteInterval', 0))
+        self.writer: Optional[RecoveryWriter] = RecoveryWriter(writeInterval) if writeInterval > 0 else None
+
+    def getGameID(self) -> int:
+        return self.gameID
+
+    def hasRecovery(self) -> bool:
+        if not Config().getConfig('UseRecovery', False):
+            return False
+
+        self.flush()
+        with GameDB().transaction() as cur:
+            cur.execute(f"SELECT guildid FROM {EventLogRecovery.__SNAPSHOT} WHERE guildid = ?", (self.gameID,))
+            ret = True if cur.fetchone() else False
+
+        EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Checking if recovery exists for guild {self.gameID}: {ret}")
+        return ret
+
+    def removeRecovery(self):
+        if not Config().getConfig('UseRecovery', False):
+            return
+
+        EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Removing recover for guild {self.gameID}")
+        with self.__writeTransaction() as cur:
+            cur.execute(f"DELETE FROM {EventLogRecovery.__SNAPSHOT} WHERE guildid = ?", (self.gameID,))
+            cur.execute(f"DELETE FROM {EventLogRecovery.__EVENTS} WHERE guildid = ?", (self.gameID,))
+
+        self.cached = None
+        self.numEvents = 0
+
+    def updateRecovery(self, game: Game):
+        if not Config().getConfig('UseRecovery', False):
+            return
+
+        if self.needsRewrite:
+            self.needsRewrite = False
+            self.cached = None
+
+        current = self.__capture(game)
+        events = self.__diffEvents(game, current) if self.cached else []
+
+        with self.__writeTransaction() as cur:
+            # Snapshot the whole game if there is no snapshot yet, the log is due for compaction,
+            # or the game was reset (calls can't be undone by events)
+            if not self.cached or not self.cached.calls <= current.calls or self.numEvents + len(events) > self.snapshotInterval:
+                self.__writeSnapshot(cur, game, current)
+                self.numEvents = 0
+            elif events:
+                for event, data in events:
+                    cur.execute(f"INSERT INTO {EventLogRecovery.__EVENTS} (guildid, event, data) VALUES (?, ?, ?)",
+                                (self.gameID, event, self.__encode(data)))
+                self.numEvents += len(events)
+
+        self.cached = current
+
+    def recoverGame(self, stats: PersistentStats) -> Optional[Game]:
+        if not Config().getConfig('UseRecovery', False):
+            return None
+
+        EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_INFO, f"Attempting to recover game from the recovery event log....")
+        self.flush()
+        with GameDB().transaction() as cur:
+            cur.execute(f"SELECT data FROM {EventLogRecovery.__SNAPSHOT} WHERE guildid = ?", (self.gameID,))
+            row = cur.fetchone()
+            cur.execute(f"SELECT event, data FROM {EventLogRecovery.__EVENTS} WHERE guildid = ? ORDER BY seq", (self.gameID,))
+            events = [(event, json.loads(data)) for event, data in cur.fetchall()]
+
+        if not row:
+            EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_WARN, f"There was no game to recover.")
+            return None
+        snapshot: Dict[str, Any] = json.loads(row[0])
+
+        # Set the game state to the last recorded state
+        state = snapshot['state']
+        for event, data in events:
+            if event == EventLogRecovery.__EVENT_STATE:
+                state = data
+
+        game = Game(state['gametype'])
+        if not Recovery.advanceGameState(game, stats, GameState(state['gamestate'])):
+            return None
+
+        # Restore the snapshot
+        self.__applyState(game, snapshot['state'])
+        game.calledBings = {Binglets(game.gameType).getBingFromIndex(idx) for idx in snapshot['calls']}
+        for playerData in snapshot['players']:
+            self.__applyJoin(game, playerData)
+        for requestData in snapshot['requests']:
+            self.__applyRequest(game, requestData)
+
+        # Replay the event log tail
+        replay: Dict[str, Callable[[Game, Dict[str, Any]], None]] = {
+            EventLogRecovery.__EVENT_CALL: self.__applyCall,
+            EventLogRecovery.__EVENT_JOIN: self.__applyJoin,
+            EventLogRecovery.__EVENT_PLAYER: self.__applyPlayer,
+            EventLogRecovery.__EVENT_MARK: self.__applyMark,
+            EventLogRecovery.__EVENT_LEAVE: self.__applyLeave,
+            EventLogRecovery.__EVENT_REQUEST: self.__applyRequest,
+            EventLogRecovery.__EVENT_UNREQUEST: self.__applyUnrequest,
+            EventLogRecovery.__EVENT_STATE: self.__applyState,
+        }
+        for event, data in events:
+            apply = replay.get(event)
+            if apply:
+                apply(game, data)
+            else:
+                EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Unknown recovery event \"{event}\", skipping...")
+
+        self.cached = self.__capture(game)
+        self.numEvents = len(events)
+        EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_INFO, f"Recovered game from snapshot and {len(events)} events.")
+        return game
+
+    def flush(self):
+        if self.writer:
+            self.writer.flush()
+
+    def __writeTransaction(self) -> AbstractContextManager[sqlite3.Cursor]:
+        """
+        Recovery writes are either queued for the background writer, or committed right away
+        """
+        if self.writer:
+            return cast(AbstractContextManager[sqlite3.Cursor], self.writer.batch(self.__requestRewrite))
+        return GameDB().transaction()
+
+    def __requestRewrite(self):
+        self.needsRewrite = True
+
+    def __writeSnapshot(self, cur: sqlite3.Cursor, game: Game, current: RecoveryCapture):
+        EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Writing recovery snapshot for guild {self.gameID}")
+        snapshot = {
+            "state": current.state,
+            "calls": sorted(current.calls),
+            "players": [self.__makeJoinData(player, current) for player in game.players],
+            "requests": [{"bingid": idx, "playerids": sorted(ids)} for idx, ids in current.requests.items()],
+        }
+
+        cur.execute(f"""
+        INSERT INTO {EventLogRecovery.__SNAPSHOT} (guildid, data, timesaved)
+        VALUES (?, ?, ?)
+        ON CONFLICT(guildid) DO UPDATE SET data=excluded.data, timesaved=excluded.timesaved;
+        """, (self.gameID, self.__encode(snapshot), time.time()))
+        cur.execute(f"DELETE FROM {EventLogRecovery.__EVENTS} WHERE guildid = ?", (self.gameID,))
+
+    def __capture(self, game: Game) -> RecoveryCapture:
+        capture = RecoveryCapture()
+        capture.state = {
+            "gamestate": game.state.value,
+            "gametype": game.gameType,
+            "timestarted": game.timeStarted,
+            "cardseed": game.cardSeed,
+            "numcardsdealt": game.numCardsDealt,
+            "kickedplayers": sorted(game.kickedPlayers),
+            "playerbingos": sorted(game.playerBingos),
+        }
+        capture.calls = {bing.bingIdx for bing in game.calledBings}
+
+        for player in game.players:
+            capture.players[player.userID] = (player.card.getCardOwner(), player.valid, player.rejectedRequests, player.rejectedTimestamp)
+            capture.marks[player.userID] = player.card.markedMask
+
+        for idx, request in game.requestedCalls.items():
+            capture.requests[idx] = frozenset(p.userID for p in request.players)
+
+        return capture
+
+    def __diffEvents(self, game: Game, current: RecoveryCapture) -> List[Tuple[str, Dict[str, Any]]]:
+        cached = cast(RecoveryCapture, self.cached)
+        events: List[Tuple[str, Dict[str, Any]]] = []
+
+        # New calls, along with the marks they imply for the existing players
+        expectedMarks = dict(cached.marks)
+        for idx in current.calls - cached.calls:
+            events.append((EventLogRecovery.__EVENT_CALL, {"bingid": idx}))
+            for player, cell in game.bingHolders.get(idx, {}).items():
+                if player.userID in expectedMarks:
+                    expectedMarks[player.userID] |= player.card._getCellBit(cell)
+
+        # Joined and updated players
+        for player in game.players:
+            userID = player.userID
+            if userID not in cached.players:
+                events.append((EventLogRecovery.__EVENT_JOIN, self.__makeJoinData(player, current)))
+                continue
+
+            if current.players[userID] != cached.players[userID]:
+                _, valid, rejectedReqs, rejectedTime = current.players[userID]
+                events.append((EventLogRecovery.__EVENT_PLAYER, {"userid": userID, "valid": valid, "rejectedreqs": rejectedReqs, "rejectedtime": rejectedTime}))
+            if current.marks[userID] != expectedMarks[userID]:
+                events.append((EventLogRecovery.__EVENT_MARK, {"userid": userID, "marked": current.marks[userID]}))
+
+        # Removed players
+        for userID in cached.players.keys() - current.players.keys():
+            events.append((EventLogRecovery.__EVENT_LEAVE, {"userid": userID}))
+
+        # Added, changed and removed call requests
+        for idx, playerIDs in current.requests.items():
+            if cached.requests.get(idx) != playerIDs:
+                events.append((EventLogRecovery.__EVENT_REQUEST, {"bingid": idx, "playerids": sorted(playerIDs)}))
+        for idx in cached.requests.keys() - current.requests.keys():
+            events.append((EventLogRecovery.__EVENT_UNREQUEST, {"bingid": idx}))
+
+        # The game state goes last, since it holds the authoritative kicked players and player bingos
+        if current.state != cached.state:
+            events.append((EventLogRecovery.__EVENT_STATE, current.state))
+
+        return events
+
+    def __makeJoinData(self, player: Player, current: RecoveryCapture) -> Dict[str, Any]:
+        _, valid, rejectedReqs, rejectedTime = current.players[player.userID]
+        return {
+            "userid": player.userID,
+            "name": player.card.getCardOwner(),
+            "valid": valid,
+            "rejectedreqs": rejectedReqs,
+            "rejectedtime": rejectedTime,
+            "cells": [bing.bingIdx for row in player.card.getCardBings() for bing in row],
+            "marked": current.marks[player.userID],
+        }
+
+    def __applyState(self, game: Game, data: Dict[str, Any]):
+        game.gameType = data['gametype']
+        game.timeStarted = data['timestarted']
+        # Older logs don't have the card dealing state, those games keep the freshly drawn seed
+        game.cardSeed = data.get('cardseed', game.cardSeed)
+        game.numCardsDealt = data.get('numcardsdealt', game.numCardsDealt)
+        game.kickedPlayers = set(data['kickedplayers'])
+        game.playerBingos = set(data['playerbingos'])
+
+    def __applyCall(self, game: Game, data: Dict[str, Any]):
+        bing = Binglets(game.gameType).getBingFromIndex(data['bingid'])
+        game.calledBings.add(bing)
+        for player, cell in list(game.bingHolders.get(bing.bingIdx, {}).items()):
+            player.card.markCell(cell)
+
+    def __applyJoin(self, game: Game, data: Dict[str, Any]):
+        player = Player(data['name'], data['userid'])
+        binglets = Binglets(game.gameType)
+        cardSize = math.isqrt(len(data['cells']))
+        if not cardSize or cardSize * cardSize != len(data['cells']):
+            EventLogRecovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Received malformed card recovery data for player {data['name']}, skipping player...")
+            return
+
+        cells: List[List[Bing]] = []
+        for x in range(cardSize):
+            row: List[Bing] = []
+            for y in range(cardSize):
+                bing = binglets.getBingFromIndex(data['cells'][x * cardSize + y])
+                bing.x = x
+                bing.y = y
+                bing.marked = bool(data['marked'] >> (x * cardSize + y) & 1)
+                row.append(bing)
+            cells.append(row)
+
+        player.card.setCells(cells)
+        self.__setPlayerData(player, data)
+        game.registerPlayer(player)
+
+    def __applyPlayer(self, game: Game, data: Dict[str, Any]):
+        player = game.playersByID.get(data['userid'])
+        if player:
+            self.__setPlayerData(player, data)
+
+    def __setPlayerData(self, player: Player, data: Dict[str, Any]):
+        player.valid = data['valid']
+        player.rejectedRequests = data['rejectedreqs']
+        player.rejectedTimestamp = data['rejectedtime']
+
+    def __applyMark(self, game: Game, data: Dict[str, Any]):
+        player = game.playersByID.get(data['userid'])
+        if not player:
+            return
+
+        for row in player.card.getCardBings():
+            for bing in row:
+                if data['marked'] & player.card._getCellBit(bing):
+                    player.card.markCell(bing)
+                else:
+                    player.card.unmarkCell(bing)
+
+    def __applyLeave(self, game: Game, data: Dict[str, Any]):
+        game.kickPlayer(data['userid'])
+
+    def __applyRequest(self, game: Game, data: Dict[str, Any]):
+        game.unregisterRequest(data['bingid'])
+        players = [game.playersByID[pid] for pid in data['playerids'] if pid in game.playersByID]
+        bing = Binglets(game.gameType).getBingFromIndex(data['bingid'])
+        if not players or bing.bingIdx < 0:
+            return
+
+        callReq = CallRequest(players[0], bing)
+        for player in players[1:]:
+            callReq.addPlayer(player)
+        game.registerRequest(callReq)
+
+    def __applyUnrequest(self, game: Game, data: Dict[str, Any]):
+        game.unregisterRequest(data['bingid'])
+
+    @staticmethod
+    def __encode(data: Any) -> str:
+        return json.dumps(data, separators=(",", ":"))
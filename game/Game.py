@@ -6,6 +6,7 @@ __version__ = "1.0.0"
 __maintainer__ = "Schecter Wolf"
 __email__ = "--"
 
+import random
 import time
 
 from .BannedData import BannedData
@@ -18,11 +19,14 @@ from .Player import Player
 from .Result import Result
 
 from better_profanity import profanity
+from collections import defaultdict
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
 from config.Globals import GLOBALVARS
 from enum import Enum
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+BingIndex = int
 
 class GameState(Enum):
     NEW = 1 # Uninitialized
@@ -52,11 +56,24 @@ class Game:
         self.gameType = gameType
         self.recovery: Optional[IRecoveryInterface] = None
 
+        # Cards are dealt from a generator seeded by the game seed and join order, so the cards of a game can be reproduced
+        self.cardSeed: int = random.getrandbits(32)
+        self.numCardsDealt = 0
+
         self.calledBings: Set[Bing] = set()
         self.kickedPlayers: Set[int] = set()
         self.playerBingos: Set[str] = set()
+        # Bingos made outside of a call (casual marks and retroactive calls), announced with the next call
+        self.pendingBingos: Set[Player] = set()
         self.players: Set[Player] = set()
-        self.requestedCalls: List[CallRequest] = []
+        self.playersByID: Dict[int, Player] = {}
+        self.playersByCard: Dict[str, List[Player]] = defaultdict(list)
+        # Call requests keyed by the requested bing (insertion ordered), along with the number of requests per player
+        self.requestedCalls: Dict[BingIndex, CallRequest] = {}
+        self.requestsByPlayer: Dict[int, int] = defaultdict(int)
+
+        # Inverted index of every card cell in the game, so a call only visits the cards that hold the called slot
+        self.bingHolders: Dict[BingIndex, Dict[Player, Bing]] = defaultdict(dict)
 
     def setRecovery(self, recovery: IRecoveryInterface):
         self.recovery = recovery
@@ -82,6 +99,7 @@ class Game:
 
         if self.recovery:
             self.recovery.removeRecovery()
+            self.recovery.flush()
 
     def startGame(self) -> Result:
         Game._LOGGER.log(LogLevel.LEVEL_DEBUG, "Game is starting...")
@@ -94,6 +112,8 @@ class Game:
         if ret.result:
             self._resetGame()
             self.state = GameState.STARTED
+            self.cardSeed = int(self.config.getConfig("CardSeed", 0)) or random.getrandbits(32)
+            Game._LOGGER.log(LogLevel.LEVEL_INFO, f"Dealing game cards with seed {self.cardSeed}.")
 
             if self.persistentStats:
                 self.persistentStats.refresh()
@@ -129,6 +149,7 @@ class Game:
 
         if ret.result and self.recovery:
             self.recovery.updateRecovery(self)
+            self.recovery.flush()
 
         return ret
 
@@ -161,10 +182,35 @@ class Game:
         return ret
 
     def addPlayer(self, playerName: str, userID: int) -> Result:
+        ret = self._admitPlayer(playerName, userID)
+
+        if ret.result and self.recovery:
+            self.recovery.updateRecovery(self)
+
+        return ret
+
+    def addPlayers(self, newPlayers: List[Tuple[str, int]]) -> Result:
+        """
+        Admits a batch of (player name, user ID) pairs to the game, with a single recovery update.
+        Returns True if any player was added, the additional data is the list of results for each player
+        """
+        results = [self._admitPlayer(playerName, userID) for playerName, userID in newPlayers]
+        numAdded = sum(1 for result in results if result.result)
+
+        ret = Result(numAdded > 0)
+        ret.additional = results
+        ret.responseMsg = f"{numAdded} of {len(newPlayers)} players have been added to the game."
+        Game._LOGGER.log(LogLevel.LEVEL_INFO, ret.responseMsg)
+
+        if ret.result and self.recovery:
+            self.recovery.updateRecovery(self)
+
+        return ret
+
+    def _admitPlayer(self, playerName: str, userID: int) -> Result:
         ret = Result(False)
         player = Player(playerName, userID)
         matchedCards = []
-        tries = 0
 
         # Check pre-conditions
         if self.state != GameState.STARTED:
@@ -178,23 +224,21 @@ class Game:
             Game._LOGGER.log(LogLevel.LEVEL_ERROR, ret.responseMsg)
             return ret
 
-        # Try to generate a unique game card for the player for a given number of tries
-        while tries < Game._NUM_GEN_TRIES:
+        # Try to generate a unique game card for the player for a given number of tries.
+        # Each attempt is seeded by the game seed, join order and attempt number
+        joinIdx = self.numCardsDealt
+        self.numCardsDealt += 1
+        for attempt in range(Game._NUM_GEN_TRIES):
             Game._LOGGER.log(LogLevel.LEVEL_DEBUG, f"Attempting to generate new card for player {playerName}")
-            cardID = player.card.generateNewCard(self.gameType)
-            matchedCards = []
-
-            for _player in self.players:
-                if _player.card.getCardID() == cardID:
-                    matchedCards.append(_player.card)
+            cardID = player.card.generateNewCard(self.gameType, random.Random(f"{self.cardSeed}:{joinIdx}:{attempt}"))
+            matchedCards = [_player.card for _player in self.playersByCard.get(cardID, [])]
 
             if not matchedCards:
                 Game._LOGGER.log(LogLevel.LEVEL_INFO, f"Game card \"{cardID}\" is unique.")
-                tries = Game._NUM_GEN_TRIES
-            else:
-                Game._LOGGER.log(LogLevel.LEVEL_WARN,
-                                 f"Game card \"{cardID}\" is NOT unique, attempting to re-generate game card for player \"{playerName}\"")
-                tries += 1
+                break
+
+            Game._LOGGER.log(LogLevel.LEVEL_WARN,
+                             f"Game card \"{cardID}\" is NOT unique, attempting to re-generate game card for player \"{playerName}\"")
 
         # Apply all past calls to the new players card, if configured for retroactive calls
         if self.config.getConfig("RetroactiveCalls"):
@@ -202,8 +246,12 @@ class Game:
             for call in self.calledBings:
                 player.card.markCell(call)
 
+            if player.card.hasBingo():
+                self.playerBingos.add(player.card.getCardOwner())
+                self.pendingBingos.add(player)
+
         # Add player's game card to the game
-        self.players.add(player)
+        self.registerPlayer(player)
         ret.result = True
         ret.additional = player
         ret.responseMsg = f"Player \"{playerName}\" has been added to the game."
@@ -220,20 +268,13 @@ class Game:
             ret.responseMsg += f"\n{warn}"
             Game._LOGGER.log(LogLevel.LEVEL_WARN, warn)
 
-        if ret.result and self.recovery:
-            self.recovery.updateRecovery(self)
-
         return ret
 
     def kickPlayer(self, playerID: int) -> Result:
         ret = Result(False)
-        kickPlayer = Player("", -1)
 
         # Try to find the player among the existing game players
-        for player in self.players:
-            if player.userID == playerID:
-                kickPlayer = player
-                break
+        kickPlayer = self.playersByID.get(playerID) or Player("", -1)
 
         # Bail if we couldn't find the player
         if kickPlayer.userID < 0 and not Config().getConfig("Debug"):
@@ -248,14 +289,16 @@ class Game:
         self.kickedPlayers.add(playerID)
 
         # Remove player from the game player list
-        self.players.discard(kickPlayer)
+        self._unregisterPlayer(kickPlayer)
 
         # Remove from player bingos, if any
         self.playerBingos.discard(kickPlayer.card.getCardOwner())
+        self.pendingBingos.discard(kickPlayer)
 
         # Remove player from any requested calls
-        for request in self.requestedCalls:
-            request.removePlayer(kickPlayer)
+        if self.requestsByPlayer.pop(kickPlayer.userID, 0):
+            for request in self.requestedCalls.values():
+                request.removePlayer(kickPlayer)
 
         ret.result = True
         ret.additional = kickPlayer
@@ -300,11 +343,12 @@ class Game:
         Game._LOGGER.log(LogLevel.LEVEL_INFO, f"Marking \"{calledBing.bingStr}\" as called!")
         self.calledBings.add(calledBing)
 
-        # Try and mark the bing for each player in the game
+        # Try and mark the bing for each player that has the called slot on their card
         markedPlayers: Set[Player] = set()
-        newBingos: Set[Player] = set()
-        for player in self.players:
-            if player.card.markCell(calledBing):
+        newBingos: Set[Player] = set(self.pendingBingos)
+        self.pendingBingos.clear()
+        for player, cell in self.bingHolders.get(calledBing.bingIdx, {}).items():
+            if player.card.markCell(cell):
                 markedPlayers.add(player)
             if player.card.hasBingo() and player.card.getCardOwner() not in self.playerBingos:
                 newBingos.add(player)
@@ -330,6 +374,12 @@ class Game:
         player: Player = self.getPlayer(callRequest.getRequesterID()).additional
         if player:
             player.card.markCell(callRequest.requestBing)
+
+            # Calls only check the cards holding the called slot for new bingos, so record the bingo here
+            if player.card.hasBingo() and player.card.getCardOwner() not in self.playerBingos:
+                self.playerBingos.add(player.card.getCardOwner())
+                self.pendingBingos.add(player)
+
             ret.responseMsg = f"Player \"{player.card.getCardOwner()}\"({player.userID}) marked their slot \"{callRequest.requestBing.bingStr}\"({callRequest.requestBing.bingIdx})"
             ret.additional = player
             Game._LOGGER.log(LogLevel.LEVEL_DEBUG, ret.responseMsg)
@@ -346,18 +396,16 @@ class Game:
             return ret
 
         # Try and find an existing matching request, if any
-        existingRequest = None
-        for request in self.requestedCalls:
-            if callRequest.isMatchingRequest(request):
-                existingRequest = request
-                break
+        existingRequest = self.requestedCalls.get(callRequest.requestBing.bingIdx)
 
         # Merge requests if a matching one already exists
         if existingRequest:
+            for player in callRequest.players - existingRequest.players:
+                self.requestsByPlayer[player.userID] += 1
             existingRequest.mergeRequests(callRequest)
         # Add in a new call request
         else:
-            self.requestedCalls.append(callRequest)
+            self.registerRequest(callRequest)
             existingRequest = callRequest
 
         ret.result = True
@@ -413,18 +461,15 @@ for a slot that they do not have on their board."
             return ret
 
         # Attempt to remove call request, if any
-        for request in self.requestedCalls:
-            if index == request.requestBing.bingIdx:
-                ret.result = True
-                ret.responseMsg = f"Call request \"{request.requestBing.bingStr}\" was removed."
-                self.requestedCalls.remove(request)
-
-                # Update the rejection notice for each player who had the request
-                if not exempt:
-                    for player in request.players:
-                        player.addRequestRejection()
+        request = self.unregisterRequest(index)
+        if request:
+            ret.result = True
+            ret.responseMsg = f"Call request \"{request.requestBing.bingStr}\" was removed."
 
-                break
+            # Update the rejection notice for each player who had the request
+            if not exempt:
+                for player in request.players:
+                    player.addRequestRejection()
 
         if not ret.result and not exempt:
             ret.responseMsg = f"There is no outstanding request for index \"{index}\", skipping."
@@ -438,13 +483,12 @@ for a slot that they do not have on their board."
 
     def getPlayer(self, playerID: int) -> Result:
         ret = Result(False)
-        for player in self.players:
-            if player.userID == playerID:
-                ret.responseMsg = f"Game card found for player \"{player.card.getCardOwner()}\""
-                ret.additional = player
-                ret.result = True
-                Game._LOGGER.log(LogLevel.LEVEL_INFO, ret.responseMsg)
-                break
+        player = self.playersByID.get(playerID)
+        if player:
+            ret.responseMsg = f"Game card found for player \"{player.card.getCardOwner()}\""
+            ret.additional = player
+            ret.result = True
+            Game._LOGGER.log(LogLevel.LEVEL_INFO, ret.responseMsg)
 
         if not ret.result:
             ret.responseMsg = f"Could not find game card for player ID \"{playerID}\""
@@ -466,28 +510,20 @@ for a slot that they do not have on their board."
     def getCalls(self) -> List[Bing]:
         return list(self.calledBings)
 
-    def getNumRequestByPlayer(self, player: Player) -> int:
-        numReq = 0
-
-        for req in self.requestedCalls:
-            numReq += 1 if player in req.players else 0
+    def getRequests(self) -> List[CallRequest]:
+        return list(self.requestedCalls.values())
 
-        return numReq
+    def getNumRequestByPlayer(self, player: Player) -> int:
+        return self.requestsByPlayer.get(player.userID, 0)
 
     def playerHasRequest(self, player: Player, bingID: int) -> bool:
-        ret = False
-
-        for rq in self.requestedCalls:
-            ret = bingID == rq.requestBing.bingIdx and player in rq.players
-            if ret:
-                break
-
-        return ret
+        request = self.requestedCalls.get(bingID)
+        return request is not None and request.hasPlayer(player)
 
     def checkEligibleFromID(self, name: str, userID: int) -> Result:
         return self.checkEligible(Player(name, userID))
 
-    def checkEligible(self, player: Player) -> Result:
+    def checkEligible(self, player: Player, checkName: bool = True) -> Result:
         ret = Result(False)
         name = player.card.getCardOwner()
 
@@ -511,19 +547,84 @@ for a slot that they do not have on their board."
             ret.responseMsg = f"{name} is already playing the game."
             return ret
 
-        # Make sure the user's name is not vulger
-        if profanity.contains_profanity(name):
+        # Make sure the user's name is not vulger (recovered players were already checked when they joined)
+        if checkName and profanity.contains_profanity(name):
             ret.responseMsg = f"Player's name \"{name}\" is not permissible"
             return ret
 
         ret.result = True
         return ret
 
+    def registerPlayer(self, player: Player):
+        """
+        Adds a player, whose card has already been generated (or recovered), to the game
+        and indexes each of the card's cells by bing index.
+        """
+        self.players.add(player)
+        self.playersByID[player.userID] = player
+        if player.card.getCardID():
+            self.playersByCard[player.card.getCardID()].append(player)
+
+        for row in player.card.getCardBings():
+            for bing in row:
+                self.bingHolders[bing.bingIdx][player] = bing
+
+    def registerRequest(self, callRequest: CallRequest):
+        """
+        Adds a new call request to the game, without any validation (i.e. a recovered request)
+        """
+        self.requestedCalls[callRequest.requestBing.bingIdx] = callRequest
+        for player in callRequest.players:
+            self.requestsByPlayer[player.userID] += 1
+
+    def unregisterRequest(self, index: int) -> Optional[CallRequest]:
+        """
+        Removes a call request from the game, without any validation or rejection notices
+        """
+        request = self.requestedCalls.pop(index, None)
+        if request:
+            for player in request.players:
+                self._decrementPlayerRequests(player)
+        return request
+
+    def _decrementPlayerRequests(self, player: Player):
+        numReq = self.requestsByPlayer.get(player.userID, 0) - 1
+        if numReq > 0:
+            self.requestsByPlayer[player.userID] = numReq
+        else:
+            self.requestsByPlayer.pop(player.userID, None)
+
+    def _unregisterPlayer(self, player: Player):
+        self.players.discard(player)
+        if self.playersByID.get(player.userID) is player:
+            del self.playersByID[player.userID]
+
+        sharedCard = self.playersByCard.get(player.card.getCardID())
+        if sharedCard is not None:
+            if player in sharedCard:
+                sharedCard.remove(player)
+            if not sharedCard:
+                del self.playersByCard[player.card.getCardID()]
+
+        for row in player.card.getCardBings():
+            for bing in row:
+                holders = self.bingHolders.get(bing.bingIdx)
+                if holders is not None:
+                    holders.pop(player, None)
+                    if not holders:
+                        del self.bingHolders[bing.bingIdx]
+
     def _resetGame(self):
         self.players.clear()
+        self.playersByID.clear()
+        self.playersByCard.clear()
+        self.bingHolders.clear()
         self.calledBings.clear()
         self.requestedCalls.clear()
+        self.requestsByPlayer.clear()
         self.playerBingos.clear()
+        self.pendingBingos.clear()
+        self.numCardsDealt = 0
 
     def _decrementState(self, state: Optional[GameState] = None) -> GameState:
         enums = list(GameState)
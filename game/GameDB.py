@@ -0,0 +1,70 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import sqlite3
+import threading
+
+from config.ClassLogger import ClassLogger, LogLevel
+from config.Globals import GLOBALVARS
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+class GameDB:
+    """
+    Shared access to the game database.
+    Keeps a single long lived connection, configured once (WAL journaling, relaxed syncing,
+    foreign keys and a prepared statement cache), and hands out transactions on it.
+    """
+    __instance = None
+    __LOGGER = ClassLogger(__name__)
+    __STATEMENT_CACHE_SIZE = 256
+
+    __conn: Optional[sqlite3.Connection] = None
+    __lock = threading.RLock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls, *args, **kwargs)
+        return cls.__instance
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Yields a cursor for a single transaction, which is committed when the block exits
+        or rolled back if the block raises
+        """
+        with GameDB.__lock:
+            conn = self._getConnection()
+            cur = conn.cursor()
+            try:
+                yield cur
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cur.close()
+
+    def close(self):
+        with GameDB.__lock:
+            if GameDB.__conn:
+                GameDB.__LOGGER.log(LogLevel.LEVEL_DEBUG, "Closing the game DB connection.")
+                GameDB.__conn.close()
+                GameDB.__conn = None
+
+    def _getConnection(self) -> sqlite3.Connection:
+        if not GameDB.__conn:
+            GameDB.__LOGGER.log(LogLevel.LEVEL_DEBUG, "Opening the game DB connection.")
+            conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB, check_same_thread=False, cached_statements=GameDB.__STATEMENT_CACHE_SIZE)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            GameDB.__conn = conn
+
+        return GameDB.__conn
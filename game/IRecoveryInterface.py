@@ -25,6 +25,10 @@ class IRecoveryInterface(ABC):
     def updateRecovery(self, game):
         pass
 
+    @abstractmethod
+    def flush(self):
+        pass
+
     # TODO Even though python doesn't strictly require the return types to match, I still don't like
     # that the iface can't specify the return type with a circular dependency.
     # Ideally, I would make an iface for the game object as well... maybe in the future I'll do that
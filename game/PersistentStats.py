@@ -6,20 +6,25 @@ __version__ = "1.0.0"
 __maintainer__ = "Schecter Wolf"
 __email__ = "--"
 
+import bisect
 import datetime
-import sqlite3
+import itertools
 
+from dataclasses import dataclass
+
+from .GameDB import GameDB
 from .Player import Player
 
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
-from config.Globals import GLOBALVARS
-from typing import Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 DType = str
 CType = str
 TypeDataStat = Dict[DType, int]
 TypePlayerData = Dict[CType, TypeDataStat]
+RankKey = Tuple[int, int]
+LeadersSnapshot = Tuple[Tuple[Any, ...], ...]
 
 # TODO This isn't a good practice to define the keys like this, since it diverges from the
 #       "single source-of-truth" in the PersistentStats... But I cant forward declare in
@@ -33,6 +38,19 @@ BONUSES: Dict[str, int] = {
 def GetBonus(dType: str) -> int:
     return BONUSES.get(dType, 0)
 
+def GetPeriodKey(cType: str, date: Optional[datetime.date] = None) -> str:
+    """
+    Returns the stats bucket key of the month ("YYYY-MM") or ISO week ("YYYY-Www") that the date is in,
+    or an empty key for the all-time stats
+    """
+    date = date or datetime.date.today()
+    if cType == PersistentStats.ITEM_MONTH:
+        return f"{date.year:04d}-{date.month:02d}"
+    if cType == PersistentStats.ITEM_WEEK:
+        isoYear, isoWeek, _ = date.isocalendar()
+        return f"{isoYear:04d}-W{isoWeek:02d}"
+    return ""
+
 def CanonicalCType(cType: str) -> str:
     typeCanon = {
         PersistentStats.ITEM_TOTAL: "All-time",
@@ -47,13 +65,14 @@ class PlayerOrdinal:
         self.playerID: int = playerID
         self.guildid = 0
         self.name: str = name
-        self.timestampMonth = 0
-        self.timestampWeek = 0
 
         self.stats: TypePlayerData = {}
         self.points: dict[CType, int] = {}
         self.ranks: dict[CType, int] = {}
 
+        # Tie breaker for players with the same points, the earlier added player ranks higher
+        self.rankOrder = 0
+
         for cType in PersistentStats.LIST_CATEGORY_ITEMS:
             self.stats[cType] = {}
             self.points[cType] = 0
@@ -61,8 +80,27 @@ class PlayerOrdinal:
             for dType in PersistentStats.LIST_DATA_ITEMS:
                 self.stats[cType][dType] = 0
 
+    def snapshot(self) -> "PlayerSnapshot":
+        """
+        Returns a detached copy of the displayed player data, safe to hand to the render workers
+        """
+        return PlayerSnapshot(playerID=self.playerID,
+                              name=self.name,
+                              stats={cType: dict(stats) for cType, stats in self.stats.items()},
+                              points=dict(self.points),
+                              ranks=dict(self.ranks))
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    playerID: int
+    name: str
+    stats: TypePlayerData
+    points: Dict[CType, int]
+    ranks: Dict[CType, int]
+
 class PersistentStats():
     __LOGGER = ClassLogger(__name__)
+    __upsertStatement = ""
 
     ITEM_TOTAL = "total"
     ITEM_MONTH = "month"
@@ -74,19 +112,40 @@ class PersistentStats():
 
     LIST_DATA_ITEMS = [DATA_ITEM_BINGOS, DATA_ITEM_CALLS, DATA_ITEM_GAMES]
     LIST_CATEGORY_ITEMS = [ITEM_TOTAL, ITEM_MONTH, ITEM_WEEK]
+    LIST_PERIOD_ITEMS = [ITEM_MONTH, ITEM_WEEK]
+
+    # Number of leaders per category that are shown on the leaderboard graphics
+    NUM_SHOWN_LEADERS = 10
+
+    # The rendered leaderboards are cached process wide, so the leaders versions are drawn from one counter
+    # and a new stats instance never reuses a version of an older one
+    __leadersVersions = itertools.count(1)
 
     def __init__(self, guildID: int):
         self.guildID = guildID
         self.allPlayers: List[PlayerOrdinal] = []
-        self.cachedLeaders: Dict[CType, List[PlayerOrdinal]] = {}
+        self.playersByID: Dict[int, PlayerOrdinal] = {}
+        self.dirtyPlayers: Set[PlayerOrdinal] = set()
+
+        # Leaderboard of each category, sorted by the players rank keys
+        self.leaders: Dict[CType, List[PlayerOrdinal]] = {}
+        self.leaderKeys: Dict[CType, List[RankKey]] = {}
+        self.nextRankOrder = 0
+
+        # Bumped whenever the shown leaders of a category change, so the rendered leaderboards can be reused until then
+        self.leadersVersion: Dict[CType, int] = {}
+        self.leadersSnapshot: Dict[CType, LeadersSnapshot] = {}
+
+        # Stats bucket keys of the loaded month and week stats
+        self.periods: Dict[CType, str] = {}
 
         self.refresh()
 
     def updateFromPlayers(self, players: List[Player]):
         PersistentStats.__LOGGER.log(LogLevel.LEVEL_INFO, "Updating player game data.")
 
-        currentWeekID = datetime.date.today().isocalendar()[1]
-        currentMonthID = datetime.date.today().month
+        # Start the new month or week stats, if one started since the stats were loaded
+        self._rolloverPeriods()
 
         for player in players:
             if player.userID < 0 and not Config().getConfig("Debug", False):
@@ -94,15 +153,16 @@ class PersistentStats():
 
             playerName = player.card.getCardOwner()
             playerID = player.userID
-            playerOrd: Optional[PlayerOrdinal] = self.getPlayer(playerID)
+            playerOrd: Optional[PlayerOrdinal] = self.playersByID.get(playerID)
 
             # Add to player list if they are a new player
             if not playerOrd:
                 playerOrd = PlayerOrdinal(playerID, playerName)
                 playerOrd.guildid = self.guildID
-                playerOrd.timestampMonth = currentMonthID
-                playerOrd.timestampWeek = currentWeekID
-                self.allPlayers.append(playerOrd)
+                self._addPlayer(playerOrd)
+
+            # Take the player off the leaderboards while their points change
+            self._unrankPlayer(playerOrd)
 
             # Update the player stats
             playerStatData: TypePlayerData = playerOrd.stats
@@ -122,9 +182,10 @@ class PersistentStats():
                 stat[PersistentStats.DATA_ITEM_GAMES] = 1 + stat.get(PersistentStats.DATA_ITEM_GAMES, 0)
 
             self._calculateBonus(playerOrd)
+            self._rankPlayer(playerOrd)
+            self.dirtyPlayers.add(playerOrd)
 
-        # Update the internal top players
-        self._loadPlayerRanks()
+        self._updateLeadersVersion()
 
         # Save player data to file
         self._save()
@@ -134,33 +195,78 @@ class PersistentStats():
         if player:
             PersistentStats.__LOGGER.log(LogLevel.LEVEL_INFO, f"Player ID {playerID} has been removed from saved player data.")
 
+            self._unrankPlayer(player)
             self.allPlayers.remove(player)
-            self._loadPlayerRanks()
+            del self.playersByID[playerID]
+            self.dirtyPlayers.discard(player)
 
             # Remove player from DB
-            conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-            cur = conn.cursor()
-            cur.execute("DELETE FROM PLAYERS WHERE userid = ? AND guildid = ?", (playerID, self.guildID))
-            conn.commit()
-            conn.close()
+            with GameDB().transaction() as cur:
+                cur.execute("DELETE FROM PLAYERS WHERE userid = ? AND guildid = ?", (playerID, self.guildID))
+                cur.execute("DELETE FROM PLAYERSTATS WHERE userid = ? AND guildid = ?", (playerID, self.guildID))
+
+            self._updateLeadersVersion()
 
     def getTopPlayer(self, place: int, category: str = ITEM_TOTAL) -> Optional[PlayerOrdinal]:
-        leaderboard = self.getAllPlayers(category)
-        return leaderboard[place -1] if (place - 1) < len(leaderboard) else None
+        leaderboard = self.leaders.get(category, [])
+        player = leaderboard[place -1] if 0 < place <= len(leaderboard) else None
+        if player:
+            self._loadRanks(player)
+        return player
+
+    def getTopPlayers(self, count: int, cType: str) -> List[PlayerOrdinal]:
+        return self.leaders.get(cType, [])[:count]
 
     def getPlayer(self, playerID: int) -> Optional[PlayerOrdinal]:
-        return next((player for player in self.allPlayers if player.playerID == playerID), None)
+        player = self.playersByID.get(playerID)
+        if player:
+            self._loadRanks(player)
+        return player
 
     def getAllPlayers(self, cType: str) -> List[PlayerOrdinal]:
-        # Populate the leaders if there is no cache for the CType
-        leaderboard: List[PlayerOrdinal] = self.cachedLeaders.setdefault(cType, [])
-        if not leaderboard:
-            leaderboard = sorted(self.allPlayers, key=lambda p: p.points[cType], reverse=True)
-        return leaderboard
+        return list(self.leaders.get(cType, []))
+
+    def getLeadersVersion(self, cType: str) -> int:
+        return self.leadersVersion.get(cType, 0)
+
+    def getRank(self, player: PlayerOrdinal, cType: str) -> int:
+        """
+        Returns the players leaderboard place in the category, or 0 if they have no points in it
+        """
+        if player.points[cType] <= 0:
+            return 0
+        return bisect.bisect_left(self.leaderKeys[cType], self._getRankKey(player, cType)) + 1
+
+    def getPeriodLeaders(self, cType: str, period: str, count: int) -> List[PlayerOrdinal]:
+        """
+        Returns the top players of any saved month or week (i.e. a past period), by their points in it.
+        The returned players only hold the stats of the category
+        """
+        with GameDB().transaction() as cur:
+            cur.execute("SELECT s.userid, p.name, SUM(s.bingos), SUM(s.calls), SUM(s.games) FROM PLAYERSTATS s"
+                        + " JOIN PLAYERS p ON p.guildid = s.guildid AND p.userid = s.userid"
+                        + " WHERE s.guildid = ? AND s.period = ? GROUP BY s.userid"
+                        + " ORDER BY SUM(s.bingos) * ? + SUM(s.calls) * ? + SUM(s.games) * ? DESC, p.id LIMIT ?",
+                        (self.guildID, period, *(GetBonus(dType) for dType in PersistentStats.LIST_DATA_ITEMS), count))
+            rows = cur.fetchall()
+
+        leaders: List[PlayerOrdinal] = []
+        for row in rows:
+            pd = PlayerOrdinal(row[0], row[1])
+            pd.guildid = self.guildID
+            pd.stats[cType] = dict(zip(PersistentStats.LIST_DATA_ITEMS, row[2:]))
+            self._calculateBonus(pd)
+            leaders.append(pd)
+
+        return leaders
 
     def refresh(self):
         self.allPlayers: List[PlayerOrdinal] = []
+        self.playersByID = {}
+        self.dirtyPlayers = set()
+        self.nextRankOrder = 0
         self._readInPlayerData()
+        self._updateLeadersVersion()
 
     def _readInPlayerData(self):
         """
@@ -168,55 +274,93 @@ class PersistentStats():
         """
         PersistentStats.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Reading in saved player data from the DB...")
 
-        currentWeekID = datetime.date.today().isocalendar()[1]
-        currentMonthID = datetime.date.today().month
+        self.periods = {cType: GetPeriodKey(cType) for cType in PersistentStats.LIST_PERIOD_ITEMS}
+        periodTypes = {period: cType for cType, period in self.periods.items()}
 
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        cur = conn.cursor()
+        with GameDB().transaction() as cur:
+            cur.execute("SELECT id, userid, name, guildid, bingos, calls, games"
+                        + " FROM PLAYERS WHERE guildid = ? ORDER BY id", (self.guildID,))
+            rows = cur.fetchall()
 
-        cur.execute("SELECT id, userid, name, guildid, timestampmonth, timestampweek, bingos, calls, games"
-                    + ", bingosmonth, callsmonth, gamesmonth"
-                    + ", bingosweek, callsweek, gamesweek"
-                    + f"  FROM PLAYERS WHERE guildid = {self.guildID}")
-        rows = cur.fetchall()
+            # Only the current month and week buckets are loaded, older ones just stay in the DB
+            cur.execute("SELECT period, userid, bingos, calls, games FROM PLAYERSTATS"
+                        + f" WHERE guildid = ? AND period IN ({', '.join(['?'] * len(periodTypes))})",
+                        (self.guildID, *periodTypes.keys()))
+            periodRows = cur.fetchall()
 
         for row in rows:
             pd = PlayerOrdinal(row[1], row[2])
             pd.dbID = row[0]
             pd.guildid = row[3]
-            pd.timestampMonth = row[4]
-            pd.timestampWeek = row[5]
-            pd.stats[PersistentStats.ITEM_TOTAL][PersistentStats.DATA_ITEM_BINGOS] = row[6]
-            pd.stats[PersistentStats.ITEM_TOTAL][PersistentStats.DATA_ITEM_CALLS] = row[7]
-            pd.stats[PersistentStats.ITEM_TOTAL][PersistentStats.DATA_ITEM_GAMES] = row[8]
-            if currentMonthID != pd.timestampMonth:
-                pd.timestampMonth = currentMonthID
-            else:
-                pd.stats[PersistentStats.ITEM_MONTH][PersistentStats.DATA_ITEM_BINGOS] = row[9]
-                pd.stats[PersistentStats.ITEM_MONTH][PersistentStats.DATA_ITEM_CALLS] = row[10]
-                pd.stats[PersistentStats.ITEM_MONTH][PersistentStats.DATA_ITEM_GAMES] = row[11]
-            if currentWeekID != pd.timestampWeek:
-                pd.timestampWeek = currentWeekID
-            else:
-                pd.stats[PersistentStats.ITEM_WEEK][PersistentStats.DATA_ITEM_BINGOS] = row[12]
-                pd.stats[PersistentStats.ITEM_WEEK][PersistentStats.DATA_ITEM_CALLS] = row[13]
-                pd.stats[PersistentStats.ITEM_WEEK][PersistentStats.DATA_ITEM_GAMES] = row[14]
+            pd.stats[PersistentStats.ITEM_TOTAL] = dict(zip(PersistentStats.LIST_DATA_ITEMS, row[4:7]))
+            self._addPlayer(pd)
 
+        for row in periodRows:
+            pd = self.playersByID.get(row[1])
+            if pd:
+                pd.stats[periodTypes[row[0]]] = dict(zip(PersistentStats.LIST_DATA_ITEMS, row[2:5]))
+
+        for pd in self.allPlayers:
             self._calculateBonus(pd)
-            self.allPlayers.append(pd)
 
-        self._loadPlayerRanks()
-        conn.close()
+        # Sort the leaderboards once, they're kept in order as the players points change
+        for cType in PersistentStats.LIST_CATEGORY_ITEMS:
+            self._sortLeaders(cType)
+
+    def _rolloverPeriods(self):
+        for cType in PersistentStats.LIST_PERIOD_ITEMS:
+            period = GetPeriodKey(cType)
+            if self.periods.get(cType) == period:
+                continue
+
+            # The new period has no saved bucket yet, so everyone starts from zero
+            PersistentStats.__LOGGER.log(LogLevel.LEVEL_INFO, f"Starting the {CanonicalCType(cType).lower()} stats for {period}.")
+            self.periods[cType] = period
+            for pd in self.allPlayers:
+                pd.stats[cType] = {dType: 0 for dType in PersistentStats.LIST_DATA_ITEMS}
+                self._calculateBonus(pd)
+            self._sortLeaders(cType)
 
-    def _loadPlayerRanks(self):
-        self.cachedLeaders = {}
+    def _sortLeaders(self, cType: str):
+        self.leaders[cType] = sorted(self.allPlayers, key=lambda p: self._getRankKey(p, cType))
+        self.leaderKeys[cType] = [self._getRankKey(p, cType) for p in self.leaders[cType]]
+
+    def _updateLeadersVersion(self):
+        for cType in PersistentStats.LIST_CATEGORY_ITEMS:
+            snapshot = tuple((pd.playerID, pd.name, pd.points[cType], *pd.stats[cType].values())
+                             for pd in self.getTopPlayers(PersistentStats.NUM_SHOWN_LEADERS, cType))
+            if self.leadersSnapshot.get(cType) != snapshot:
+                self.leadersSnapshot[cType] = snapshot
+                self.leadersVersion[cType] = next(PersistentStats.__leadersVersions)
+
+    def _addPlayer(self, player: PlayerOrdinal):
+        player.rankOrder = self.nextRankOrder
+        self.nextRankOrder += 1
+        self.allPlayers.append(player)
+        self.playersByID[player.playerID] = player
+
+    def _rankPlayer(self, player: PlayerOrdinal):
+        for cType in PersistentStats.LIST_CATEGORY_ITEMS:
+            key = self._getRankKey(player, cType)
+            idx = bisect.bisect_left(self.leaderKeys.setdefault(cType, []), key)
+            self.leaderKeys[cType].insert(idx, key)
+            self.leaders.setdefault(cType, []).insert(idx, player)
 
+    def _unrankPlayer(self, player: PlayerOrdinal):
         for cType in PersistentStats.LIST_CATEGORY_ITEMS:
-            for idx, player in enumerate(self.getAllPlayers(cType)):
-                if player.points[cType] > 0:
-                    player.ranks[cType] = idx + 1
-                else:
-                    player.ranks[cType] = 0
+            keys = self.leaderKeys.get(cType, [])
+            idx = bisect.bisect_left(keys, self._getRankKey(player, cType))
+            if idx < len(keys) and self.leaders[cType][idx] is player:
+                del keys[idx]
+                del self.leaders[cType][idx]
+
+    def _loadRanks(self, player: PlayerOrdinal):
+        for cType in PersistentStats.LIST_CATEGORY_ITEMS:
+            player.ranks[cType] = self.getRank(player, cType)
+
+    @staticmethod
+    def _getRankKey(player: PlayerOrdinal, cType: str) -> RankKey:
+        return (-player.points[cType], player.rankOrder)
 
     def _calculateBonus(self, player: PlayerOrdinal):
         for cType in PersistentStats.LIST_CATEGORY_ITEMS:
@@ -226,48 +370,57 @@ class PersistentStats():
                 player.points[cType] += val * GetBonus(dType)
 
     def _save(self):
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        cur = conn.cursor()
-
-        for pd in self.allPlayers:
-            data = {
-                "userid": pd.playerID,
-                "guildid": pd.guildid,
-                "name": pd.name,
-                "timestampmonth": pd.timestampMonth,
-                "timestampweek": pd.timestampWeek,
-            }
-
-            # Add in the player stats to the data container
-            for cType in PersistentStats.LIST_CATEGORY_ITEMS:
-                for dType in PersistentStats.LIST_DATA_ITEMS:
-                    suffix = "" if cType == PersistentStats.ITEM_TOTAL else cType
-                    data[f"{dType}{suffix}"] = pd.stats[cType][dType]
-
-            sql = ""
-            values = list(data.values())
-            if not pd.dbID:
-                columns = ", ".join(data.keys())
-                placeholders = ", ".join(["?"] * len(data))
-                sql = f"""
-                INSERT INTO PLAYERS ({columns})
-                VALUES ({placeholders})
-                """
-            else:
-                updateColumns = ", ".join(f"{k}=?" for k in data.keys())
-                values.append(pd.dbID)
-                sql = f"""
-                UPDATE PLAYERS
-                SET {updateColumns}
-                WHERE id=?
-                """
-
-            cur.execute(sql, values)
-            if not pd.dbID:
-                pd.dbID = cur.lastrowid
-
-        conn.commit()
-        conn.close()
-
-        PersistentStats.__LOGGER.log(LogLevel.LEVEL_INFO, "Player data saved.")
-
+        """
+        Saves the players whose stats changed since the last save
+        """
+        if not self.dirtyPlayers:
+            return
+
+        # Saved in the order the players were added, so new players get their DB IDs in the same order
+        dirtyPlayers = sorted(self.dirtyPlayers, key=lambda pd: pd.rankOrder)
+        with GameDB().transaction() as cur:
+            cur.executemany(self._getUpsertStatement(), [list(self._createPlayerData(pd).values()) for pd in dirtyPlayers])
+            cur.executemany("INSERT INTO PLAYERSTATS (guildid, userid, period, bingos, calls, games) VALUES (?, ?, ?, ?, ?, ?)"
+                            + " ON CONFLICT(guildid, period, userid) DO UPDATE SET"
+                            + " bingos=excluded.bingos, calls=excluded.calls, games=excluded.games",
+                            [(pd.guildid, pd.playerID, self.periods[cType], *(pd.stats[cType][dType] for dType in PersistentStats.LIST_DATA_ITEMS))
+                             for pd in dirtyPlayers for cType in PersistentStats.LIST_PERIOD_ITEMS])
+
+            # Fetch the DB IDs assigned to the newly added players
+            newPlayers = {pd.playerID: pd for pd in dirtyPlayers if not pd.dbID}
+            if newPlayers:
+                cur.execute(f"SELECT userid, id FROM PLAYERS WHERE guildid = ? AND userid IN ({', '.join(['?'] * len(newPlayers))})",
+                            (self.guildID, *newPlayers.keys()))
+                for userID, dbID in cur.fetchall():
+                    newPlayers[userID].dbID = dbID
+
+        self.dirtyPlayers = set()
+        PersistentStats.__LOGGER.log(LogLevel.LEVEL_INFO, f"Player data saved ({len(dirtyPlayers)} players).")
+
+    def _createPlayerData(self, pd: PlayerOrdinal) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "userid": pd.playerID,
+            "guildid": pd.guildid,
+            "name": pd.name,
+        }
+
+        # Add in the all-time stats to the data container, the month and week stats are saved in their stats buckets
+        for dType in PersistentStats.LIST_DATA_ITEMS:
+            data[dType] = pd.stats[PersistentStats.ITEM_TOTAL][dType]
+
+        return data
+
+    def _getUpsertStatement(self) -> str:
+        """
+        Players are unique per guild, so saving a player either adds them or updates their existing row
+        """
+        if not PersistentStats.__upsertStatement:
+            columns = list(self._createPlayerData(PlayerOrdinal(0)).keys())
+            updateColumns = ", ".join(f"{k}=excluded.{k}" for k in columns if k not in ("userid", "guildid"))
+            PersistentStats.__upsertStatement = f"""
+            INSERT INTO PLAYERS ({", ".join(columns)})
+            VALUES ({", ".join(["?"] * len(columns))})
+            ON CONFLICT(guildid, userid) DO UPDATE SET {updateColumns}
+            """
+
+        return PersistentStats.__upsertStatement
@@ -8,24 +8,29 @@ __email__ = "--"
 
 import json
 import sqlite3
+import struct
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from collections import defaultdict
 
 from .CallRequest import CallRequest
 from .Game import Game, GameState
 from .Bing import Bing
 from .Binglets import Binglets
+from .Card import Card
+from .GameDB import GameDB
 from .IRecoveryInterface import IRecoveryInterface
 from .PersistentStats import PersistentStats
 from .Player import Player
+from .RecoveryWriter import RecoveryBatch, RecoveryWriter
 from .Result import Result
 
 from config.ClassLogger import ClassLogger, LogLevel
 from config.Config import Config
 from config.Globals import GLOBALVARS
 
-from typing import Any, Dict, List, Optional, Set
+from contextlib import AbstractContextManager
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, cast
 
 @dataclass
 class RecoveryData:
@@ -33,6 +38,8 @@ class RecoveryData:
     gamestate: GameState
     gametype: str
     timestarted: float
+    cardseed: int
+    numcardsdealt: int
     calledbings: Set[Bing]
     kickedplayers: Set[int]
     playerbingos: Set[str]
@@ -40,21 +47,42 @@ class RecoveryData:
 class Recovery(IRecoveryInterface):
     __TABLE = "RECOVER"
     __PLAYERS = "RECPLAYERS"
-    __PLAYER_CARD = "RECPLAYERCELLS"
     __REQUESTS = "RECREQUESTS"
 
-    __BING_ID_BUFFER = 1000
+    # Cards used to be saved as one row per cell, keyed by the player ID shifted by the buffer plus the bing ID.
+    # Those rows are only read back to migrate a recovered game to the card blobs
+    __PLAYER_CARD = "RECPLAYERCELLS"
+    __LEGACY_BING_ID_BUFFER = 1000
+
+    __CARD_FORMAT_VERSION = 1
 
     __LOGGER = ClassLogger(__name__)
+    __upsertStatements: Dict[str, str] = {}
+
+    # The column identifying a single row of the player and request tables. Deleting the game row
+    # cascades to all of its players and requests, so it is never a single row delete
+    __ROW_KEYS = {
+        __PLAYERS: "playerid",
+        __REQUESTS: "bingid"
+    }
 
     def __init__(self, gameID: int):
         self.gameID = gameID
         self.cachedRecovGame: Optional[RecoveryData] = None
         self.cachedPlayers: Set[Player] = set()
-        self.cachedRequests: Dict[int, CallRequest] = {}
+        self.cachedMarks: Dict[int, int] = {}
+        self.hasLegacyCells = False
+        self.cachedRequests: Dict[int, FrozenSet[int]] = {}
+
+        # Set when queued updates failed to write, the next update then rewrites all of the game recovery data
+        self.needsRewrite = False
 
         self.gameType = GLOBALVARS.GAME_TYPE_DEFAULT
 
+        # Recovery updates are written behind by a background writer when a write interval is configured
+        writeInterval = float(Config().getConfig('RecoveryWriteInterval', 0))
+        self.writer: Optional[RecoveryWriter] = RecoveryWriter(writeInterval) if writeInterval > 0 else None
+
     def getGameID(self) -> int:
         return self.gameID
 
@@ -62,15 +90,12 @@ class Recovery(IRecoveryInterface):
         if not Config().getConfig('UseRecovery', False):
             return False
 
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        cur = conn.cursor()
-
-        cur.execute(f"SELECT guildid FROM {Recovery.__TABLE} WHERE guildid = ?", (self.gameID,))
-        ret = True if cur.fetchone() else False
+        self.flush()
+        with GameDB().transaction() as cur:
+            cur.execute(f"SELECT guildid FROM {Recovery.__TABLE} WHERE guildid = ?", (self.gameID,))
+            ret = True if cur.fetchone() else False
 
         Recovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Checking if recovery exists for guild {self.gameID}: {ret}")
-
-        self.__closeDB(conn)
         return ret
 
     def removeRecovery(self):
@@ -79,25 +104,14 @@ class Recovery(IRecoveryInterface):
 
         Recovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Removing recover for guild {self.gameID}")
 
-        # Construct the db tools, enabling foreign keys
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        conn.execute("PRAGMA foreign_keys = ON")
-        cur = conn.cursor()
-
-        self.__removeData(cur, "guildid", self.gameID, Recovery.__TABLE)
-
-        conn.commit()
-        self.__closeDB(conn)
+        with self.__writeTransaction() as cur:
+            self.__removeData(cur, "guildid", self.gameID, Recovery.__TABLE)
+        self.cachedRecovGame = None
 
     def updateRecovery(self, game: Game):
         if not Config().getConfig('UseRecovery', False):
             return
 
-        # Construct the db tools, enabling foreign keys
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        conn.execute("PRAGMA foreign_keys = ON")
-        cur = conn.cursor()
-
         # Make sure the game type is syncronized
         self.gameType = game.gameType
 
@@ -106,47 +120,48 @@ class Recovery(IRecoveryInterface):
             gamestate = game.state,
             gametype = game.gameType,
             timestarted = game.timeStarted,
+            cardseed = game.cardSeed,
+            numcardsdealt = game.numCardsDealt,
             calledbings = game.calledBings,
             kickedplayers = game.kickedPlayers,
             playerbingos = game.playerBingos,
         )
 
-        self.__updateGameState(cur, currentGame)
-        self.__updateGamePlayers(cur, game, self.gameID)
-        self.__updateGameCallRequests(cur, game, self.gameID)
+        with self.__writeTransaction() as cur:
+            if self.needsRewrite:
+                self.needsRewrite = False
+                self.__resetCache(cur)
 
-        conn.commit()
-        self.__closeDB(conn)
+            self.__updateGameState(cur, currentGame)
+            self.__updateGamePlayers(cur, game, self.gameID)
+            self.__updateGameCallRequests(cur, game, self.gameID)
 
     def recoverGame(self, stats: PersistentStats) -> Optional[Game]:
         if not Config().getConfig('UseRecovery', False):
             return None
 
         Recovery.__LOGGER.log(LogLevel.LEVEL_INFO, f"Attempting to recover game from the recovery database....")
-        bCont = True
-        game = Game()
+        self.flush()
+        with GameDB().transaction() as cur:
+            game = self.__recoverGameFromDB(cur, stats)
 
-        # Construct the db tools, enabling foreign keys
-        conn = sqlite3.connect(GLOBALVARS.FILE_GAME_DB)
-        conn.execute("PRAGMA foreign_keys = ON")
-        cur = conn.cursor()
-
-        recoveredGameData = self.__recoverGameState(cur, self.gameID)
-        if not recoveredGameData:
-            Recovery.__LOGGER.log(LogLevel.LEVEL_WARN, f"There was no game to recover.")
-            bCont = False
+        return game
 
-        # Set the game state
-        while bCont and recoveredGameData and game.state != recoveredGameData.gamestate:
+    @staticmethod
+    def advanceGameState(game: Game, stats: PersistentStats, state: GameState) -> bool:
+        """
+        Walks a freshly created game through the game states until it reaches the recovered state
+        """
+        while game.state != state:
             result = Result(False)
 
             if game.state == GameState.NEW:
                 result = Result(game.initGame(stats))
             elif game.state == GameState.IDLE:
                 result = game.startGame()
-            elif game.state == GameState.STARTED and recoveredGameData.gamestate == GameState.PAUSED:
+            elif game.state == GameState.STARTED and state == GameState.PAUSED:
                 result = game.pauseGame()
-            elif game.state == GameState.STARTED and recoveredGameData.gamestate == GameState.STOPPED:
+            elif game.state == GameState.STARTED and state == GameState.STOPPED:
                 result = game.stopGame()
             elif game.state == GameState.STOPPED:
                 game.destroyGame()
@@ -154,12 +169,55 @@ class Recovery(IRecoveryInterface):
 
             if not result.result:
                 Recovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Encountered an error when setting the game state during the recovery.")
-                bCont = False
+                return False
+
+        return True
+
+    def flush(self):
+        if self.writer:
+            self.writer.flush()
+
+    def __writeTransaction(self) -> AbstractContextManager[sqlite3.Cursor]:
+        """
+        Recovery writes are either queued for the background writer, or committed right away
+        """
+        if self.writer:
+            return cast(AbstractContextManager[sqlite3.Cursor], self.writer.batch(self.__requestRewrite))
+        return GameDB().transaction()
+
+    def __requestRewrite(self):
+        self.needsRewrite = True
+
+    def __resetCache(self, cur: sqlite3.Cursor):
+        """
+        Forgets what was saved, and clears the saved players and requests, so that everything gets written again
+        """
+        Recovery.__LOGGER.log(LogLevel.LEVEL_WARN, f"Rewriting all of the recovery data for guild {self.gameID}")
+        self.cachedRecovGame = None
+        self.cachedMarks.clear()
+        self.cachedRequests.clear()
+        self.__removeData(cur, "id", self.gameID, Recovery.__PLAYERS)
+        self.__removeData(cur, "id", self.gameID, Recovery.__REQUESTS)
+
+    def __recoverGameFromDB(self, cur: sqlite3.Cursor, stats: PersistentStats) -> Optional[Game]:
+        bCont = True
+        game = Game()
+
+        recoveredGameData = self.__recoverGameState(cur, self.gameID)
+        if not recoveredGameData:
+            Recovery.__LOGGER.log(LogLevel.LEVEL_WARN, f"There was no game to recover.")
+            bCont = False
+
+        # Set the game state
+        if bCont and recoveredGameData:
+            bCont = Recovery.advanceGameState(game, stats, recoveredGameData.gamestate)
 
         # Set the rest of the game data
         if bCont and recoveredGameData:
             game.gameType = recoveredGameData.gametype
             game.timeStarted = recoveredGameData.timestarted
+            game.cardSeed = recoveredGameData.cardseed
+            game.numCardsDealt = recoveredGameData.numcardsdealt
             game.calledBings = recoveredGameData.calledbings
             game.kickedPlayers = recoveredGameData.kickedplayers
             game.playerBingos = recoveredGameData.playerbingos
@@ -179,12 +237,19 @@ class Recovery(IRecoveryInterface):
         return game
 
     def __recoverGamePlayers(self, cur: sqlite3.Cursor, gameID: int, game: Game):
-        templ = self.__createPlayerData(0, 0, "", 0, 0, 0.0, 0)
+        templ = self.__createPlayerData(0, 0, "", 0, 0, 0.0, 0, b"")
         listRecoveredPlayerData: List[Dict[str, Any]] = self.__recoverData(cur, templ, "id", gameID, Recovery.__PLAYERS)
 
+        # Players saved before the card blobs have their cards in the legacy cell rows instead
+        cellsByPlayer: Dict[int, List[Tuple[int, int, int, int]]] = defaultdict(list)
+        if any(playerData['card'] is None for playerData in listRecoveredPlayerData):
+            cellsByPlayer = self.__recoverLegacyCells(cur, gameID)
+
+        binglets = Binglets(game.gameType)
+        cardSize = int(Config().getConfig('CardSize', "0"))
         for playerData in listRecoveredPlayerData:
             player = Player(playerData['name'], playerData['playerid'])
-            if not game.checkEligible(player):
+            if not game.checkEligible(player, checkName=False).result:
                 Recovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Received a malformed player recovery data, player not eligible, skipping...")
                 continue
 
@@ -192,59 +257,62 @@ class Recovery(IRecoveryInterface):
             player.rejectedRequests = playerData['rejectedreqs']
             player.rejectedTimestamp = playerData['rejectedtime']
 
-            if self.__recoverPlayerCard(cur, player, game.gameType):
+            if playerData['card'] is None:
+                # Left dirty, so the card gets saved as a blob on the next update
+                if self.__recoverLegacyPlayerCard(player, cellsByPlayer.get(player.userID, []), binglets, cardSize):
+                    self.hasLegacyCells = True
+                    game.registerPlayer(player)
+            elif self.__recoverPlayerCard(player, playerData['card'], binglets, cardSize):
                 player.setClean()
-                game.players.add(player)
+                player.card.setClean()
+                self.cachedMarks[player.userID] = player.card.markedMask
+                game.registerPlayer(player)
 
-    def __recoverPlayerCard(self, cur: sqlite3.Cursor, player: Player, gameType: str) -> bool:
-        bRet = True
-        binglets = Binglets(gameType)
-        templ = self.__createPlayerCardData(0, "0", 0, 0, 0)
-        listRecoveredCardData: List[Dict[str, Any]] = self.__recoverData(cur, templ, "id", player.userID, Recovery.__PLAYER_CARD)
-
-        # The database isn't guaranteed to return the bing cells in "order". Therefore we're using dictionaries
-        # to sort the bing cells as they are processed from the recovery data
-        temporaryCellStructure: Dict[int, Dict[int, Bing]] = defaultdict(dict)
-
-        for cardData in listRecoveredCardData:
-            bingID = abs(int(cardData['bingid'])) % Recovery.__BING_ID_BUFFER
-            bing = binglets.getBingFromIndex(bingID)
-            if bing.bingIdx < 0:
-                break
+        # The recovered players are already saved
+        self.cachedPlayers = game.players.copy()
+        Recovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Recovered {len(game.players)} players for guild {gameID}")
 
-            bing.marked = bool(cardData['marked'])
-            bing.x = int(cardData['x'])
-            bing.y = int(cardData['y'])
+    def __recoverPlayerCard(self, player: Player, cardData: bytes, binglets: Binglets, cardSize: int) -> bool:
+        cells = Recovery.__unpackCard(cardData, binglets)
 
-            temporaryCellStructure[bing.x][bing.y] = bing
+        # Sanity check
+        if not cells or len(cells) != cardSize:
+            Recovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Received malform card recovery data for player {player.card.getCardOwner()}, skipping player...")
+            return False
 
-        # Sort the cells
-        temporaryCellStructure = {
-            outer: dict(sorted(inner.items()))
-            for outer, inner in sorted(temporaryCellStructure.items())
-        }
+        player.card._cardSize = cardSize
+        player.card.setCells(cells)
+        return True
+
+    def __recoverLegacyCells(self, cur: sqlite3.Cursor, gameID: int) -> Dict[int, List[Tuple[int, int, int, int]]]:
+        # Fetch the card cells of every player in the guild at once, grouped by player in a single pass
+        cur.execute(f"""
+        SELECT c.id, c.bingid, c.x, c.y, c.marked FROM {Recovery.__PLAYER_CARD} c
+        JOIN {Recovery.__PLAYERS} p ON c.id = p.playerid
+        WHERE p.id = ? ORDER BY c.id, c.x, c.y;
+        """, (gameID,))
+        cellsByPlayer: Dict[int, List[Tuple[int, int, int, int]]] = defaultdict(list)
+        for playerID, bingID, x, y, marked in cur.fetchall():
+            cellsByPlayer[playerID].append((int(bingID), int(x), int(y), int(marked)))
+        return cellsByPlayer
+
+    def __recoverLegacyPlayerCard(self, player: Player, cardData: List[Tuple[int, int, int, int]], binglets: Binglets, cardSize: int) -> bool:
+        # The cells are already ordered by x/y, so the rows can be filled in as they come
+        cells: List[List[Bing]] = [[] for _ in range(cardSize)]
+        for bingID, x, y, marked in cardData:
+            bing = binglets.getPlacedBing(abs(bingID) % Recovery.__LEGACY_BING_ID_BUFFER, x, y, bool(marked))
+            if bing.bingIdx < 0 or x >= cardSize or y != len(cells[x]):
+                break
+            cells[x].append(bing)
 
         # Sanity check
-        cardSize = int(Config().getConfig('CardSize', "0"))
-        cells: List[List[Bing]] = [list(inner.values()) for inner in temporaryCellStructure.values()]
-        invalidCard = len(cells) != cardSize and all(len(row) == cardSize for row in cells)
-
-        if invalidCard:
+        if not cardSize or any(len(row) != cardSize for row in cells):
             Recovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Received malform card recovery data for player {player.card.getCardOwner()}, skipping player...")
-            bRet = False
-        else:
-            player.card.cells = cells
-            player.card._cardSize = cardSize
-
-            # Even though the bing object is set as marked internally, I still need to mark the bing at the card
-            # level because there is some extra tracking structs that are updated as a result
-            for row in player.card.cells:
-                for bing in row:
-                    if bing.marked:
-                        player.card.markCell(bing, True)
-                    bing.setClean()
+            return False
 
-        return bRet
+        player.card._cardSize = cardSize
+        player.card.setCells(cells)
+        return True
 
     def __recoverGameCallRequests(self, cur: sqlite3.Cursor, gameID: int, game: Game):
         binglets = Binglets(game.gameType)
@@ -279,12 +347,12 @@ class Recovery(IRecoveryInterface):
                     callReq.addPlayer(player)
 
             # Add the recovered call request to the game
-            game.requestedCalls.append(callReq)
+            game.registerRequest(callReq)
 
         return False
 
     def __recoverGameState(self, cur: sqlite3.Cursor, gameID: int) -> Optional[RecoveryData]:
-        cur.execute("SELECT guildid, gamestate, gametype, timestarted, calledbings, kickedplayers, playerbingos, timesaved"
+        cur.execute("SELECT guildid, gamestate, gametype, timestarted, cardseed, numcardsdealt, calledbings, kickedplayers, playerbingos, timesaved"
                     + f" FROM {Recovery.__TABLE} WHERE guildid = {gameID}")
         row = cur.fetchone()
 
@@ -295,15 +363,20 @@ class Recovery(IRecoveryInterface):
                 gamestate = GameState(int(row[1])),
                 gametype = row[2],
                 timestarted = row[3],
-                calledbings = self.__parseBings(row[2], set(json.loads(row[4]))),
-                kickedplayers = set(json.loads(row[5])),
-                playerbingos = set(json.loads(row[6]))
+                cardseed = row[4],
+                numcardsdealt = row[5],
+                calledbings = self.__parseBings(row[2], set(json.loads(row[6]))),
+                kickedplayers = set(json.loads(row[7])),
+                playerbingos = set(json.loads(row[8]))
             )
 
         return ret
 
     def __updateGameState(self, cur: sqlite3.Cursor, gameData: RecoveryData):
-        self.cachedRecovGame = self.__recoverGameState(cur, gameData.guildid)
+        # Compare against a snapshot of the last saved game state, the DB is only read when there is no snapshot yet
+        # (queued writes can't be read back, so a write-behind recovery always saves the first update)
+        if self.cachedRecovGame is None and not self.writer:
+            self.cachedRecovGame = self.__recoverGameState(cur, gameData.guildid)
 
         # Update the recovery DB if the recovery data is stale
         if gameData != self.cachedRecovGame:
@@ -325,89 +398,99 @@ class Recovery(IRecoveryInterface):
             # Add save time
             data['timesaved'] = time.time()
 
-            self.__commitData(cur, data, "guildid", Recovery.__TABLE)
-            self.cachedRecovGame = gameData
+            self.__commitData(cur, [data], "guildid", Recovery.__TABLE)
+            self.cachedRecovGame = replace(gameData,
+                                           calledbings=set(gameData.calledbings),
+                                           kickedplayers=set(gameData.kickedplayers),
+                                           playerbingos=set(gameData.playerbingos))
 
     def __updateGamePlayers(self, cur: sqlite3.Cursor, game: Game, gameID: int):
-        # Update players into the DB
+        dirtyPlayers: List[Dict[str, Any]] = []
+
+        # Collect the players that need to be updated in the DB. Marks don't dirty the card itself,
+        # so the marked cells are compared against the last saved ones
         for player in game.players:
-            # Update player data
-            if player.getIsDirty() or player.card.getIsDirty():
-                Recovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Updating player recovery data for player \"{player.card.getCardOwner()}\"({player.userID})")
-                dataPlayer = self.__createPlayerData(gameID,
-                                                     player.userID,
-                                                     player.card.getCardOwner(),
-                                                     int(player.valid),
-                                                     player.rejectedRequests,
-                                                     player.rejectedTimestamp,
-                                                     int(player.card.hasBingo()))
-                self.__commitData(cur, dataPlayer, "playerid", Recovery.__PLAYERS)
-
-            # Shift (multiply) 1000 to the player ID as a "buffer" for the bing ID placement,
-            # since im pretty sure we will never have more than 1000 slots configured....
-            # Im doing this to get a deterministic DB id for each players card cells,
-            # since its easier to do it this way with the way the code is written for
-            # persisting data to the DB
-            playerID = abs(player.userID) * Recovery.__BING_ID_BUFFER
-
-            # Update player card data
-            for cellsX in player.card.cells:
-                for cell in cellsX:
-                    if cell.getIsDirty():
-                        Recovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Updating player card recovery data for player \"({player.userID})\" Bing({cell.bingIdx}) [{cell.x}][{cell.y}] => {cell.marked}")
-                        dataCard = self.__createPlayerCardData(player.userID,
-                                                               str(playerID + cell.bingIdx),
-                                                               cell.x,
-                                                               cell.y,
-                                                               cell.marked)
-                        self.__commitData(cur, dataCard, "bingid", Recovery.__PLAYER_CARD)
-                    cell.setClean()
+            if player.getIsDirty() or player.card.getIsDirty() or self.cachedMarks.get(player.userID) != player.card.markedMask:
+                cardData = Recovery.__packCard(player.card)
+                if cardData is None:
+                    Recovery.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Player {player.card.getCardOwner()} has an invalid card, skipping player recovery data...")
+                else:
+                    dirtyPlayers.append(self.__createPlayerData(gameID,
+                                                                player.userID,
+                                                                player.card.getCardOwner(),
+                                                                int(player.valid),
+                                                                player.rejectedRequests,
+                                                                player.rejectedTimestamp,
+                                                                int(player.card.hasBingo()),
+                                                                cardData))
+                    self.cachedMarks[player.userID] = player.card.markedMask
 
             # Clean the cache dirty bit
             player.setClean()
             player.card.setClean()
 
+        if dirtyPlayers:
+            Recovery.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Updating recovery data for {len(dirtyPlayers)} players")
+            self.__commitData(cur, dirtyPlayers, "playerid", Recovery.__PLAYERS)
+
+        # The cards recovered from the legacy cell rows are now saved as card blobs
+        if self.hasLegacyCells:
+            Recovery.__LOGGER.log(LogLevel.LEVEL_INFO, f"Removing the migrated legacy card cells for guild {gameID}")
+            cur.execute(f"DELETE FROM {Recovery.__PLAYER_CARD} WHERE id IN (SELECT playerid FROM {Recovery.__PLAYERS} WHERE id = ?)", (gameID,))
+            self.hasLegacyCells = False
+
         # Delete any players that got removed from the game since last time
         for player in self.cachedPlayers - game.players:
             self.__removeData(cur, "playerid", player.userID, Recovery.__PLAYERS)
+            self.cachedMarks.pop(player.userID, None)
 
         self.cachedPlayers = game.players.copy()
 
     def __updateGameCallRequests(self, cur: sqlite3.Cursor, game: Game, gameID: int):
-        tmpNewReq: Dict[int, CallRequest] = {}
+        tmpNewReq: Dict[int, FrozenSet[int]] = {}
+        dirtyRequests: List[Dict[str, Any]] = []
 
-        # Save new or changed requests
-        for request in game.requestedCalls:
-            tmp = self.cachedRequests.pop(request.requestBing.bingIdx, None)
+        # Save new or changed requests. The cache keeps the requesting player IDs rather than the request
+        # itself, since the game merges new requesters into the live request object
+        for request in game.requestedCalls.values():
+            playerIDs = frozenset(p.userID for p in request.players)
+            if self.cachedRequests.pop(request.requestBing.bingIdx, None) != playerIDs:
+                dirtyRequests.append(self.__createCallRequestData(gameID,
+                                                                  request.requestBing.bingIdx,
+                                                                  json.dumps([p.userID for p in request.players])))
 
-            if not tmp or tmp.players != request.players:
-                data = self.__createCallRequestData(gameID,
-                                                    request.requestBing.bingIdx,
-                                                    json.dumps([p.userID for p in request.players]))
-                self.__commitData(cur, data, 'bingid', Recovery.__REQUESTS)
+            tmpNewReq[request.requestBing.bingIdx] = playerIDs
 
-            tmpNewReq[request.requestBing.bingIdx] = request
+        if dirtyRequests:
+            self.__commitData(cur, dirtyRequests, 'bingid', Recovery.__REQUESTS)
 
         # Remove any old requests
-        for request in self.cachedRequests.values():
-            self.__removeData(cur, 'bingid', request.requestBing.bingIdx, Recovery.__REQUESTS)
+        for bingIdx in self.cachedRequests.keys():
+            self.__removeData(cur, 'bingid', bingIdx, Recovery.__REQUESTS)
 
         self.cachedRequests = tmpNewReq
 
-    def __commitData(self, cur: sqlite3.Cursor, data: Dict[Any, Any], idKey: str, tablename: str):
-        # Construct the query
-        columns = ", ".join(data.keys())
-        vals = ", ".join(["?"] * len(data.keys()))
-        updateColumns = ", ".join(f"{k}=excluded.{k}" for k in data.keys() if k != idKey)
-        sql = f"""
-        INSERT INTO {tablename} ({columns})
-        VALUES ({vals})
-        ON CONFLICT({idKey}) DO UPDATE SET {updateColumns};
-        """
-
-        # Insert
-        Recovery.__LOGGER.log(LogLevel.LEVEL_INFO, f"{sql}\n{data}")
-        cur.execute(sql, list(data.values()))
+    def __commitData(self, cur: sqlite3.Cursor, rows: List[Dict[str, Any]], idKey: str, tablename: str):
+        # The upsert is built once per table, every row of a table shares the same columns
+        sql = Recovery.__upsertStatements.get(tablename)
+        if not sql:
+            keys = rows[0].keys()
+            columns = ", ".join(keys)
+            vals = ", ".join(["?"] * len(keys))
+            updateColumns = ", ".join(f"{k}=excluded.{k}" for k in keys if k != idKey)
+            sql = f"""
+            INSERT INTO {tablename} ({columns})
+            VALUES ({vals})
+            ON CONFLICT({idKey}) DO UPDATE SET {updateColumns};
+            """
+            Recovery.__upsertStatements[tablename] = sql
+
+        # Insert, the queued upserts are keyed by their row so the writer only commits the last one
+        values = [list(row.values()) for row in rows]
+        if isinstance(cur, RecoveryBatch):
+            cur.executemany(sql, values, keys=[(tablename, row[idKey]) for row in rows])
+        else:
+            cur.executemany(sql, values)
 
     def __recoverData(self, cur: sqlite3.Cursor, data: Dict[Any, Any], idKey: str, idVal: int, tablename: str) -> List[Dict[Any, Any]]:
         columns = ", ".join(data.keys())
@@ -422,7 +505,13 @@ class Recovery(IRecoveryInterface):
         return [dict(zip(columns, row)) for row in rows]
 
     def __removeData(self, cur: sqlite3.Cursor, idKey: str, idVal: int, tablename: str):
-        cur.execute(f"DELETE FROM {tablename} WHERE {idKey} = ?", (idVal,))
+        sql = f"DELETE FROM {tablename} WHERE {idKey} = ?"
+
+        # Only the deletes of a single row are keyed, deleting by any other column can remove many rows
+        if isinstance(cur, RecoveryBatch) and Recovery.__ROW_KEYS.get(tablename) == idKey:
+            cur.execute(sql, (idVal,), key=(tablename, idVal))
+        else:
+            cur.execute(sql, (idVal,))
 
     def __parseBings(self, gameType: str, bingIDs: Set[int]) -> Set[Bing]:
         binglets = Binglets(gameType)
@@ -431,14 +520,49 @@ class Recovery(IRecoveryInterface):
     def __createCallRequestData(self, id: int, bingid: int, playerids: str) -> Dict[str, Any]:
         return self.__genericTemplDict(**locals())
 
-    def __createPlayerData(self, id: int, playerid: int, name: str, valid: int, rejectedreqs: int, rejectedtime: float, hasbingo: int) -> Dict[str, Any]:
+    def __createPlayerData(self, id: int, playerid: int, name: str, valid: int, rejectedreqs: int, rejectedtime: float, hasbingo: int, card: bytes) -> Dict[str, Any]:
         return self.__genericTemplDict(**locals())
 
-    def __createPlayerCardData(self, id: int, bingid: str, x: int, y: int, marked: int):
-        return self.__genericTemplDict(**locals())
+    @staticmethod
+    def __packCard(card: Card) -> Optional[bytes]:
+        """
+        Packs a card into a blob: the format version and card size, the bing index of each cell
+        (row by row) as unsigned shorts, and then the marked cells bitmask.
+        Cards holding an invalid bing can't be recovered, so they aren't packed
+        """
+        indices = [bing.bingIdx for row in card.cells for bing in row]
+        if any(idx < 0 or idx > 0xFFFF for idx in indices):
+            return None
+
+        header = struct.pack(f"<BB{len(indices)}H", Recovery.__CARD_FORMAT_VERSION, len(card.cells), *indices)
+        return header + card.markedMask.to_bytes((len(indices) + 7) // 8, "little")
+
+    @staticmethod
+    def __unpackCard(cardData: bytes, binglets: Binglets) -> Optional[List[List[Bing]]]:
+        if len(cardData) < 2:
+            return None
+
+        version, cardSize = struct.unpack_from("<BB", cardData)
+        numCells = cardSize * cardSize
+        maskOffset = 2 + 2 * numCells
+        if version != Recovery.__CARD_FORMAT_VERSION or not cardSize or len(cardData) != maskOffset + (numCells + 7) // 8:
+            return None
 
-    def __closeDB(self, conn: sqlite3.Connection):
-        conn.close()
+        indices = struct.unpack_from(f"<{numCells}H", cardData, 2)
+        markedMask = int.from_bytes(cardData[maskOffset:], "little")
+
+        cells: List[List[Bing]] = []
+        for x in range(cardSize):
+            row: List[Bing] = []
+            for y in range(cardSize):
+                cell = x * cardSize + y
+                bing = binglets.getPlacedBing(indices[cell], x, y, bool(markedMask >> cell & 1))
+                if bing.bingIdx < 0:
+                    return None
+                row.append(bing)
+            cells.append(row)
+
+        return cells
 
     @staticmethod
     def __genericTemplDict(**kwargs) -> Dict[str, Any]:
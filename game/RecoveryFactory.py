@@ -0,0 +1,24 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+from .EventLogRecovery import EventLogRecovery
+from .IRecoveryInterface import IRecoveryInterface
+from .Recovery import Recovery
+
+from config.Config import Config
+
+RECOVERY_FORMAT_TABLES = "tables"
+RECOVERY_FORMAT_EVENTS = "events"
+
+def createRecovery(gameID: int) -> IRecoveryInterface:
+    """
+    Creates the recovery backend for a game, as selected by the 'RecoveryFormat' config
+    """
+    if Config().getConfig('RecoveryFormat', RECOVERY_FORMAT_TABLES) == RECOVERY_FORMAT_EVENTS:
+        return EventLogRecovery(gameID)
+    return Recovery(gameID)
@@ -0,0 +1,158 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import threading
+
+from .GameDB import GameDB
+
+from config.ClassLogger import ClassLogger, LogLevel
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+RowKey = Hashable
+
+class RecoveryBatch:
+    """
+    Cursor stand-in that records the statements of a single recovery update, instead of executing them.
+    Statements that write a single row each can be keyed by the rows they write, so the writer only
+    commits the last queued write of every row
+    """
+    def __init__(self, onFailure: Optional[Callable[[], None]] = None):
+        self.statements: List[Tuple[str, List[Sequence[Any]], Optional[List[RowKey]]]] = []
+        self.onFailure = onFailure
+
+    def execute(self, sql: str, parameters: Sequence[Any] = (), key: Optional[RowKey] = None) -> "RecoveryBatch":
+        self.statements.append((sql, [parameters], None if key is None else [key]))
+        return self
+
+    def executemany(self, sql: str, seqOfParameters: Iterable[Sequence[Any]], keys: Optional[Iterable[RowKey]] = None) -> "RecoveryBatch":
+        self.statements.append((sql, list(seqOfParameters), None if keys is None else list(keys)))
+        return self
+
+class RecoveryWriter:
+    """
+    Write-behind journal for the recovery data.
+    Recovery updates are queued as statement batches, and a background thread commits
+    every queued batch (in order) within a single transaction once per write interval.
+    Repeated writes of the same row within an interval are coalesced into the last one.
+    """
+    __instance = None
+    __LOGGER = ClassLogger(__name__)
+
+    def __new__(cls, *args, **kwargs):
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.__initialized = False
+        return cls.__instance
+
+    def __init__(self, interval: float):
+        # Init guard
+        if self.__initialized:
+            return
+        self.__initialized = True
+
+        self.interval = interval
+        self.pending: List[RecoveryBatch] = []
+        self.pendingLock = threading.Lock()
+        self.writeLock = threading.Lock()
+        self.stopEvent = threading.Event()
+
+        self.thread = threading.Thread(target=self._run, name="RecoveryWriter", daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Stops the running writer, if any, and commits everything still queued
+        """
+        if cls.__instance and cls.__instance.__initialized:
+            cls.__instance.stop()
+            cls.__instance = None
+
+    @contextmanager
+    def batch(self, onFailure: Optional[Callable[[], None]] = None) -> Iterator[RecoveryBatch]:
+        """
+        Yields a batch to record a recovery update into, the batch is queued when the block exits.
+        If the batch can't be written, onFailure is called so the owner can write its full data again
+        """
+        batch = RecoveryBatch(onFailure)
+        yield batch
+
+        if batch.statements:
+            with self.pendingLock:
+                self.pending.append(batch)
+
+    def flush(self):
+        """
+        Commits every queued batch right away, on the calling thread
+        """
+        with self.writeLock:
+            with self.pendingLock:
+                batches, self.pending = self.pending, []
+
+            if not batches:
+                return
+
+            statements = RecoveryWriter._coalesce(batches)
+            numRows = sum(len(seqOfParameters) for _, seqOfParameters in statements)
+            RecoveryWriter.__LOGGER.log(LogLevel.LEVEL_DEBUG, f"Writing {len(batches)} recovery updates ({numRows} rows).")
+            try:
+                with GameDB().transaction() as cur:
+                    for sql, seqOfParameters in statements:
+                        cur.executemany(sql, seqOfParameters)
+            except Exception as e:
+                RecoveryWriter.__LOGGER.log(LogLevel.LEVEL_ERROR, f"Failed to write the recovery updates, dropping them: {e}")
+
+                # The owners already consider the dropped updates saved, so have them write everything on their next update
+                for onFailure in {batch.onFailure for batch in batches if batch.onFailure}:
+                    onFailure()
+
+    @staticmethod
+    def _coalesce(batches: List[RecoveryBatch]) -> List[Tuple[str, List[Sequence[Any]]]]:
+        """
+        Merges the queued statements, keeping only the last write of every keyed row.
+        A row keeps the position of its first write, so rows are still written after the rows they reference.
+        Unkeyed statements can touch any row, so the keyed writes queued before them are written first
+        """
+        statements: List[Tuple[str, List[Sequence[Any]]]] = []
+        rows: Dict[RowKey, Tuple[str, Sequence[Any]]] = {}
+
+        def writeRows():
+            for sql, parameters in rows.values():
+                if statements and statements[-1][0] == sql:
+                    statements[-1][1].append(parameters)
+                else:
+                    statements.append((sql, [parameters]))
+            rows.clear()
+
+        for batch in batches:
+            for sql, seqOfParameters, keys in batch.statements:
+                if keys is None:
+                    writeRows()
+                    statements.append((sql, list(seqOfParameters)))
+                    continue
+
+                for key, parameters in zip(keys, seqOfParameters):
+                    # Writes of a row by different statements (e.g. deleted, then added again) are kept in order
+                    if key in rows and rows[key][0] != sql:
+                        writeRows()
+                    rows[key] = (sql, parameters)
+
+        writeRows()
+        return statements
+
+    def stop(self):
+        RecoveryWriter.__LOGGER.log(LogLevel.LEVEL_INFO, "Stopping the recovery writer.")
+        self.stopEvent.set()
+        self.thread.join()
+        self.flush()
+
+    def _run(self):
+        while not self.stopEvent.wait(self.interval):
+            self.flush()
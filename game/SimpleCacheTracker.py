@@ -7,6 +7,9 @@ __maintainer__ = "Schecter Wolf"
 __email__ = "--"
 
 class SimpleCacheTracker:
+    # Attributes that don't dirty the cache when changed (i.e. state that is derived from other tracked data)
+    _UNTRACKED_ATTRS: frozenset = frozenset()
+
     def __init__(self):
         self.__dirty: bool = True
 
@@ -19,6 +22,7 @@ class SimpleCacheTracker:
     def __setattr__(self, name, value):
         hasAttr = hasattr(self, name)
         changedAttr = name != "_SimpleCacheTracker__dirty" and getattr(self, name) != value if hasAttr else True
+        changedAttr = changedAttr and name not in self._UNTRACKED_ATTRS
 
         super().__setattr__(name, value)
 
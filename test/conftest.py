@@ -0,0 +1,34 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import os
+import pytest
+import shutil
+import subprocess
+
+from config.Globals import GLOBALVARS
+from game.GameDB import GameDB
+
+@pytest.fixture(scope="session")
+def templateGameDB(tmp_path_factory) -> str:
+    # Create the DB tables once with the production init script
+    dbFile = str(tmp_path_factory.mktemp("gamedb") / "data.sqlite")
+    if shutil.which("sqlite3"):
+        subprocess.run(["bash", "InitDB.sh"], cwd=f"{GLOBALVARS.PROJ_ROOT}/util", env={**os.environ, "DB_FILE": dbFile},
+                       stdout=subprocess.DEVNULL, check=True)
+    return dbFile
+
+@pytest.fixture(autouse=True)
+def isolated_GameDB(monkeypatch, tmp_path, templateGameDB):
+    # Tests that don't patch in their own DB connection get a throwaway DB, instead of the bots data DB
+    dbFile = tmp_path / "data.sqlite"
+    if os.path.exists(templateGameDB):
+        shutil.copy(templateGameDB, dbFile)
+    monkeypatch.setattr(GLOBALVARS, "FILE_GAME_DB", str(dbFile))
+    yield
+    GameDB().close()
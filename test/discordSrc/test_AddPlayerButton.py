@@ -202,6 +202,34 @@ async def test_InvalidPlayerConfirmFails(mock_GameInterfaceDiscord):
 
     assert Player(Const.TEST_USER_NAME, Const.TEST_MOCK_VALID_USER_ID) not in iface.game.players
 
+@pytest.mark.asyncio
+async def test_ConfirmedJoinsAreAddedInBatches(mock_GameInterfaceDiscord):
+    iface: GameInterfaceDiscord = mock_GameInterfaceDiscord
+    await Utils.setDiscordIfaceToState(iface, GameState.STARTED)
+
+    batches = []
+    addPlayers = iface.game.addPlayers
+    def trackAddPlayers(newPlayers):
+        batches.append(len(newPlayers))
+        return addPlayers(newPlayers)
+    iface.game.addPlayers = trackAddPlayers
+
+    # The first join is added right away, the joins confirmed meanwhile are added together afterwards
+    addButton = AddPlayerButton(Const.TEST_GUILD_ID)
+    for i in range(3):
+        mockInteraction = Mocks.makeMockInteraction()
+        mockInteraction.user = Mocks.makeMockUser(f"TestUser{i}", Const.TEST_MOCK_VALID_USER_ID + i)
+        await addButton.confirm_callback(mockInteraction)
+
+    for _ in range(100):
+        if not addButton.addingJoins:
+            break
+        await asyncio.sleep(0.01)
+
+    assert batches == [1, 2]
+    assert not addButton.pendingJoins
+    assert len(iface.game.players) == 3
+
 @pytest.mark.asyncio
 async def test_InvalidGameStateAddButtonFails(mock_GameInterfaceDiscord):
     iface: GameInterfaceDiscord = mock_GameInterfaceDiscord
@@ -0,0 +1,68 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import pytest
+
+import test.utils.Const as Const
+import test.utils.Utils as Utils
+
+from config.Globals import GLOBALVARS
+from discordSrc.AvatarCache import AvatarCache
+
+from PIL import Image
+from io import BytesIO
+from typing import List
+from unittest.mock import MagicMock
+
+def makeMockUser(userID: int, avatarHash: str):
+    mockUser = MagicMock()
+    mockUser.id = userID
+    mockUser.display_avatar.key = avatarHash
+    mockUser.display_avatar.with_size.side_effect = lambda size: MagicMock(url=f"https://cdn/{userID}/{avatarHash}?size={size}")
+    return mockUser
+
+@pytest.fixture(scope="function")
+def mock_AvatarCache(monkeypatch, tmp_path):
+    monkeypatch.setattr(GLOBALVARS, "DIR_AVATAR_CACHE", str(tmp_path))
+    monkeypatch.setattr(AvatarCache, "_AvatarCache__instance", None)
+    Utils.overrideConfig(monkeypatch, "AvatarCacheSize", 2)
+
+    # Record the downloads instead of going to the CDN
+    downloads: List[str] = []
+    async def downloadAvatar(self, url: str) -> bytes:
+        downloads.append(url)
+        with BytesIO() as data:
+            Image.new("RGBA", (512, 512), (255, 0, 0, 255)).save(data, "PNG")
+            return data.getvalue()
+    monkeypatch.setattr(AvatarCache, "_downloadAvatar", downloadAvatar)
+
+    return AvatarCache(), downloads
+
+@pytest.mark.asyncio
+async def test_AvatarsAreOnlyDownloadedOnce(mock_AvatarCache):
+    cache, downloads = mock_AvatarCache
+    user = makeMockUser(Const.TEST_MOCK_VALID_USER_ID, "hash1")
+
+    avatar = await cache.getAvatar(user, 441)
+    assert avatar and avatar.size == (441, 441)
+    assert await cache.getAvatar(user, 441) is avatar
+    assert downloads == [f"https://cdn/{user.id}/hash1?size=512"]
+
+    # Evicted from memory, but still cached on disk
+    for i in range(2):
+        await cache.getAvatar(makeMockUser(Const.TEST_MOCK_VALID_USER_ID + i + 1, "hash1"), 441)
+    assert len(cache.entries) == 2
+    avatar = await cache.getAvatar(user, 441)
+    assert avatar and avatar.size == (441, 441)
+    assert len(downloads) == 3
+
+    # A changed avatar is downloaded again, and replaces the old one on disk
+    user.display_avatar.key = "hash2"
+    await cache.getAvatar(user, 441)
+    assert len(downloads) == 4
+    assert [p.name for p in cache.cacheDir.glob(f"{user.id}_*")] == [f"{user.id}_hash2_441.png"]
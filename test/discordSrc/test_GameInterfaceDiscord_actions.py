@@ -24,7 +24,7 @@ from game.Game import GameState
 from game.Player import Player
 from game.Result import Result
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from typing import Optional, cast
 
 @pytest.fixture(scope="function")
@@ -206,6 +206,44 @@ async def test_AddingInvalidPlayerFails(mock_GameInterfaceDiscordWNODebug):
     assert "already playing" in result.responseMsg
     assert len(iface.game.players) == 1
 
+@pytest.mark.asyncio
+async def test_SuccessfullyAddPlayers(mock_GameInterfaceDiscordWNODebug):
+    iface: GameInterfaceDiscord = mock_GameInterfaceDiscordWNODebug
+    await Utils.setDiscordIfaceToState(iface, GameState.STARTED)
+
+    interactions = []
+    for i, name in enumerate(["Schecter Wolf", "Maxamili", "NoDMPlayer"]):
+        mockInteraction = Mocks.makeMockInteraction()
+        mockInteraction.user = Mocks.makeMockUser(name, Const.TEST_MOCK_VALID_USER_ID + i)
+        interactions.append(mockInteraction)
+
+    # Users without a DM channel can't get their card outside of debug mode
+    interactions[2].user.dm_channel = None
+    iface.channelBingo.refreshGameStatus = AsyncMock()
+    mockFinalize = MagicMock()
+    data = ActionData(
+                interactions=interactions,
+                **{ActionData.FINALIZE_FUNCT: mockFinalize.finalize}
+            )
+
+    result: Result = await iface.addPlayers.__wrapped__(iface, data)
+
+    assert result.result is True
+    assert [r.result for r in result.additional] == [True, True, False]
+    assert "empty DM channel" in result.additional[2].responseMsg
+    assert len(iface.game.players) == 2
+    for interaction, playerResult in zip(interactions[:2], result.additional):
+        player: Player = playerResult.additional
+        assert player in iface.game.players
+        assert player.card.getCardOwner() == interaction.user.display_name
+        assert player.ctx._channel == interaction.user.dm_channel
+        assert cast(Classes.TestingUserDMChannel, player.ctx).setViewStartedCalled is True
+
+    # One DM view per admitted player, and a single game status refresh for the whole batch
+    assert sum(1 for player in iface.game.players if cast(Classes.TestingUserDMChannel, player.ctx).setViewStartedCalled) == 2
+    iface.channelBingo.refreshGameStatus.assert_awaited_once()
+    mockFinalize.finalize.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_AddingPlayerInInvalidStatesFails(mock_GameInterfaceDiscord):
     iface: GameInterfaceDiscord = mock_GameInterfaceDiscord
@@ -272,7 +310,7 @@ async def test_SuccessfullyKickPlayer(mock_GameInterfaceDiscordWNODebug):
     assert result.additional == player
     assert Const.TEST_MOCK_VALID_USER_ID in iface.game.kickedPlayers
     assert player not in iface.game.players
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         assert req.hasPlayer(player) is False
     assert cast(Classes.TestingBingoChannel, iface.channelBingo).refreshGameStatusCalled is True
     assert cast(Classes.TestingUserDMChannel, player.ctx).setViewKickedCalled is True
@@ -315,7 +353,7 @@ async def test_KickingPlayerInValidStateSucceeds(mock_GameInterfaceDiscordWNODeb
         assert result.additional == player
         assert playerID in iface.game.kickedPlayers
         assert player not in iface.game.players
-        for req in iface.game.requestedCalls:
+        for req in iface.game.requestedCalls.values():
             assert req.hasPlayer(player) is False
         assert cast(Classes.TestingBingoChannel, iface.channelBingo).refreshGameStatusCalled is True
         assert cast(Classes.TestingUserDMChannel, result.additional.ctx).setViewKickedCalled is True
@@ -405,7 +443,7 @@ async def test_SuccessfullyBanPlayer(mock_GameInterfaceDiscordWNODebug):
     assert player in iface.game.players # Make sure the original player is not banned
     assert result.additional not in iface.game.players
     assert iface.game.bannedPlayers.isBanned(playerBanned.userID)
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         assert req.hasPlayer(playerBanned) is False
     assert cast(Classes.TestingBingoChannel, iface.channelBingo).refreshGameStatusCalled is True
     assert cast(Classes.TestingUserDMChannel, playerBanned.ctx).setViewKickedCalled is True
@@ -471,7 +509,7 @@ async def test_BanningPlayerInValidStatesSucceeds(mock_GameInterfaceDiscordWNODe
             assert cast(Classes.TestingUserDMChannel, result.additional.ctx).setViewKickedCalled is True
         assert player not in iface.game.players
         assert iface.game.bannedPlayers.isBanned(playerID)
-        for req in iface.game.requestedCalls:
+        for req in iface.game.requestedCalls.values():
             assert req.hasPlayer(player) is False
 
         playerID += 1
@@ -565,7 +603,7 @@ async def test_SuccessfullyMakingCall(mock_GameInterfaceDiscordWNODebug):
     assert bing in iface.game.calledBings
     assert player in markedPlayers
     assert player.card.isCellMarked(bing.x, bing.y)
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         assert req.requestBing.bingIdx is not bing.bingIdx
     assert mockTaskProcessor.hasNoPendingTasks() is True
     assert len(mockTaskProcessor.taskIDs) == 0
@@ -667,7 +705,7 @@ async def test_MakingInvalidCallFails(mock_GameInterfaceDiscordWNODebug, monkeyp
     assert len(iface.game.calledBings) == 0
     assert player.card.getNumMarked() == 0
     reqExists = False
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         if req.requestBing.bingIdx == bing.bingIdx:
             reqExists = True
     assert reqExists is True
@@ -727,7 +765,7 @@ async def test_MakingCallFromInvalidStateFails(mock_GameInterfaceDiscordWNODebug
             assert "Cannot make a call" in result.responseMsg
         assert len(iface.game.calledBings) == 0
         reqExists = False
-        for req in iface.game.requestedCalls:
+        for req in iface.game.requestedCalls.values():
             if req.requestBing.bingIdx == idx:
                 reqExists = True
         assert reqExists is False
@@ -773,7 +811,7 @@ async def test_SuccessfullyMakingCallRequest(mock_GameInterfaceDiscordWNODebug):
     assert result.additional == req
     assert "Request for" in result.responseMsg
     assert len(iface.game.requestedCalls) == 1
-    assert iface.game.requestedCalls[0] == req
+    assert iface.game.getRequests()[0] == req
     assert cast(Classes.TestingAdminChannel, iface.channelAdmin).addCallRequestCalled is True
     assert cast(Classes.TestingUserDMChannel, player.ctx).sendNoticeCalled is True
     assert "Request for" in cast(Classes.TestingUserDMChannel, player.ctx).noticeItems[0]
@@ -803,7 +841,9 @@ async def test_SuccessfullyMakingCallRequestForMultiPlayers(mock_GameInterfaceDi
 
     # Make sure both players have the same bing in their cards
     if not player2.card.getBingFromID(bing.bingIdx):
-        player2.card.cells[0][0] = Bing(bing.bingStr, bing.bingIdx)
+        cells = player2.card.getCardBings()
+        cells[0][0] = Bing(bing.bingStr, bing.bingIdx)
+        player2.card.setCells(cells)
 
     # Make a call request for player 1
     mockInteraction = Mocks.makeMockInteraction()
@@ -824,7 +864,7 @@ async def test_SuccessfullyMakingCallRequestForMultiPlayers(mock_GameInterfaceDi
     assert result.additional == req
     assert "Request for" in result.responseMsg
     assert len(iface.game.requestedCalls) == 1
-    assert iface.game.requestedCalls[0] == req
+    assert iface.game.getRequests()[0] == req
     assert len(req.players) == 2
     assert player in req.players and player2 in req.players
     assert cast(Classes.TestingAdminChannel, iface.channelAdmin).addCallRequestCalled is True
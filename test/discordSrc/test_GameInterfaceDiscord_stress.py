@@ -642,7 +642,7 @@ async def _chaosMakeCall(iface: GameInterfaceDiscord, timeout):
         assert result.result is True, f"Failed to make call: {result.responseMsg}"
         assert bing in iface.game.calledBings
         # Make sure a request with the same ID does not exist
-        for req in iface.game.requestedCalls:
+        for req in iface.game.requestedCalls.values():
             assert req.requestBing.bingIdx != bing.bingIdx, f"Request for bing index ({bing.bingIdx}) still exists after the make call action."
     assert elapsedTime <= timeout, f"Make call for bing (Index {bing.bingIdx}) timeout exceeded. Took {elapsedTime} seconds."
 
@@ -690,7 +690,7 @@ async def _chaosRequestCall(iface: GameInterfaceDiscord, timeout):
     # Check if the bing has already been requested before
     numPlayersRequested = 0
     requestExists = False
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         if req.requestBing.bingIdx == bing.bingIdx:
             requestExists = True
             numPlayersRequested = len(req.players)
@@ -731,7 +731,7 @@ async def _chaosDeleteRequest(iface: GameInterfaceDiscord, timeout):
 
     # Check if the bing has already been requested before
     hasRequest = False
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         if req.requestBing.bingIdx == bing.bingIdx:
             hasRequest = True
             break
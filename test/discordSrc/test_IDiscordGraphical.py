@@ -0,0 +1,48 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = ""
+
+import asyncio
+import discord
+import pytest
+import time
+
+import test.utils.Mocks as Mocks
+
+from discordSrc.IDiscordGraphical import IDiscordGraphical
+from game.PersistentStats import PlayerOrdinal
+
+from PIL import Image
+from unittest.mock import MagicMock
+
+class MockGraphical(IDiscordGraphical):
+    async def createAsset(self) -> discord.File:
+        return discord.File("")
+
+@pytest.mark.asyncio
+async def test_AvatarsAreFetchedConcurrently(monkeypatch):
+    monkeypatch.setattr(IDiscordGraphical, "_IDiscordGraphical__AVATAR_FETCH_TIMEOUT", 0.5)
+    fetched = Image.new("RGBA", (10, 10))
+
+    # Player 1 is slow, player 2 fails, and the rest take a moment each
+    async def getDiscordAvatar(self, playerOrd: PlayerOrdinal, avatarSize: int) -> Image.Image:
+        if playerOrd.playerID == 1:
+            await asyncio.sleep(10)
+        elif playerOrd.playerID == 2:
+            raise discord.NotFound(MagicMock(status=404), "Unknown User")
+        await asyncio.sleep(0.2)
+        return fetched
+    monkeypatch.setattr(IDiscordGraphical, "_getDiscordAvatar", getDiscordAvatar)
+
+    players = [PlayerOrdinal(i) for i in range(4)]
+    start = time.monotonic()
+    avatars = await MockGraphical(Mocks.makeMockBot())._getDiscordAvatars(players, 10)
+
+    assert time.monotonic() - start < 1
+    assert avatars[0] is fetched and avatars[3] is fetched
+    assert avatars[1] is not fetched and avatars[1].size == (10, 10)
+    assert avatars[2] is not fetched and avatars[2].size == (10, 10)
@@ -136,8 +136,8 @@ async def test_SuccessfullyMakeCallRequest(mock_GameInterfaceDiscord):
     assert mrv._interactExpired == False
     assert len(mrv.select._values) == 0
     assert len(iface.game.requestedCalls) == 1
-    assert iface.game.requestedCalls[0].requestBing.bingIdx == playerBings[0].bingIdx
-    assert iface.game.requestedCalls[0].getRequesterName() == player.card.getCardOwner()
+    assert iface.game.getRequests()[0].requestBing.bingIdx == playerBings[0].bingIdx
+    assert iface.game.getRequests()[0].getRequesterName() == player.card.getCardOwner()
     mockInteraction.response.defer.assert_called_once()
     mockInteraction.message.edit.assert_called_once_with(view=mrv)
 
@@ -222,7 +222,7 @@ async def test_FailToMakeCallRequestWExpiredInteract(mock_GameInterfaceDiscord):
     await asyncio.sleep(0)
 
     assert len(iface.game.requestedCalls) == 1
-    assert iface.game.requestedCalls[0].requestBing.bingIdx == playerBings[0].bingIdx
+    assert iface.game.getRequests()[0].requestBing.bingIdx == playerBings[0].bingIdx
 
 @pytest.mark.asyncio
 async def test_FailToMakeCallRequestWInvalidBing(mock_GameInterfaceDiscord):
@@ -352,7 +352,7 @@ async def test_FailToCallRequestWhileTimedOut(mock_GameInterfaceDiscord, monkeyp
         await asyncio.sleep(0)
 
     # Reject the call requests
-    for req in iface.game.requestedCalls:
+    for req in iface.game.requestedCalls.values():
         _ = iface.deleteRequest(ActionData(index=req.requestBing.bingIdx))
         await asyncio.sleep(0)
 
@@ -0,0 +1,61 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = ""
+
+import asyncio
+import pytest
+import threading
+import time
+
+import test.utils.Const as Const
+import test.utils.Utils as Utils
+
+from discordSrc.RenderService import RenderService
+from game.CardImgCreator import CardImgCreator
+from game.Game import Game
+
+from PIL import Image
+from unittest.mock import MagicMock
+
+@pytest.mark.asyncio
+async def test_RendersDontBlockTheEventLoop():
+    ticks = 0
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    def slowRender(value: int) -> str:
+        time.sleep(0.3)
+        return f"{threading.current_thread().name}:{value}"
+
+    ticker = asyncio.create_task(tick())
+    result = await RenderService().render(slowRender, 5)
+    ticker.cancel()
+
+    assert result.startswith("Render") and result.endswith(":5")
+    assert ticks > 5
+
+@pytest.mark.asyncio
+async def test_CardIsRenderedByTheWorkers(monkeypatch):
+    Utils.disableBannedData(monkeypatch)
+    game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    player = game.addPlayer("TestPlayer", Const.TEST_MOCK_VALID_USER_ID).additional
+    player.card.markCell(player.card.getCardBings()[0][0])
+    cellsStr, markedMask = player.card.getCellsStr(), player.card.markedMask
+    data = await RenderService().render(CardImgCreator().renderGraphicalCard, cellsStr, markedMask)
+
+    assert Image.open(data).format == "PNG"
+    assert data.getvalue() == CardImgCreator().createGraphicalCard(player.card).getvalue()
+
+    # The render only reads the snapshot, marking the card afterwards doesn't change it
+    player.card.markCell(player.card.getCardBings()[0][1])
+    data = await RenderService().render(CardImgCreator().renderGraphicalCard, cellsStr, markedMask)
+    assert data.getvalue() != CardImgCreator().createGraphicalCard(player.card).getvalue()
@@ -0,0 +1,46 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import test.utils.Const as Const
+
+from game.Bing import Bing
+from game.Binglets import Binglets
+
+def test_BingIsLookedUpByIndex():
+    binglets = Binglets(Const.TEST_GAME_TYPE)
+    for proto in binglets.getBingletsCopy():
+        bing: Bing = binglets.getBingFromIndex(proto.bingIdx)
+        assert bing == proto
+        assert (bing.bingStr, bing.category) == (proto.bingStr, proto.category)
+
+    assert binglets.getBingFromIndex(0).bingStr == "FREE SPACE"
+    assert binglets.getBingFromIndex(-5).bingIdx == -1
+
+def test_LookedUpBingIsIndependentCopy():
+    binglets = Binglets(Const.TEST_GAME_TYPE)
+    bing: Bing = binglets.getBingFromIndex(1)
+    bing.marked = True
+    bing.x = 3
+
+    other: Bing = binglets.getBingFromIndex(1)
+    assert other is not bing
+    assert not other.marked
+    assert other.x == 0
+
+def test_PlacedBingIsCleanCopy():
+    binglets = Binglets(Const.TEST_GAME_TYPE)
+    proto: Bing = binglets.getBingFromIndex(1)
+    bing: Bing = binglets.getPlacedBing(1, 2, 3, True)
+    assert bing == proto
+    assert (bing.bingStr, bing.category) == (proto.bingStr, proto.category)
+    assert (bing.x, bing.y, bing.marked) == (2, 3, True)
+    assert not bing.getIsDirty()
+
+    # The copy is still change tracked
+    bing.marked = False
+    assert bing.getIsDirty()
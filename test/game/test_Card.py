@@ -0,0 +1,90 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import pytest
+
+import test.utils.Const as Const
+import test.utils.Utils as Utils
+
+from game.Bing import Bing
+from game.Binglets import Binglets
+from game.Card import Card
+
+@pytest.fixture(scope="function")
+def card(monkeypatch) -> Card:
+    Utils.setUseFreeSpace(monkeypatch, False)
+
+    card = Card(Const.TEST_USER_NAME)
+    card.generateNewCard(Const.TEST_GAME_TYPE)
+    return card
+
+def test_GeneratedCardHonorsCategoryLimits(card):
+    binglets = Binglets(Const.TEST_GAME_TYPE)
+    limits = binglets.getLimits()
+    assert limits
+
+    for _ in range(50):
+        card.generateNewCard(Const.TEST_GAME_TYPE)
+        bings = [bing for row in card.getCardBings() for bing in row]
+        assert len({bing.bingIdx for bing in bings}) == card._cardSize * card._cardSize
+        assert all(bing.bingIdx > 0 for bing in bings)
+
+        for category, limit in limits.items():
+            assert sum(1 for bing in bings if bing.category == category) <= limit
+
+def test_CellsAreLookedUpByBingIndex(card):
+    for x, row in enumerate(card.getCardBings()):
+        for y, bing in enumerate(row):
+            found = card.getBingFromID(bing.bingIdx)
+            assert found is bing
+            assert (found.x, found.y) == (x, y)
+
+def test_MarkingUnknownBingIsRejected(card):
+    assert card.getBingFromID(-1) is None
+    assert not card.markCell(Bing("", -1))
+    assert card.getNumMarked() == 0
+
+def test_SetCellsReindexesCard(card):
+    cells = card.getCardBings()
+    other = Card("OtherPlayer")
+    other.setCells(cells)
+
+    bing = cells[1][2]
+    assert other.getBingFromID(bing.bingIdx) is bing
+    assert other.markCell(bing)
+    assert other.isCellMarked(1, 2)
+
+@pytest.mark.parametrize("line", ["row", "col", "diagA", "diagB"])
+def test_CompletingAnyLineIsABingo(card, line):
+    size = card._cardSize
+    cells = card.getCardBings()
+    lines = {
+        "row": [cells[2][i] for i in range(size)],
+        "col": [cells[i][3] for i in range(size)],
+        "diagA": [cells[i][i] for i in range(size)],
+        "diagB": [cells[i][size - 1 - i] for i in range(size)],
+    }
+
+    for bing in lines[line][:-1]:
+        card.markCell(bing)
+    assert not card.hasBingo()
+
+    card.markCell(lines[line][-1])
+    assert card.hasBingo()
+    assert card.getNumMarked() == size
+
+def test_UnmarkingLineLosesBingo(card):
+    size = card._cardSize
+    cells = card.getCardBings()
+    for i in range(size):
+        card.markCell(cells[i][size - 1 - i])
+    assert card.hasBingo()
+
+    assert card.unmarkCell(cells[0][size - 1])
+    assert not card.hasBingo()
+    assert card.getNumMarked() == size - 1
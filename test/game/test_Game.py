@@ -0,0 +1,235 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import pytest
+
+import test.utils.Const as Const
+import test.utils.Utils as Utils
+
+from game.Bing import Bing
+from game.Binglets import Binglets
+from game.CallRequest import CallRequest
+from game.Game import Game, GameState
+from game.Player import Player
+from game.Result import Result
+
+from unittest.mock import MagicMock
+from typing import List
+
+@pytest.fixture(scope="function")
+def startedGame(monkeypatch) -> Game:
+    Utils.disableBannedData(monkeypatch)
+    Utils.setRetroactiveCalls(monkeypatch, True)
+
+    game: Game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    assert game.state is GameState.STARTED
+
+    return game
+
+def addPlayers(game: Game, numPlayers: int) -> List[Player]:
+    players: List[Player] = []
+    for i in range(numPlayers):
+        result: Result = game.addPlayer(f"TestPlayer{i+1}", Const.TEST_MOCK_VALID_USER_ID + i)
+        assert result.result
+        players.append(result.additional)
+    return players
+
+def test_CallOnlyMarksPlayersHoldingTheSlot(startedGame):
+    game: Game = startedGame
+    players = addPlayers(game, 10)
+
+    bing: Bing = players[0].card.getCardBings()[0][1]
+    holders = {p for p in players if p.card.getBingFromID(bing.bingIdx)}
+
+    result: Result = game.makeCall(bing.bingIdx)
+    assert result.result
+
+    markedPlayers, _ = result.additional
+    assert markedPlayers == holders
+    for player in players:
+        cell = player.card.getBingFromID(bing.bingIdx)
+        assert (cell is not None and cell.marked) == (player in holders)
+
+def test_KickedPlayerIsRemovedFromCallIndex(startedGame):
+    game: Game = startedGame
+    players = addPlayers(game, 3)
+    kicked = players[0]
+
+    assert game.kickPlayer(kicked.userID).result
+    for holders in game.bingHolders.values():
+        assert kicked not in holders
+
+    bing: Bing = kicked.card.getCardBings()[0][1]
+    result: Result = game.makeCall(bing.bingIdx)
+    assert result.result
+    assert kicked not in result.additional[0]
+    assert not kicked.card.getBingFromID(bing.bingIdx).marked
+
+def test_RetroactiveCallsAreIndexedForNewPlayers(startedGame):
+    game: Game = startedGame
+    first = addPlayers(game, 1)[0]
+
+    bing: Bing = first.card.getCardBings()[0][1]
+    assert game.makeCall(bing.bingIdx).result
+
+    second: Player = game.addPlayer("LatePlayer", Const.TEST_MOCK_VALID_USER_ID + 100).additional
+    cell = second.card.getBingFromID(bing.bingIdx)
+    if cell:
+        assert cell.marked
+        assert game.bingHolders[bing.bingIdx][second] is cell
+
+def test_CallReportsNewBingosOnce(startedGame):
+    game: Game = startedGame
+    player = addPlayers(game, 1)[0]
+    cells = player.card.getCardBings()
+
+    for i in range(len(cells) - 1):
+        result: Result = game.makeCall(cells[i][0].bingIdx)
+        assert result.result
+        assert player not in result.additional[1]
+
+    result: Result = game.makeCall(cells[-1][0].bingIdx)
+    assert player in result.additional[1]
+    assert player.card.getCardOwner() in game.getPlayerBingos()
+
+    result: Result = game.makeCall(cells[-1][1].bingIdx)
+    assert player not in result.additional[1]
+
+def test_CasualMarksAreCountedByCalls(startedGame):
+    game: Game = startedGame
+    player = addPlayers(game, 1)[0]
+    cells = player.card.getCardBings()
+
+    for i in range(len(cells) - 1):
+        assert game.requestCallCasual(CallRequest(player, cells[0][i])).result
+    assert not player.card.hasBingo()
+
+    result: Result = game.makeCall(cells[0][-1].bingIdx)
+    assert result.result
+    assert player in result.additional[1]
+
+def test_BingosMadeOutsideOfCallsAreAnnouncedByTheNextCall(startedGame):
+    game: Game = startedGame
+    player = addPlayers(game, 1)[0]
+    cells = player.card.getCardBings()
+
+    # The casual mark itself completes the row
+    for i in range(len(cells)):
+        assert game.requestCallCasual(CallRequest(player, cells[0][i])).result
+    assert player.card.hasBingo()
+
+    # Call slots that aren't on the players card
+    cardIndices = {bing.bingIdx for row in cells for bing in row}
+    otherIndices = [i for i in Binglets(Const.TEST_GAME_TYPE).getBingIndices() if i not in cardIndices]
+    result: Result = game.makeCall(otherIndices[0])
+    assert player in result.additional[1]
+    assert player not in game.makeCall(otherIndices[1]).additional[1]
+
+    # A late player whose card gets a bingo from the retroactive calls
+    for index in Binglets(Const.TEST_GAME_TYPE).getBingIndices():
+        game.makeCall(index)
+    late: Player = game.addPlayer("LatePlayer", Const.TEST_MOCK_VALID_USER_ID + 100).additional
+    assert late.card.hasBingo()
+    assert late.card.getCardOwner() in game.getPlayerBingos()
+    assert late in game.makeCall(otherIndices[0]).additional[1]
+
+def test_PlayerRegistryFollowsJoinsAndKicks(startedGame):
+    game: Game = startedGame
+    players = addPlayers(game, 5)
+
+    for player in players:
+        result: Result = game.getPlayer(player.userID)
+        assert result.result
+        assert result.additional is player
+        assert player in game.playersByCard[player.card.getCardID()]
+
+    kicked = players[2]
+    assert game.kickPlayer(kicked.userID).result
+    assert not game.getPlayer(kicked.userID).result
+    assert kicked.userID not in game.playersByID
+    assert kicked not in game.playersByCard.get(kicked.card.getCardID(), [])
+
+    game.stopGame()
+    assert not game.playersByID
+    assert not game.playersByCard
+
+def test_RequestsAreIndexedBySlotAndPlayer(startedGame):
+    game: Game = startedGame
+    players = addPlayers(game, 3)
+    bings: List[Bing] = [row[0] for row in players[0].card.getCardBings()]
+
+    for bing in bings[:2]:
+        assert game.requestCall(CallRequest(players[0], bing)).result
+    assert game.getNumRequestByPlayer(players[0]) == 2
+    assert [req.requestBing.bingIdx for req in game.getRequests()] == [bing.bingIdx for bing in bings[:2]]
+
+    # Merging the same request from another player is counted for that player only
+    shared = CallRequest(players[1], bings[0])
+    shared.players = {players[0], players[1]}
+    assert game.requestCall(shared).result
+    assert game.getNumRequestByPlayer(players[0]) == 2
+    assert game.getNumRequestByPlayer(players[1]) == 1
+    assert game.playerHasRequest(players[1], bings[0].bingIdx)
+    assert not game.playerHasRequest(players[1], bings[1].bingIdx)
+
+    assert game.deleteRequest(bings[0].bingIdx, True).result
+    assert game.getNumRequestByPlayer(players[0]) == 1
+    assert game.getNumRequestByPlayer(players[1]) == 0
+
+    assert game.kickPlayer(players[0].userID).result
+    assert game.getNumRequestByPlayer(players[0]) == 0
+    assert not game.getRequests()[0].hasPlayer(players[0])
+
+def test_CardsAreReproducibleFromGameSeed(startedGame, monkeypatch):
+    Utils.overrideConfig(monkeypatch, "CardSeed", 1234)
+    dealtCards: List[List[str]] = []
+
+    for _ in range(2):
+        game: Game = startedGame
+        game.stopGame()
+        game.state = GameState.IDLE
+        assert game.startGame().result
+        assert game.cardSeed == 1234
+
+        players = addPlayers(game, 5)
+        cardIDs = [player.card.getCardID() for player in players]
+        assert len(set(cardIDs)) == len(cardIDs)
+        dealtCards.append(cardIDs)
+
+    assert dealtCards[0] == dealtCards[1]
+
+def test_RecoveredCardKeepsItsCardID(startedGame):
+    game: Game = startedGame
+    player = addPlayers(game, 1)[0]
+
+    recovered = Player(player.card.getCardOwner(), player.userID)
+    recovered.card.setCells(player.card.getCardBings())
+    assert recovered.card.getCardID() == player.card.getCardID()
+
+def test_BatchJoinAdmitsEligiblePlayersWithOneRecoveryUpdate(startedGame):
+    game: Game = startedGame
+    game.recovery = MagicMock()
+    first = addPlayers(game, 1)[0]
+    game.recovery.reset_mock()
+
+    newPlayers = [(f"BatchPlayer{i+1}", Const.TEST_MOCK_VALID_USER_ID + 10 + i) for i in range(5)]
+    newPlayers.append((first.card.getCardOwner(), first.userID))
+
+    result: Result = game.addPlayers(newPlayers)
+    assert result.result
+    assert [res.result for res in result.additional] == [True] * 5 + [False]
+    assert len(game.players) == 6
+    for res in result.additional[:5]:
+        assert game.getPlayer(res.additional.userID).additional is res.additional
+    game.recovery.updateRecovery.assert_called_once_with(game)
+
+    game.recovery.reset_mock()
+    assert not game.addPlayers([(first.card.getCardOwner(), first.userID)]).result
+    game.recovery.updateRecovery.assert_not_called()
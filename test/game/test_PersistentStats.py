@@ -0,0 +1,230 @@
+__author__ = "Schecter Wolf"
+__copyright__ = "Copyright (C) 2026 by John Torres"
+__credits__ = ["Schecter Wolf"]
+__license__ = "GPLv3"
+__version__ = "1.0.0"
+__maintainer__ = "Schecter Wolf"
+__email__ = "--"
+
+import datetime
+import pytest
+import random
+import sqlite3
+
+import test.utils.Const as Const
+import game.PersistentStats as PersistentStatsModule
+
+from game.GameDB import GameDB
+from game.PersistentStats import PersistentStats
+from game.Player import Player
+
+from typing import List
+
+@pytest.fixture(scope="function")
+def mock_Database(monkeypatch):
+    conn = sqlite3.connect(":memory:")
+
+    # Patch the shared DB connection to use our in-memory connection
+    monkeypatch.setattr(GameDB, "_GameDB__conn", conn)
+
+    # This table is defined in the InitDB.sh script for the production
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS PLAYERS (
+            id INTEGER PRIMARY KEY,
+            userid INTEGER NOT NULL,
+            guildid INTEGER DEFAULT 0,
+            name TEXT NOT NULL,
+            bingos INTEGER DEFAULT 0,
+            calls INTEGER DEFAULT 0,
+            games INTEGER DEFAULT 0,
+            bingosmonth INTEGER DEFAULT 0,
+            callsmonth INTEGER DEFAULT 0,
+            gamesmonth INTEGER DEFAULT 0,
+            timestampmonth INTEGER DEFAULT 0,
+            bingosweek INTEGER DEFAULT 0,
+            callsweek INTEGER DEFAULT 0,
+            gamesweek INTEGER DEFAULT 0,
+            timestampweek INTEGER DEFAULT 0
+        )
+    """)
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS PLAYERS_GUILD_USER ON PLAYERS (guildid, userid)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS PLAYERSTATS (
+            guildid INTEGER NOT NULL,
+            userid INTEGER NOT NULL,
+            period TEXT NOT NULL,
+            bingos INTEGER DEFAULT 0,
+            calls INTEGER DEFAULT 0,
+            games INTEGER DEFAULT 0,
+            PRIMARY KEY (guildid, period, userid)
+        )
+    """)
+    conn.commit()
+
+    yield conn
+
+    conn.close()
+
+def makePlayers(numPlayers: int) -> List[Player]:
+    return [Player(f"TestPlayer{i+1}", Const.TEST_MOCK_VALID_USER_ID + i) for i in range(numPlayers)]
+
+def test_SavedStatsAreUpdatedInPlace(mock_Database):
+    conn: sqlite3.Connection = mock_Database
+    players = makePlayers(5)
+
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+    stats.updateFromPlayers(players)
+    stats.updateFromPlayers(players)
+
+    rows = conn.execute("SELECT userid, games FROM PLAYERS WHERE guildid = ?", (Const.TEST_GUILD_ID,)).fetchall()
+    assert sorted(rows) == [(player.userID, 2) for player in players]
+    assert all(pd.dbID for pd in stats.allPlayers)
+
+    # A fresh load reads back the same players
+    reloaded = PersistentStats(Const.TEST_GUILD_ID)
+    for player in players:
+        playerOrd = reloaded.getPlayer(player.userID)
+        assert playerOrd is not None
+        assert playerOrd.stats[PersistentStats.ITEM_TOTAL][PersistentStats.DATA_ITEM_GAMES] == 2
+
+def test_StatsAreKeptPerGuild(mock_Database):
+    conn: sqlite3.Connection = mock_Database
+    players = makePlayers(3)
+
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+    otherStats = PersistentStats(Const.TEST_GUILD_ID + 1)
+    stats.updateFromPlayers(players)
+    otherStats.updateFromPlayers(players[:1])
+    assert conn.execute("SELECT COUNT(*) FROM PLAYERS").fetchone()[0] == 4
+
+    # Removing a player only removes them from their guild
+    stats.removePlayer(players[0].userID)
+    assert not stats.getPlayer(players[0].userID)
+    assert players[0].userID not in stats.playersByID
+    assert len(stats.playersByID) == len(stats.allPlayers) == 2
+    assert not PersistentStats(Const.TEST_GUILD_ID).getPlayer(players[0].userID)
+    assert PersistentStats(Const.TEST_GUILD_ID + 1).getPlayer(players[0].userID)
+
+def test_OnlyChangedPlayersAreSaved(mock_Database):
+    conn: sqlite3.Connection = mock_Database
+    players = makePlayers(6)
+
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+    stats.updateFromPlayers(players)
+    assert not stats.dirtyPlayers
+
+    # Tag the saved rows, only the rows of the players in the next game get overwritten
+    conn.execute("UPDATE PLAYERS SET name = 'Untouched'")
+    conn.commit()
+    stats.updateFromPlayers(players[:2])
+
+    rows = dict(conn.execute("SELECT userid, name FROM PLAYERS").fetchall())
+    for player in players:
+        expected = player.card.getCardOwner() if player in players[:2] else "Untouched"
+        assert rows[player.userID] == expected
+
+def test_NewPeriodsStartFromZero(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    players = makePlayers(3)
+
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+    stats.updateFromPlayers(players)
+    lastWeek = stats.periods[PersistentStats.ITEM_WEEK]
+    assert conn.execute("SELECT COUNT(*) FROM PLAYERSTATS WHERE period = ?", (lastWeek,)).fetchone()[0] == len(players)
+
+    # A new week starts while the stats are loaded
+    getPeriodKey = PersistentStatsModule.GetPeriodKey
+    monkeypatch.setattr(PersistentStatsModule, "GetPeriodKey",
+                        lambda cType, date=None: "2999-W01" if cType == PersistentStats.ITEM_WEEK else getPeriodKey(cType, date))
+    stats.updateFromPlayers(players[:1])
+
+    for stat in (stats, PersistentStats(Const.TEST_GUILD_ID)):
+        games = {pd.playerID: pd.stats for pd in stat.allPlayers}
+        assert games[players[0].userID][PersistentStats.ITEM_WEEK][PersistentStats.DATA_ITEM_GAMES] == 1
+        assert games[players[0].userID][PersistentStats.ITEM_MONTH][PersistentStats.DATA_ITEM_GAMES] == 2
+        assert games[players[0].userID][PersistentStats.ITEM_TOTAL][PersistentStats.DATA_ITEM_GAMES] == 2
+        assert games[players[1].userID][PersistentStats.ITEM_WEEK][PersistentStats.DATA_ITEM_GAMES] == 0
+        assert [pd.playerID for pd in stat.getTopPlayers(1, PersistentStats.ITEM_WEEK)] == [players[0].userID]
+
+    # The last week's leaderboard can still be looked up
+    leaders = stats.getPeriodLeaders(PersistentStats.ITEM_WEEK, lastWeek, 10)
+    assert [pd.playerID for pd in leaders] == [player.userID for player in players]
+    assert all(pd.stats[PersistentStats.ITEM_WEEK][PersistentStats.DATA_ITEM_GAMES] == 1 for pd in leaders)
+
+def test_PeriodKeysIncludeTheYear():
+    assert PersistentStatsModule.GetPeriodKey(PersistentStats.ITEM_MONTH, datetime.date(2025, 1, 3)) == "2025-01"
+    assert PersistentStatsModule.GetPeriodKey(PersistentStats.ITEM_WEEK, datetime.date(2025, 1, 3)) == "2025-W01"
+    assert PersistentStatsModule.GetPeriodKey(PersistentStats.ITEM_WEEK, datetime.date(2026, 1, 3)) == "2026-W01"
+    assert PersistentStatsModule.GetPeriodKey(PersistentStats.ITEM_WEEK, datetime.date(2027, 1, 1)) == "2026-W53"
+
+def test_LeaderboardsFollowPointChanges(mock_Database):
+    players = makePlayers(30)
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+
+    for _ in range(10):
+        gamePlayers = random.sample(players, random.randint(1, len(players)))
+        for player in gamePlayers:
+            player.card.bingo = random.random() < 0.3
+            player.card.markedMask = random.getrandbits(player.card._cardSize * player.card._cardSize)
+        stats.updateFromPlayers(gamePlayers)
+
+    stats.removePlayer(players[0].userID)
+    reloaded = PersistentStats(Const.TEST_GUILD_ID)
+
+    # The incrementally kept leaderboards match a full sort, and a fresh load of the saved stats
+    for cType in PersistentStats.LIST_CATEGORY_ITEMS:
+        leaderboard = stats.getAllPlayers(cType)
+        assert len(leaderboard) == len(players) - 1
+        assert [p.points[cType] for p in leaderboard] == sorted((p.points[cType] for p in stats.allPlayers), reverse=True)
+        assert [p.playerID for p in leaderboard] == [p.playerID for p in reloaded.getAllPlayers(cType)]
+        assert [p.playerID for p in stats.getTopPlayers(3, cType)] == [p.playerID for p in leaderboard[:3]]
+
+        for place, playerOrd in enumerate(leaderboard, 1):
+            expected = place if playerOrd.points[cType] > 0 else 0
+            assert stats.getPlayer(playerOrd.playerID).ranks[cType] == expected
+            assert stats.getRank(playerOrd, cType) == expected
+
+def test_LeadersVersionOnlyChangesWithTheLeaders(mock_Database):
+    players = makePlayers(PersistentStats.NUM_SHOWN_LEADERS + 1)
+    for player in players:
+        player.card.markedMask = 0
+
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+    versions = {cType: stats.getLeadersVersion(cType) for cType in PersistentStats.LIST_CATEGORY_ITEMS}
+    stats.updateFromPlayers(players)
+    for cType in PersistentStats.LIST_CATEGORY_ITEMS:
+        assert stats.getLeadersVersion(cType) != versions[cType]
+
+    # Every player has the same points, so the last added player isn't shown on the leaderboards
+    version = stats.getLeadersVersion(PersistentStats.ITEM_TOTAL)
+    stats.removePlayer(players[-1].userID)
+    assert stats.getLeadersVersion(PersistentStats.ITEM_TOTAL) == version
+
+    # Reloading the same stats keeps the version
+    stats.refresh()
+    assert stats.getLeadersVersion(PersistentStats.ITEM_TOTAL) == version
+
+    stats.updateFromPlayers(players[-2:-1])
+    assert stats.getTopPlayer(1).playerID == players[-2].userID
+    assert stats.getLeadersVersion(PersistentStats.ITEM_TOTAL) != version
+
+    # The rendered leaderboards are cached per guild, so another stats instance never reuses a version
+    otherStats = PersistentStats(Const.TEST_GUILD_ID)
+    assert otherStats.getLeadersVersion(PersistentStats.ITEM_TOTAL) != stats.getLeadersVersion(PersistentStats.ITEM_TOTAL)
+
+def test_SnapshotsAreDetachedFromLaterUpdates(mock_Database):
+    players = makePlayers(2)
+    stats = PersistentStats(Const.TEST_GUILD_ID)
+    stats.updateFromPlayers(players)
+
+    leader = stats.getTopPlayer(1)
+    snapshot = leader.snapshot()
+    points = dict(leader.points)
+    total = dict(leader.stats[PersistentStats.ITEM_TOTAL])
+
+    # Later games update the live player, the snapshot handed to the render workers keeps its values
+    stats.updateFromPlayers(players)
+    assert leader.points != points
+    assert snapshot.points == points
+    assert snapshot.stats[PersistentStats.ITEM_TOTAL] == total
+    assert snapshot.name == leader.name
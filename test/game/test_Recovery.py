@@ -10,6 +10,7 @@ import json
 import pytest
 import random
 import sqlite3
+import struct
 import time
 
 import test.utils.Const as Const
@@ -19,9 +20,12 @@ import game.Recovery as RecoveryModule
 from game.Bing import Bing
 from game.Binglets import Binglets
 from game.CallRequest import CallRequest
+from game.EventLogRecovery import EventLogRecovery
 from game.Game import Game, GameState
+from game.GameDB import GameDB
 from game.Player import Player
 from game.Recovery import Recovery
+from game.RecoveryWriter import RecoveryBatch, RecoveryWriter
 from game.Result import Result
 
 from unittest.mock import MagicMock
@@ -32,9 +36,8 @@ def mock_Database(monkeypatch):
     conn = sqlite3.connect(":memory:")
     conn.execute("PRAGMA foreign_keys = ON")
 
-    # Patch the DB connect to use our in-memory connection
-    monkeypatch.setattr(RecoveryModule.sqlite3, "connect", lambda *args, **kwargs: conn)
-    monkeypatch.setattr(RecoveryModule.Recovery, "_Recovery__closeDB", lambda self, conn: None)
+    # Patch the shared DB connection to use our in-memory connection
+    monkeypatch.setattr(GameDB, "_GameDB__conn", conn)
 
     # These tables are defined in the InitDB.sh script for the production
     cur = conn.cursor()
@@ -44,6 +47,8 @@ def mock_Database(monkeypatch):
             gamestate TEXT NOT NULL,
             gametype TEXT NOT NULL,
             timestarted INTEGER DEFAULT 0,
+            cardseed INTEGER NOT NULL DEFAULT 0,
+            numcardsdealt INTEGER NOT NULL DEFAULT 0,
             calledbings TEXT NOT NULL DEFAULT '[]',
             kickedplayers TEXT NOT NULL DEFAULT '[]',
             playerbingos TEXT NOT NULL DEFAULT '[]',
@@ -59,6 +64,7 @@ def mock_Database(monkeypatch):
             rejectedreqs INTEGER DEFAULT 0,
             rejectedtime REAL NOT NULL DEFAULT 0.0,
             hasbingo INTEGER NOT NULL,
+            card BLOB,
             FOREIGN KEY (id) REFERENCES RECOVER(guildid)
             ON DELETE CASCADE
         )
@@ -83,6 +89,21 @@ def mock_Database(monkeypatch):
             ON DELETE CASCADE
         )
     """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS RECEVENTS (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            guildid INTEGER NOT NULL,
+            event TEXT NOT NULL,
+            data TEXT NOT NULL
+        )
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS RECSNAPSHOT (
+            guildid INTEGER PRIMARY KEY,
+            data TEXT NOT NULL,
+            timesaved INTEGER NOT NULL
+        )
+    """)
     conn.commit()
 
     yield conn
@@ -109,6 +130,146 @@ def test_GameStateIsSuccessfullyPersisted(mock_Database, monkeypatch):
 
     checkDB(conn, game)
 
+def test_WriteBehindRecoveryIsCommittedOnFlush(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+    Utils.overrideConfig(monkeypatch, "RecoveryWriteInterval", 3600)
+
+    game: Game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    populateGame(game)
+
+    # Updates are only queued until the writer flushes them
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    assert recovery.writer is not None
+    recovery.updateRecovery(game)
+    recovery.updateRecovery(game)
+    assert conn.execute("SELECT COUNT(*) FROM RECOVER").fetchone()[0] == 0
+
+    recovery.flush()
+    checkDB(conn, game)
+
+    # Stopping the game forces a flush
+    game.setRecovery(recovery)
+    game.stopGame()
+    assert int(conn.execute("SELECT gamestate FROM RECOVER").fetchone()[0]) == GameState.STOPPED.value
+
+@pytest.mark.parametrize("recoveryType", [Recovery, EventLogRecovery])
+def test_FailedWriteBehindUpdatesAreRewritten(mock_Database, monkeypatch, recoveryType):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+    Utils.overrideConfig(monkeypatch, "RecoveryWriteInterval", 3600)
+
+    game: Game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    populateGame(game)
+
+    game.addPlayer("KickedPlayer", Const.TEST_MOCK_VALID_USER_ID + 101)
+
+    recovery = recoveryType(Const.TEST_GUILD_ID)
+    recovery.updateRecovery(game)
+    recovery.flush()
+
+    # The next write fails, and its updates are dropped
+    game.addPlayer("LatePlayer", Const.TEST_MOCK_VALID_USER_ID + 100)
+    game.kickPlayer(Const.TEST_MOCK_VALID_USER_ID + 101)
+    recovery.updateRecovery(game)
+    transaction = GameDB.transaction
+    def failingTransaction(self):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(GameDB, "transaction", failingTransaction)
+    recovery.flush()
+    monkeypatch.setattr(GameDB, "transaction", transaction)
+    assert recovery.needsRewrite
+
+    # An update without any game changes still writes the game again
+    recovery.updateRecovery(game)
+    recovery.flush()
+    assert not recovery.needsRewrite
+    recovered = recoveryType(Const.TEST_GUILD_ID).recoverGame(MagicMock())
+    assert recovered is not None
+    checkRecoveredGame(game, recovered)
+
+def test_WriterShutdownCommitsQueuedUpdates(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+    Utils.overrideConfig(monkeypatch, "RecoveryWriteInterval", 3600)
+
+    game: Game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    populateGame(game)
+
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    writer = recovery.writer
+    assert writer is not None
+    recovery.updateRecovery(game)
+
+    RecoveryWriter.shutdown()
+    assert not writer.thread.is_alive()
+    checkDB(conn, game)
+
+def test_WriteBehindUpdatesAreCoalescedPerRow(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+    Utils.overrideConfig(monkeypatch, "RecoveryWriteInterval", 3600)
+
+    game: Game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    populateGame(game)
+
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    recovery.updateRecovery(game)
+    recovery.flush()
+
+    # Every update within the write interval changes the game row, and the players marks
+    for i in range(5):
+        game.timeStarted -= 1
+        for player in game.players:
+            bing = player.card.getCardBings()[0][i]
+            if bing.marked:
+                player.card.unmarkCell(bing)
+            else:
+                player.card.markCell(bing)
+        recovery.updateRecovery(game)
+
+    statements: List[str] = []
+    conn.set_trace_callback(statements.append)
+    recovery.flush()
+    conn.set_trace_callback(None)
+
+    # Only the last queued write of every row is committed
+    assert len([sql for sql in statements if "INSERT INTO RECOVER" in sql]) == 1
+    assert len([sql for sql in statements if "INSERT INTO RECPLAYERS" in sql]) <= len(game.players)
+    checkDB(conn, game)
+
+def test_CoalescedWritesKeepTheirOrder():
+    upsert = "INSERT INTO T (id, val) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET val=excluded.val"
+    delete = "DELETE FROM T WHERE id = ?"
+    clear = "DELETE FROM T"
+
+    first = RecoveryBatch()
+    first.executemany(upsert, [(1, "a"), (2, "a")], keys=[1, 2])
+    second = RecoveryBatch()
+    second.executemany(upsert, [(2, "b"), (3, "b")], keys=[2, 3])
+    second.execute(delete, (1,), key=1)
+    third = RecoveryBatch()
+    third.execute(upsert, (1, "c"), key=1)
+    third.execute(clear)
+    third.execute(upsert, (2, "d"), key=2)
+
+    # Rows keep their first position, and a row deleted then written again or an unkeyed statement splits the writes
+    assert RecoveryWriter._coalesce([first, second, third]) == [
+        (upsert, [(1, "a"), (2, "b"), (3, "b")]),
+        (delete, [(1,)]),
+        (upsert, [(1, "c")]),
+        (clear, [()]),
+        (upsert, [(2, "d")]),
+    ]
+
 def test_GameIsSuccessfullyRecovered(mock_Database, monkeypatch):
     Utils.disableBannedData(monkeypatch)
 
@@ -129,35 +290,164 @@ def test_GameIsSuccessfullyRecovered(mock_Database, monkeypatch):
     game: Optional[Game] = recovery.recoverGame(MagicMock())
     assert game is not None
 
-    # Check the game state
-    assert referenceGame.state == game.state
-    assert referenceGame.gameType == game.gameType
-    assert referenceGame.players == game.players
-    assert referenceGame.timeStarted == game.timeStarted
-    assert referenceGame.calledBings == game.calledBings
-    assert referenceGame.kickedPlayers == game.kickedPlayers
-    assert referenceGame.playerBingos == game.playerBingos
-    assert len(referenceGame.requestedCalls) == len(game.requestedCalls)
-    game.requestedCalls = sorted(game.requestedCalls, key=lambda req: req.requestBing.bingIdx)
-    for i, refReq in enumerate(sorted(referenceGame.requestedCalls, key=lambda req: req.requestBing.bingIdx)):
-        req = game.requestedCalls[i]
-        assert refReq == req, f"Call Request doesn't match the reference:" \
-                            + f"\n\tReference: ID({refReq.requestBing.bingIdx} Players {[p.userID for p in list(refReq.players)]})" \
-                            + f"\n\tRecovered: ID({req.requestBing.bingIdx} Players {[p.userID for p in list(req.players)]})"
+    checkRecoveredGame(referenceGame, game)
 
-    # Check the players
-    for refPlayer in referenceGame.players:
-        refCells = refPlayer.card.getCardBings()
-        player = next((pl for pl in game.players if pl == refPlayer))
-        assert player is not None
-        cells = player.card.getCardBings()
+def test_EventLogRecoveryReplaysEventsOverSnapshot(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
 
-        for x, cellX in enumerate(refCells):
-            for y, cellY in enumerate(cellX):
-                assert cellY.bingIdx == cells[x][y].bingIdx
-                assert cellY.x == cells[x][y].x
-                assert cellY.y == cells[x][y].y
-                assert cellY.marked == cells[x][y].marked
+    referenceGame: Game = Game(Const.TEST_GAME_TYPE)
+    referenceGame.initGame(MagicMock())
+    referenceGame.startGame()
+
+    # The first update writes the snapshot, the following ones are only logged as events
+    recovery = EventLogRecovery(Const.TEST_GUILD_ID)
+    referenceGame.setRecovery(recovery)
+    recovery.updateRecovery(referenceGame)
+    populateGame(referenceGame)
+    if referenceGame.requestedCalls:
+        assert referenceGame.deleteRequest(next(iter(referenceGame.requestedCalls)), False).result
+    leaving: Player = referenceGame.addPlayer("LeavingPlayer", Const.TEST_MOCK_VALID_USER_ID + 100).additional
+    assert referenceGame.kickPlayer(leaving.userID).result
+    recovery.updateRecovery(referenceGame)
+
+    assert conn.execute("SELECT COUNT(*) FROM RECSNAPSHOT").fetchone()[0] == 1
+    events = {row[0] for row in conn.execute("SELECT event FROM RECEVENTS").fetchall()}
+    assert {"join", "call", "leave", "state"} <= events
+
+    # Recover the game from the snapshot and the event log
+    assert recovery.hasRecovery()
+    game: Optional[Game] = EventLogRecovery(Const.TEST_GUILD_ID).recoverGame(MagicMock())
+    assert game is not None
+    checkRecoveredGame(referenceGame, game)
+
+    recovery.removeRecovery()
+    assert not recovery.hasRecovery()
+    assert conn.execute("SELECT COUNT(*) FROM RECEVENTS").fetchone()[0] == 0
+
+def test_ReplayedMarksCountTowardsLaterBingos(mock_Database, monkeypatch):
+    Utils.disableBannedData(monkeypatch)
+
+    referenceGame: Game = Game(Const.TEST_GAME_TYPE)
+    referenceGame.initGame(MagicMock())
+    referenceGame.startGame()
+    recovery = EventLogRecovery(Const.TEST_GUILD_ID)
+    referenceGame.setRecovery(recovery)
+    player: Player = referenceGame.addPlayer("TestPlayer", Const.TEST_MOCK_VALID_USER_ID + 1).additional
+    recovery.updateRecovery(referenceGame)
+
+    # Every cell but the last of the first row is only in the event log tail
+    row = [bing.bingIdx for bing in player.card.getCardBings()[0]]
+    for idx in row[:-1]:
+        assert referenceGame.makeCall(idx).result
+
+    game: Optional[Game] = EventLogRecovery(Const.TEST_GUILD_ID).recoverGame(MagicMock())
+    assert game is not None
+    result: Result = game.makeCall(row[-1])
+    assert [p.userID for p in result.additional[1]] == [player.userID]
+
+def test_EventLogIsCompactedIntoSnapshots(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+    Utils.overrideConfig(monkeypatch, "RecoverySnapshotInterval", 5)
+
+    referenceGame: Game = Game(Const.TEST_GAME_TYPE)
+    referenceGame.initGame(MagicMock())
+    referenceGame.startGame()
+
+    recovery = EventLogRecovery(Const.TEST_GUILD_ID)
+    referenceGame.setRecovery(recovery)
+    for i in range(10):
+        assert referenceGame.addPlayer(f"TestPlayer{i+1}", Const.TEST_MOCK_VALID_USER_ID + i + 1).result
+        assert conn.execute("SELECT COUNT(*) FROM RECEVENTS").fetchone()[0] <= 5
+    for i in range(1, 30):
+        assert referenceGame.makeCall(i).result
+        assert conn.execute("SELECT COUNT(*) FROM RECEVENTS").fetchone()[0] <= 5
+
+    game: Optional[Game] = EventLogRecovery(Const.TEST_GUILD_ID).recoverGame(MagicMock())
+    assert game is not None
+    checkRecoveredGame(referenceGame, game)
+
+def test_RecoveryLoadsAllPlayersWithConstantQueries(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+
+    referenceGame: Game = Game(Const.TEST_GAME_TYPE)
+    referenceGame.initGame(MagicMock())
+    referenceGame.startGame()
+    for i in range(50):
+        assert referenceGame.addPlayer(f"TestPlayer{i+1}", Const.TEST_MOCK_VALID_USER_ID + i + 1).result
+    for i in range(1, 20):
+        assert referenceGame.makeCall(i).result
+
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    recovery.updateRecovery(referenceGame)
+
+    # The players and their cards are loaded in the same number of queries, regardless of the player count
+    queries: List[str] = []
+    conn.set_trace_callback(lambda sql: queries.append(sql) if sql.lstrip().upper().startswith("SELECT") else None)
+    game: Optional[Game] = Recovery(Const.TEST_GUILD_ID).recoverGame(MagicMock())
+    conn.set_trace_callback(None)
+
+    assert game is not None
+    assert len(queries) == 3
+    checkRecoveredGame(referenceGame, game)
+    for player in game.players:
+        assert not player.getIsDirty() and not player.card.getIsDirty()
+
+def test_LegacyCardCellsAreMigratedToCardBlobs(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+
+    referenceGame: Game = Game(Const.TEST_GAME_TYPE)
+    referenceGame.initGame(MagicMock())
+    referenceGame.startGame()
+    populateGame(referenceGame)
+
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    recovery.updateRecovery(referenceGame)
+
+    # Rewrite the saved cards the way they used to be saved, as one row per card cell
+    conn.execute("UPDATE RECPLAYERS SET card = NULL")
+    conn.executemany("INSERT INTO RECPLAYERCELLS VALUES (?, ?, ?, ?, ?)",
+                     [(player.userID, str(player.userID * 1000 + bing.bingIdx), bing.x, bing.y, int(bing.marked))
+                      for player in referenceGame.players for row in player.card.getCardBings() for bing in row])
+    conn.commit()
+
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    game: Optional[Game] = recovery.recoverGame(MagicMock())
+    assert game is not None
+    checkRecoveredGame(referenceGame, game)
+
+    # The next update saves the migrated cards as blobs and drops the legacy cells
+    recovery.updateRecovery(game)
+    checkDB(conn, game)
+    assert conn.execute("SELECT COUNT(*) FROM RECPLAYERCELLS").fetchone()[0] == 0
+
+def test_PlayersWithInvalidCardsAreSkipped(mock_Database, monkeypatch):
+    conn: sqlite3.Connection = mock_Database
+    Utils.disableBannedData(monkeypatch)
+
+    game: Game = Game(Const.TEST_GAME_TYPE)
+    game.initGame(MagicMock())
+    game.startGame()
+    validPlayer: Player = game.addPlayer("ValidPlayer", Const.TEST_MOCK_VALID_USER_ID + 1).additional
+    invalidPlayer: Player = game.addPlayer("InvalidPlayer", Const.TEST_MOCK_VALID_USER_ID + 2).additional
+
+    # A cell that isn't a bing of the game type can't be packed or recovered
+    cells = invalidPlayer.card.getCardBings()
+    cells[0][0] = Bing("invalid", -1)
+    invalidPlayer.card.setCells(cells)
+
+    recovery = Recovery(Const.TEST_GUILD_ID)
+    recovery.updateRecovery(game)
+
+    rows = conn.execute("SELECT playerid FROM RECPLAYERS").fetchall()
+    assert rows == [(validPlayer.userID,)]
+
+    recovered: Optional[Game] = Recovery(Const.TEST_GUILD_ID).recoverGame(MagicMock())
+    assert recovered is not None
+    assert [p.userID for p in recovered.players] == [validPlayer.userID]
 
 def test_PlayerBingosAreRecovered(mock_Database, monkeypatch):
     Utils.disableBannedData(monkeypatch)
@@ -220,14 +510,16 @@ def test_ReveryDataIsPersistedOnlyWhenNeeded(mock_Database, monkeypatch):
     conn: sqlite3.Connection = mock_Database
     Utils.disableBannedData(monkeypatch)
 
-    # Boilerplates for checking num times __commitData is called
+    # Boilerplates for checking num rows written by __commitData, and the num times it is called
     assertNumCommitDataCalled = 0
     commitData = Recovery._Recovery__commitData # pyright: ignore
     numCalledCommitData = 0
-    def overrideCommitData(self, *args, **kwargs):
-        nonlocal numCalledCommitData
-        numCalledCommitData += 1
-        return commitData(self, *args, **kwargs)
+    numCommitStatements = 0
+    def overrideCommitData(self, cur, rows, *args, **kwargs):
+        nonlocal numCalledCommitData, numCommitStatements
+        numCalledCommitData += len(rows)
+        numCommitStatements += 1
+        return commitData(self, cur, rows, *args, **kwargs)
     monkeypatch.setattr(RecoveryModule.Recovery, "_Recovery__commitData", overrideCommitData)
 
     # Boilerplayes for checking num times __removeData is called
@@ -265,12 +557,15 @@ def test_ReveryDataIsPersistedOnlyWhenNeeded(mock_Database, monkeypatch):
         result: Result = game.addPlayer(name, userID)
         assert result.result
 
-    # Re-compute the number of times the commitData should be called
-    assertNumCommitDataCalled = len(game.players) * list(game.players)[0].card._cardSize * list(game.players)[0].card._cardSize + len(game.players) + assertNumCommitDataCalled
+    # Re-compute the number of rows that should be written, each player row holds its card
+    # and the game row holds the number of dealt cards
+    assertNumCommitDataCalled = len(game.players) + 1 + assertNumCommitDataCalled
 
-    # Recover the game again
+    # Recover the game again, all the new players are written in one statement
+    numCommitStatements = 0
     recovery.updateRecovery(game)
     assert numCalledCommitData == assertNumCommitDataCalled
+    assert numCommitStatements == 2
     assert numCalledRemoveData == assertNumRemoveDataCalled
 
     # Recover the game again
@@ -307,6 +602,23 @@ def test_ReveryDataIsPersistedOnlyWhenNeeded(mock_Database, monkeypatch):
     assert numCalledCommitData == assertNumCommitDataCalled
     assert numCalledRemoveData == assertNumRemoveDataCalled
 
+    # Another player joining an existing request updates it
+    otherPlayer: Player = game.addPlayer("MergePlayer", Const.TEST_MOCK_VALID_USER_ID + 100).additional
+    recovery.updateRecovery(game)
+    assertNumCommitDataCalled += 2
+    assert numCalledCommitData == assertNumCommitDataCalled
+    mergedBing = binglets.getBingFromIndex(player.card.getCardBings()[0][1].bingIdx)
+    mergedRequest = CallRequest(otherPlayer, mergedBing)
+    mergedRequest.addPlayer(player)
+    result: Result = game.requestCall(mergedRequest)
+    assert result.result
+    recovery.updateRecovery(game)
+    assertNumCommitDataCalled += 1
+    assert numCalledCommitData == assertNumCommitDataCalled
+    assert numCalledRemoveData == assertNumRemoveDataCalled
+    assert json.loads(conn.execute("SELECT playerids FROM RECREQUESTS WHERE bingid = ?", (mergedBing.bingIdx,)).fetchone()[0]) \
+        == [p.userID for p in game.requestedCalls[mergedBing.bingIdx].players]
+
     # Remove a call request
     result: Result = game.deleteRequest(bing.bingIdx)
     assert result.result
@@ -368,6 +680,39 @@ def populateGame(game: Game):
         result: Result = game.requestCall(callReq)
         assert result.result
 
+def checkRecoveredGame(referenceGame: Game, game: Game):
+    # Check the game state
+    assert referenceGame.state == game.state
+    assert referenceGame.gameType == game.gameType
+    assert referenceGame.players == game.players
+    assert referenceGame.timeStarted == game.timeStarted
+    assert referenceGame.cardSeed == game.cardSeed
+    assert referenceGame.numCardsDealt == game.numCardsDealt
+    assert referenceGame.calledBings == game.calledBings
+    assert referenceGame.kickedPlayers == game.kickedPlayers
+    assert referenceGame.playerBingos == game.playerBingos
+    assert len(referenceGame.requestedCalls) == len(game.requestedCalls)
+    requests = sorted(game.requestedCalls.values(), key=lambda req: req.requestBing.bingIdx)
+    for i, refReq in enumerate(sorted(referenceGame.requestedCalls.values(), key=lambda req: req.requestBing.bingIdx)):
+        req = requests[i]
+        assert refReq == req, f"Call Request doesn't match the reference:" \
+                            + f"\n\tReference: ID({refReq.requestBing.bingIdx} Players {[p.userID for p in list(refReq.players)]})" \
+                            + f"\n\tRecovered: ID({req.requestBing.bingIdx} Players {[p.userID for p in list(req.players)]})"
+
+    # Check the players
+    for refPlayer in referenceGame.players:
+        refCells = refPlayer.card.getCardBings()
+        player = next((pl for pl in game.players if pl == refPlayer))
+        assert player is not None
+        cells = player.card.getCardBings()
+
+        for x, cellX in enumerate(refCells):
+            for y, cellY in enumerate(cellX):
+                assert cellY.bingIdx == cells[x][y].bingIdx
+                assert cellY.x == cells[x][y].x
+                assert cellY.y == cells[x][y].y
+                assert cellY.marked == cells[x][y].marked
+
 def checkDB(conn: sqlite3.Connection, game: Game):
     # Verify the RECOVER table
     rows = conn.execute(f"SELECT * from RECOVER")
@@ -379,10 +724,12 @@ def checkDB(conn: sqlite3.Connection, game: Game):
     assert int(results[1]) == GameState.STARTED.value
     assert results[2] == Const.TEST_GAME_TYPE
     assert results[3] < time.time()
-    assert results[4] == json.dumps([b.bingIdx for b in game.calledBings])
-    assert results[5] == json.dumps(list(game.kickedPlayers))
-    assert results[6] == json.dumps(list(game.playerBingos))
-    assert results[7] < time.time()
+    assert results[4] == game.cardSeed
+    assert results[5] == game.numCardsDealt
+    assert results[6] == json.dumps([b.bingIdx for b in game.calledBings])
+    assert results[7] == json.dumps(list(game.kickedPlayers))
+    assert results[8] == json.dumps(list(game.playerBingos))
+    assert results[9] < time.time()
 
     # Verify the RECPLAYERS table
     rows = conn.execute(f"SELECT * from RECPLAYERS")
@@ -402,21 +749,17 @@ def checkDB(conn: sqlite3.Connection, game: Game):
         assert res[5] == player.rejectedTimestamp
         assert res[6] == int(player.card.hasBingo())
 
-        # Verify the players card "RECPLAYERCELLS"
-        rows = conn.execute(f"SELECT * FROM RECPLAYERCELLS WHERE id = {player.userID}")
-        assert rows is not None
-        cardResults = rows.fetchall()
-        assert len(cardResults) == player.card._cardSize * player.card._cardSize
-        playerCells = player.card.getCardBings()
-        for cell in cardResults:
-            assert cell[0] == player.userID
-            assert cell[2] < player.card._cardSize
-            assert cell[3] < player.card._cardSize
-
-            referenceBing: Bing = playerCells[cell[2]][cell[3]]
-            assert cell[2] == referenceBing.x
-            assert cell[3] == referenceBing.y
-            assert cell[4] == int(referenceBing.marked)
+        # Verify the players card blob
+        cardSize = player.card._cardSize
+        numCells = cardSize * cardSize
+        assert len(res[7]) == 2 + 2 * numCells + (numCells + 7) // 8
+        assert struct.unpack_from("<BB", res[7]) == (1, cardSize)
+        bingIDs = struct.unpack_from(f"<{numCells}H", res[7], 2)
+        markedMask = int.from_bytes(res[7][2 + 2 * numCells:], "little")
+        for referenceBing in (bing for row in player.card.getCardBings() for bing in row):
+            cell = referenceBing.x * cardSize + referenceBing.y
+            assert bingIDs[cell] == referenceBing.bingIdx
+            assert bool(markedMask >> cell & 1) == referenceBing.marked
 
     # Verify the call requests "RECREQUESTS"
     rows = conn.execute(f"SELECT * FROM RECREQUESTS")
@@ -425,7 +768,7 @@ def checkDB(conn: sqlite3.Connection, game: Game):
     for res in results:
         assert res[1] >= 0
         req = None
-        for r in game.requestedCalls:
+        for r in game.requestedCalls.values():
             if r.requestBing.bingIdx == res[1]:
                 req = r
                 break
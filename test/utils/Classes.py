@@ -30,8 +30,8 @@ from game.Player import Player
 from typing import List, Optional
 
 class TestingAdminChannel(AdminChannel):
-    def __init__(self, gameGuild: GameGuild, gameType: str):
-        super().__init__(gameGuild, gameType)
+    def __init__(self, gameGuild: GameGuild, gameType: str, gameMasterRole: Optional[discord.Role] = None):
+        super().__init__(gameGuild, gameType, gameMasterRole)
         self.resetTracking()
 
     def resetTracking(self):
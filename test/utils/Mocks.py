@@ -16,6 +16,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 def makeMockBot():
     mockBot = MagicMock()
+    mockBot.fetch_guild = AsyncMock(return_value=None)
 
     def ignoreExceptions(loop, context):
         pass
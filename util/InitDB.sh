@@ -1,19 +1,33 @@
 #!/usr/bin/bash
 
-DB_FILE="../resources/data/data.sqlite"
+DB_FILE="${DB_FILE:-../resources/data/data.sqlite}"
 TABLE_PLAYERS="PLAYERS"
+TABLE_PLAYER_STATS="PLAYERSTATS"
 TABLE_BANNED="BANNED"
 TABLE_RECOVERY="RECOVER"
 TABLE_RECOVER_PLAYERS="RECPLAYERS"
 TABLE_RECOVER_PLAYER_CELLS="RECPLAYERCELLS"
 TABLE_RECOVER_REQUESTS="RECREQUESTS"
+TABLE_RECOVER_EVENTS="RECEVENTS"
+TABLE_RECOVER_SNAPSHOT="RECSNAPSHOT"
+
+# When the DB was last written, before this script changes it. Writes land in the WAL file until it is checkpointed
+DB_LAST_WRITE="$DB_FILE"
+if [ -f "$DB_FILE-wal" ] && [ "$DB_FILE-wal" -nt "$DB_FILE" ]; then
+    DB_LAST_WRITE="$DB_FILE-wal"
+fi
+DB_WRITE_MONTH=$(date -r "$DB_LAST_WRITE" +%Y-%m 2>/dev/null)
+DB_WRITE_WEEK=$(date -r "$DB_LAST_WRITE" +%G-W%V 2>/dev/null)
 
 TABLE_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_PLAYERS';")
+TABLE_PLAYER_STATS_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_PLAYER_STATS';")
 TABLE_BANNED_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_BANNED';")
 TABLE_RECOVER_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_RECOVERY';")
 TABLE_RECOVER_PLAYERS_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_RECOVER_PLAYERS';")
 TABLE_RECOVER_PLAYERS_CELLS_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_RECOVER_PLAYER_CELLS';")
 TABLE_RECOVER_REQUESTS_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_RECOVER_REQUESTS';")
+TABLE_RECOVER_EVENTS_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_RECOVER_EVENTS';")
+TABLE_RECOVER_SNAPSHOT_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='$TABLE_RECOVER_SNAPSHOT';")
 
 if [ "$TABLE_EXISTS" = "$TABLE_PLAYERS" ]; then
     echo "Table $TABLE_PLAYERS already exists, skipping."
@@ -41,6 +55,63 @@ EOF
     echo "Table $TABLE_PLAYERS created."
 fi
 
+# Players are unique per guild. Any duplicate rows are merged into the latest one before indexing, the period
+# counters are only merged from the duplicates of the same month or week
+PLAYERS_INDEX_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM sqlite_master WHERE name='${TABLE_PLAYERS}_GUILD_USER';")
+if [ -z "$PLAYERS_INDEX_EXISTS" ]; then
+    echo "Creating $TABLE_PLAYERS guild index..."
+    sqlite3 "$DB_FILE" << EOF
+BEGIN;
+UPDATE $TABLE_PLAYERS SET
+    bingos = (SELECT SUM(d.bingos) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid),
+    calls = (SELECT SUM(d.calls) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid),
+    games = (SELECT SUM(d.games) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid),
+    bingosmonth = (SELECT SUM(d.bingosmonth) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid
+        AND d.timestampmonth = $TABLE_PLAYERS.timestampmonth),
+    callsmonth = (SELECT SUM(d.callsmonth) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid
+        AND d.timestampmonth = $TABLE_PLAYERS.timestampmonth),
+    gamesmonth = (SELECT SUM(d.gamesmonth) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid
+        AND d.timestampmonth = $TABLE_PLAYERS.timestampmonth),
+    bingosweek = (SELECT SUM(d.bingosweek) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid
+        AND d.timestampweek = $TABLE_PLAYERS.timestampweek),
+    callsweek = (SELECT SUM(d.callsweek) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid
+        AND d.timestampweek = $TABLE_PLAYERS.timestampweek),
+    gamesweek = (SELECT SUM(d.gamesweek) FROM $TABLE_PLAYERS AS d WHERE d.guildid = $TABLE_PLAYERS.guildid AND d.userid = $TABLE_PLAYERS.userid
+        AND d.timestampweek = $TABLE_PLAYERS.timestampweek)
+WHERE id IN (SELECT MAX(id) FROM $TABLE_PLAYERS GROUP BY guildid, userid HAVING COUNT(*) > 1);
+DELETE FROM $TABLE_PLAYERS WHERE id NOT IN (SELECT MAX(id) FROM $TABLE_PLAYERS GROUP BY guildid, userid);
+CREATE UNIQUE INDEX IF NOT EXISTS ${TABLE_PLAYERS}_GUILD_USER ON $TABLE_PLAYERS (guildid, userid);
+COMMIT;
+EOF
+fi
+
+# Monthly and weekly player stats, one bucket per player and period (YYYY-MM months and YYYY-Www ISO weeks).
+# The current month and week stats are carried over from the old period columns of the players table. Those only
+# keep the month and week numbers, so they are only carried over when the DB was last written in the current period
+# (otherwise the stats could be from the same month or week of an earlier year)
+if [ "$TABLE_PLAYER_STATS_EXISTS" = "$TABLE_PLAYER_STATS" ]; then
+    echo "Table $TABLE_PLAYER_STATS already exists, skipping."
+else
+    echo "Creating $TABLE_PLAYER_STATS table..."
+    sqlite3 "$DB_FILE" << EOF
+CREATE TABLE IF NOT EXISTS $TABLE_PLAYER_STATS (
+    guildid INTEGER NOT NULL,
+    userid INTEGER NOT NULL,
+    period TEXT NOT NULL,
+    bingos INTEGER DEFAULT 0,
+    calls INTEGER DEFAULT 0,
+    games INTEGER DEFAULT 0,
+    PRIMARY KEY (guildid, period, userid)
+);
+INSERT OR IGNORE INTO $TABLE_PLAYER_STATS (guildid, userid, period, bingos, calls, games)
+    SELECT guildid, userid, '$(date +%Y-%m)', bingosmonth, callsmonth, gamesmonth FROM $TABLE_PLAYERS
+    WHERE timestampmonth = $(date +%-m) AND '$DB_WRITE_MONTH' = '$(date +%Y-%m)';
+INSERT OR IGNORE INTO $TABLE_PLAYER_STATS (guildid, userid, period, bingos, calls, games)
+    SELECT guildid, userid, '$(date +%G-W%V)', bingosweek, callsweek, gamesweek FROM $TABLE_PLAYERS
+    WHERE timestampweek = $(date +%-V) AND '$DB_WRITE_WEEK' = '$(date +%G-W%V)';
+EOF
+fi
+
 if [ "$TABLE_BANNED_EXISTS" = "$TABLE_BANNED" ]; then
     echo "Table $TABLE_BANNED already exists, skipping."
 else
@@ -58,6 +129,15 @@ fi
 
 if [ "$TABLE_RECOVER_EXISTS" = "$TABLE_RECOVERY" ]; then
     echo "Table $TABLE_RECOVERY already exists, skipping."
+
+    # Add the card dealing columns, so a recovered game keeps dealing the same cards
+    for COLUMN in cardseed numcardsdealt; do
+        COLUMN_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM pragma_table_info('$TABLE_RECOVERY') WHERE name='$COLUMN';")
+        if [ -z "$COLUMN_EXISTS" ]; then
+            echo "Adding $COLUMN column to $TABLE_RECOVERY..."
+            sqlite3 "$DB_FILE" "ALTER TABLE $TABLE_RECOVERY ADD COLUMN $COLUMN INTEGER NOT NULL DEFAULT 0;"
+        fi
+    done
 else
     echo "Creating $TABLE_RECOVERY table..."
     sqlite3 "$DB_FILE" << EOF
@@ -66,6 +146,8 @@ CREATE TABLE IF NOT EXISTS $TABLE_RECOVERY (
     gamestate TEXT NOT NULL,
     gametype TEXT NOT NULL,
     timestarted INTEGER DEFAULT 0,
+    cardseed INTEGER NOT NULL DEFAULT 0,
+    numcardsdealt INTEGER NOT NULL DEFAULT 0,
     calledbings TEXT NOT NULL DEFAULT '[]',
     kickedplayers TEXT NOT NULL DEFAULT '[]',
     playerbingos TEXT NOT NULL DEFAULT '[]',
@@ -76,6 +158,13 @@ fi
 
 if [ "$TABLE_RECOVER_PLAYERS_EXISTS" = "$TABLE_RECOVER_PLAYERS" ]; then
     echo "Table $TABLE_RECOVER_PLAYERS already exists, skipping."
+
+    # Migrate the player cards from the per cell rows to a card blob
+    CARD_COLUMN_EXISTS=$(sqlite3 "$DB_FILE" "SELECT name FROM pragma_table_info('$TABLE_RECOVER_PLAYERS') WHERE name='card';")
+    if [ -z "$CARD_COLUMN_EXISTS" ]; then
+        echo "Adding card column to $TABLE_RECOVER_PLAYERS..."
+        sqlite3 "$DB_FILE" "ALTER TABLE $TABLE_RECOVER_PLAYERS ADD COLUMN card BLOB;"
+    fi
 else
     echo "Creating $TABLE_RECOVER_PLAYERS table..."
     sqlite3 "$DB_FILE" << EOF
@@ -87,6 +176,7 @@ CREATE TABLE IF NOT EXISTS $TABLE_RECOVER_PLAYERS (
     rejectedreqs INTEGER DEFAULT 0,
     rejectedtime REAL NOT NULL DEFAULT 0.0,
     hasbingo INTEGER NOT NULL,
+    card BLOB,
     FOREIGN KEY (id) REFERENCES $TABLE_RECOVERY(guildid)
     ON DELETE CASCADE
 );
@@ -125,3 +215,30 @@ CREATE TABLE IF NOT EXISTS $TABLE_RECOVER_REQUESTS (
 EOF
 fi
 
+if [ "$TABLE_RECOVER_EVENTS_EXISTS" = "$TABLE_RECOVER_EVENTS" ]; then
+    echo "Table $TABLE_RECOVER_EVENTS already exists, skipping."
+else
+    echo "Creating $TABLE_RECOVER_EVENTS table..."
+    sqlite3 "$DB_FILE" << EOF
+CREATE TABLE IF NOT EXISTS $TABLE_RECOVER_EVENTS (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    guildid INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ${TABLE_RECOVER_EVENTS}_GUILD ON $TABLE_RECOVER_EVENTS (guildid, seq);
+EOF
+fi
+
+if [ "$TABLE_RECOVER_SNAPSHOT_EXISTS" = "$TABLE_RECOVER_SNAPSHOT" ]; then
+    echo "Table $TABLE_RECOVER_SNAPSHOT already exists, skipping."
+else
+    echo "Creating $TABLE_RECOVER_SNAPSHOT table..."
+    sqlite3 "$DB_FILE" << EOF
+CREATE TABLE IF NOT EXISTS $TABLE_RECOVER_SNAPSHOT (
+    guildid INTEGER PRIMARY KEY,
+    data TEXT NOT NULL,
+    timesaved INTEGER NOT NULL
+);
+EOF
+fi